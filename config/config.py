@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional, List
 
 class Settings(BaseSettings):
     # Browser settings
@@ -10,13 +10,101 @@ class Settings(BaseSettings):
     IMPLICIT_WAIT: int = 10
     PAGE_LOAD_TIMEOUT: int = 30
     SCRIPT_TIMEOUT: int = 30
+
+    # Browser performance metrics collected on every BasePage.open();
+    # budget violations are logged ("warn"), fail the test ("fail") or are ignored ("off")
+    PAGE_METRICS_ENABLED: bool = True
+    PAGE_BUDGET_MODE: str = "warn"
+    PAGE_BUDGETS: Dict[str, float] = {"load": 10000, "lcp": 4000, "cls": 0.25, "tbt": 600}
+    PAGE_METRICS_REPORT_PATH: str = "page-metrics-report.json"
+
+    # Third-party request blocking (CDP Network.setBlockedURLs wildcard patterns);
+    # patterns matching an allowed domain are never applied
+    NETWORK_BLOCKING_ENABLED: bool = True
+    NETWORK_BLOCKED_URLS: List[str] = [
+        "*googlesyndication.com*",
+        "*doubleclick.net*",
+        "*googletagmanager.com*",
+        "*googletagservices.com*",
+        "*google-analytics.com*",
+        "*adservice.google.*",
+        "*fundingchoicesmessages.google.com*",
+        "*amazon-adsystem.com*",
+        "*adsrvr.org*",
+        "*criteo.com*",
+        "*taboola.com*",
+        "*outbrain.com*"
+    ]
+    NETWORK_ALLOWED_DOMAINS: List[str] = ["automationexercise.com", "fonts.googleapis.com", "fonts.gstatic.com"]
+    # Per-page request counts from the performance log, and sizes of blocked URLs learned with blocking off
+    NETWORK_STATS_ENABLED: bool = True
+    NETWORK_BLOCKED_SIZES_PATH: str = ".blocked-sizes.json"
+
+    # Driver pool
+    DRIVER_POOL_SIZE: int = 1
+    DRIVER_MAX_USES: int = 50
+    DRIVER_CACHE_DIR: str = "~/.cache/test_api_ui"
+    DRIVER_CACHE_LOCK_TIMEOUT: int = 300
+
+    # Authenticated browser state reused across tests (utils.auth_cache)
+    AUTH_SNAPSHOT_MAX_AGE: float = 3600
+    AUTH_SNAPSHOT_VALIDATE_INTERVAL: float = 60
+
+    # API client connection pool and retries
+    API_POOL_CONNECTIONS: int = 10
+    API_POOL_MAXSIZE: int = 10
+    API_POOL_BLOCK: bool = False
+    API_CONNECT_TIMEOUT: float = 5
+    API_READ_TIMEOUT: float = 30
+    API_MAX_RETRIES: int = 2
+    API_RETRY_BACKOFF: float = 0.3
+    API_RETRY_STATUSES: List[int] = [502, 503, 504]
+
+    # Recorded responses: "off", "record" (hit the API and capture) or "replay" (serve from disk)
+    API_CASSETTE_MODE: str = "off"
+    API_CASSETTE_DIR: str = "tests/cassettes"
+
+    # Response cache for idempotent GETs; API_CACHE_DIR enables the on-disk tier
+    API_CACHE_ENABLED: bool = False
+    API_CACHE_MAX_ENTRIES: int = 1024
+    API_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    API_CACHE_DEFAULT_TTL: float = 0
+    API_CACHE_DIR: str = ""
+
+    # Request logging: share of per-request INFO lines kept, queue-based handler,
+    # and an optional JSONL trace of every request
+    API_LOG_SAMPLE_RATE: float = 1.0
+    API_LOG_QUEUE: bool = False
+    API_TRACE_PATH: str = ""
+
+    # Reporting
+    LATENCY_REPORT_PATH: str = "latency-report.json"
+
+    # Load-generation mode
+    LOAD_MAX_ERROR_RATE: float = 0.01
+
+    # Framework benchmarks (--run-benchmarks)
+    BENCHMARK_BASELINE_PATH: str = "tests/benchmarks/baseline.json"
+    BENCHMARK_TOLERANCE: float = 0.5
+    BENCHMARK_ROUNDS: int = 20
+    BENCHMARK_MIN_ROUND_TIME: float = 0.01
+
+    # Test duration history (SQLite), used for sharding, ordering and regression flags
+    TEST_DURATIONS_PATH: str = ".test_durations.db"
+    TEST_DURATIONS_HISTORY: int = 20
+    DURATION_REGRESSION_SIGMA: float = 3.0
+    DURATION_REGRESSION_MIN_RUNS: int = 5
+    DURATION_REGRESSION_MIN_DELTA: float = 0.5
     
     # URLs
     BASE_URL: str = "https://automationexercise.com"
+    API_BASE_URL: str = "https://jsonplaceholder.typicode.com"
     
     # Test data
     TEST_USER_EMAIL: str = "test@example.com"
     TEST_USER_PASSWORD: str = "password123"
+    # Account used by each xdist worker so parallel cart tests do not share state
+    TEST_USER_EMAIL_PER_WORKER: str = "test+{worker}@example.com"
     
     class Config:
         env_file = ".env"
@@ -1,10 +1,18 @@
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
+from config.config import settings
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import resolve_chromedriver
+from utils.latency import LatencyRecorder, latency_recorder
+from utils.page_metrics import page_metrics
+import allure
+import json
 import os
 
+pytest_plugins = ["utils.durations", "utils.sharding", "utils.load_test", "utils.benchmark", "pytester"]
+
 # Load environment variables
 load_dotenv()
 
@@ -18,14 +26,79 @@ def ui_base_url():
     """Return the base URL for UI testing."""
     return os.getenv("UI_BASE_URL")
 
+@pytest.fixture(scope="session", autouse=True)
+def latency_report():
+    """Attach API latency percentiles to Allure at session end."""
+    yield latency_recorder
+    report = latency_recorder.report()
+    if not report:
+        return
+    allure.attach(json.dumps(report, indent=2), name="API latency report",
+                  attachment_type=allure.attachment_type.JSON)
+
+@pytest.fixture(scope="session", autouse=True)
+def page_metrics_report():
+    """Attach browser performance metrics per page object to Allure at session end."""
+    yield page_metrics
+    report = page_metrics.report()
+    if not report:
+        return
+    allure.attach(json.dumps(report, indent=2), name="Page performance report",
+                  attachment_type=allure.attachment_type.JSON)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the latency histograms and page metrics of a finished xdist worker."""
+    output = getattr(node, "workeroutput", {})
+    if "latency" in output:
+        latency_recorder.merge(LatencyRecorder.from_json(output["latency"]))
+    if "page_metrics" in output:
+        page_metrics.merge_json(output["page_metrics"])
+
+def pytest_sessionfinish(session):
+    """Write the JSON reports once, on the xdist controller or the single pytest process."""
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["latency"] = latency_recorder.to_json()
+        workeroutput["page_metrics"] = page_metrics.to_json()
+        return
+    if latency_recorder.report():
+        latency_recorder.export_json(settings.LATENCY_REPORT_PATH)
+    if page_metrics.report():
+        page_metrics.export_json(settings.PAGE_METRICS_REPORT_PATH)
+
+@pytest.fixture(scope="session")
+def driver_factory(tmp_path_factory):
+    """Return a callable that launches a new WebDriver instance."""
+    def create_driver():
+        # tmp_path_factory is per xdist worker, so every browser gets its own profile
+        options = webdriver.ChromeOptions()
+        options.add_argument(f"--user-data-dir={tmp_path_factory.mktemp('chrome-profile')}")
+        options.add_experimental_option("prefs", {
+            "download.default_directory": str(tmp_path_factory.mktemp("downloads"))
+        })
+        if settings.NETWORK_STATS_ENABLED:
+            # Network events of the performance log feed the per-page request blocking stats
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        service = Service(resolve_chromedriver())
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.maximize_window()
+        return driver
+    return create_driver
+
+@pytest.fixture(scope="session")
+def driver_pool(driver_factory):
+    """Keep warm WebDriver instances for the whole session."""
+    pool = DriverPool(driver_factory)
+    yield pool
+    pool.close()
+
 @pytest.fixture(scope="function")
-def driver():
-    """Create and return a WebDriver instance."""
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
-    driver.maximize_window()
+def driver(driver_pool):
+    """Borrow a clean WebDriver instance from the session pool."""
+    driver = driver_pool.acquire()
     yield driver
-    driver.quit()
+    driver_pool.release(driver)
 
 @pytest.fixture(scope="function")
 def faker():
@@ -1,52 +1,253 @@
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, InvalidElementStateException, StaleElementReferenceException,
+    TimeoutException, WebDriverException
+)
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from config.config import settings
+from utils.driver_pool import track_origin
+from utils.network_blocker import get_network_blocker
+from utils.page_metrics import (
+    COLLECT_JS, EARLY_OBSERVER_JS, PerformanceBudgetExceeded, budget_violations, page_metrics
+)
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import logging
 
+# Errors after which a cached element handle is dropped and the locator resolved again with a wait
+STALE_HANDLE_ERRORS = (StaleElementReferenceException, InvalidElementStateException, ElementClickInterceptedException)
+
+# Resolves Selenium (by, value) locators relative to a root node inside the browser
+LOCATE_JS = """
+function locateAll(root, by, value) {
+    switch (by) {
+        case 'xpath':
+            var result = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+            return nodes;
+        case 'link text':
+        case 'partial link text':
+            return Array.from(root.querySelectorAll('a')).filter(function (a) {
+                var text = a.innerText.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+        case 'id': return Array.from(root.querySelectorAll('#' + CSS.escape(value)));
+        case 'name': return Array.from(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name': return Array.from(root.querySelectorAll('.' + CSS.escape(value)));
+        default: return Array.from(root.querySelectorAll(value));
+    }
+}
+function locate(root, by, value) {
+    return locateAll(root, by, value)[0] || null;
+}
+"""
+
+EXTRACT_ROWS_JS = LOCATE_JS + """
+var fields = arguments[2];
+return locateAll(document, arguments[0], arguments[1]).map(function (row) {
+    var data = {};
+    Object.keys(fields).forEach(function (name) {
+        var field = fields[name];
+        var element = locate(row, field[0], field[1]);
+        var attribute = field[2] || 'innerText';
+        if (element === null) {
+            data[name] = null;
+        } else if (attribute in element) {
+            var property = element[attribute];
+            data[name] = typeof property === 'string' ? property.trim() : property;
+        } else {
+            data[name] = element.getAttribute(attribute);
+        }
+    });
+    return data;
+});
+"""
+
+# Sets [by, value, text] fields through the native value setter (so frameworks tracking
+# the property see the change) and fires the events typing would. Returns the fields it
+# did not set: not found yet, hidden, disabled or read-only, all of which need input_text
+FILL_FORM_JS = LOCATE_JS + """
+function interactable(element) {
+    return !element.disabled && !element.readOnly && element.getClientRects().length > 0
+        && getComputedStyle(element).visibility !== 'hidden';
+}
+var deferred = [];
+arguments[0].forEach(function (field) {
+    var element = locate(document, field[0], field[1]);
+    if (element === null || !interactable(element)) { deferred.push(field); return; }
+    var prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : element instanceof HTMLSelectElement ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    element.focus();
+    Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, field[2]);
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    element.blur();
+});
+return deferred;
+"""
+
 class BasePage:
+    # Per-page overrides of settings.PAGE_BUDGETS, e.g. {"lcp": 2500}
+    PERFORMANCE_BUDGET: Dict[str, float] = {}
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, settings.IMPLICIT_WAIT)
         self.logger = logging.getLogger(__name__)
+        self.url: Optional[str] = None
+        self.last_metrics: Dict[str, Any] = {}
+        # Element handles by locator, valid until the next navigation or until they go stale
+        self._elements: Dict[Tuple[str, str], Any] = {}
+
+    def open(self):
+        """Open the page with third-party blocking and record its performance metrics"""
+        self.clear_element_cache()
+        blocker = get_network_blocker()
+        blocker.apply(self.driver)
+        # Start the request counts from this navigation
+        blocker.drain(self.driver)
+        if settings.PAGE_METRICS_ENABLED:
+            self._install_metrics_observer()
+        track_origin(self.driver, self.url)
+        self.driver.get(self.url)
+        if settings.PAGE_METRICS_ENABLED:
+            self.last_metrics = self.collect_metrics(extra=blocker.page_stats(self.driver))
+
+    def _install_metrics_observer(self):
+        """Start LCP/CLS/long-task observers before any script of the next document"""
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return
+        try:
+            # Registered per open since the pool swaps tabs between tests; the script guards against running twice
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": EARLY_OBSERVER_JS})
+        except WebDriverException as e:
+            self.logger.debug(f"Could not install performance observers: {str(e)}")
+
+    def collect_metrics(self, timeout: int = None, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Read Navigation/Resource Timing, web vitals and JS heap of the current
+        document, record them (with any extra metrics, such as request
+        blocking stats) for this page object and check the budget.
+
+        Budget violations are logged, or raise PerformanceBudgetExceeded when
+        settings.PAGE_BUDGET_MODE is "fail".
+        """
+        try:
+            metrics = self.wait_until(lambda driver: driver.execute_script(COLLECT_JS), timeout)
+        except TimeoutException:
+            self.logger.warning(f"Load event of {self.driver.current_url} did not finish, no metrics recorded")
+            return {}
+        metrics.update(extra or {})
+        violations = {}
+        if settings.PAGE_BUDGET_MODE != "off":
+            violations = budget_violations(metrics, {**settings.PAGE_BUDGETS, **self.PERFORMANCE_BUDGET})
+        page_metrics.record(type(self).__name__, metrics, violations)
+        if violations:
+            details = ", ".join(f"{name}={value:g} (budget {limit:g})" for name, (value, limit) in violations.items())
+            message = f"{type(self).__name__} exceeded its performance budget: {details}"
+            if settings.PAGE_BUDGET_MODE == "fail":
+                raise PerformanceBudgetExceeded(message)
+            self.logger.warning(message)
+        return metrics
 
     def find_element(self, by: By, value: str, timeout: int = None):
         """Find element with explicit wait and retry on stale element"""
         wait = WebDriverWait(self.driver, timeout or settings.IMPLICIT_WAIT)
         try:
-            return wait.until(EC.presence_of_element_located((by, value)))
+            element = wait.until(EC.presence_of_element_located((by, value)))
         except StaleElementReferenceException:
             self.logger.warning(f"Stale element encountered, retrying... ({by}={value})")
-            return wait.until(EC.presence_of_element_located((by, value)))
+            element = wait.until(EC.presence_of_element_located((by, value)))
+        self._elements[(by, value)] = element
+        return element
 
     def find_elements(self, by: By, value: str, timeout: int = None):
         """Find elements with explicit wait"""
         wait = WebDriverWait(self.driver, timeout or settings.IMPLICIT_WAIT)
         return wait.until(EC.presence_of_all_elements_located((by, value)))
 
-    def click(self, by: By, value: str, timeout: int = None):
-        """Click element with explicit wait and retry on stale element"""
+    def clear_element_cache(self):
+        """Forget the element handles located on the current document"""
+        self._elements.clear()
+
+    def _interact(self, by: By, value: str, action, condition, timeout: int = None, ready=None):
+        """
+        Run action on the element of a locator, reusing the handle found by an
+        earlier call on this page. A stale or not yet interactable handle is
+        dropped and the locator resolved again, waiting for condition. ready,
+        if given, is checked on a reused handle first, for conditions such as
+        clickability that the browser would otherwise ignore silently.
+        """
+        element = self._elements.get((by, value))
+        if element is not None:
+            try:
+                if ready is None or ready(element):
+                    return action(element)
+            except STALE_HANDLE_ERRORS:
+                pass
+            del self._elements[(by, value)]
         wait = WebDriverWait(self.driver, timeout or settings.IMPLICIT_WAIT)
         try:
-            element = wait.until(EC.element_to_be_clickable((by, value)))
-            element.click()
+            element = wait.until(condition((by, value)))
+            result = action(element)
         except StaleElementReferenceException:
-            self.logger.warning(f"Stale element encountered during click, retrying... ({by}={value})")
-            element = wait.until(EC.element_to_be_clickable((by, value)))
-            element.click()
+            self.logger.warning(f"Stale element encountered, retrying... ({by}={value})")
+            element = wait.until(condition((by, value)))
+            result = action(element)
+        self._elements[(by, value)] = element
+        return result
+
+    def click(self, by: By, value: str, timeout: int = None):
+        """Click element with explicit wait and retry on stale element"""
+        # A click on a disabled button is a no-op, so a reused handle must be clickable too
+        self._interact(by, value, lambda element: element.click(), EC.element_to_be_clickable, timeout,
+                       ready=lambda element: element.is_displayed() and element.is_enabled())
 
     def input_text(self, by: By, value: str, text: str, timeout: int = None):
         """Input text with explicit wait and clear field first"""
-        element = self.find_element(by, value, timeout)
-        element.clear()
-        element.send_keys(text)
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+        self._interact(by, value, type_text, EC.presence_of_element_located, timeout)
 
     def get_text(self, by: By, value: str, timeout: int = None) -> str:
         """Get text with explicit wait"""
-        element = self.find_element(by, value, timeout)
-        return element.text
+        return self._interact(by, value, lambda element: element.text, EC.presence_of_element_located, timeout)
+
+    def fill_form(self, fields: Dict[Tuple[By, str], str], keystroke_fields: Iterable[Tuple[By, str]] = (),
+                  timeout: int = None):
+        """
+        Fill several inputs in a single script call.
+
+        fields maps (by, value) locators to their text. Values are set through
+        the native setter followed by input and change events. Fields listed
+        in keystroke_fields (e.g. inputs with key handlers or masks) are typed
+        with input_text instead. So are fields the script skips: those not
+        present yet are waited for, and hidden, disabled or read-only ones
+        raise like send_keys would.
+        """
+        keystroke_fields = set(keystroke_fields)
+        scripted = [[by, value, text] for (by, value), text in fields.items() if (by, value) not in keystroke_fields]
+        deferred = self.driver.execute_script(FILL_FORM_JS, scripted) if scripted else []
+        typed = {(by, value) for by, value, _ in deferred} | keystroke_fields
+        for (by, value), text in fields.items():
+            if (by, value) in typed:
+                self.input_text(by, value, text, timeout)
+
+    def extract_rows(self, row_locator: Tuple[By, str], fields: Dict[str, tuple], timeout: int = None) -> List[dict]:
+        """
+        Extract structured data from repeated rows in a single script call.
+
+        fields maps a result key to a (by, value) locator relative to the row,
+        optionally followed by the property or attribute to read (innerText by
+        default). Missing fields are returned as None. Waits until at least one
+        row is present, like find_elements.
+        """
+        spec = {name: list(field) for name, field in fields.items()}
+        wait = WebDriverWait(self.driver, timeout or settings.IMPLICIT_WAIT)
+        return wait.until(lambda driver: driver.execute_script(EXTRACT_ROWS_JS, *row_locator, spec))
 
     def is_element_present(self, by: By, value: str, timeout: int = None) -> bool:
         """Check if element is present with explicit wait"""
@@ -71,6 +272,29 @@ class BasePage:
         wait = WebDriverWait(self.driver, timeout or settings.IMPLICIT_WAIT)
         return wait.until(EC.element_to_be_clickable((by, value)))
 
+    def wait_for_staleness(self, element, timeout: int = None):
+        """Wait for element to be detached from the DOM"""
+        wait = WebDriverWait(self.driver, timeout or settings.IMPLICIT_WAIT)
+        return wait.until(EC.staleness_of(element))
+
+    def wait_until(self, condition, timeout: int = None):
+        """Wait for an arbitrary condition callable to return a truthy value"""
+        wait = WebDriverWait(self.driver, timeout or settings.IMPLICIT_WAIT)
+        return wait.until(condition)
+
+    def wait_for_navigation(self, action, timeout: int = None):
+        """Run action and wait until the browser has loaded the next document"""
+        document = self.driver.find_element(By.TAG_NAME, "html")
+        result = action()
+        self.wait_for_staleness(document, timeout)
+        self.clear_element_cache()
+        self.wait_for_page_load(timeout)
+        return result
+
+    def click_and_wait_for_navigation(self, by: By, value: str, timeout: int = None):
+        """Click element and wait for the page it leads to"""
+        self.wait_for_navigation(lambda: self.click(by, value, timeout), timeout)
+
     def scroll_to_element(self, by: By, value: str, timeout: int = None):
         """Scroll element into view"""
         element = self.find_element(by, value, timeout)
@@ -100,4 +324,5 @@ class BasePage:
     def refresh_page(self):
         """Refresh current page"""
         self.driver.refresh()
+        self.clear_element_cache()
         self.wait_for_page_load() 
\ No newline at end of file
@@ -18,37 +18,26 @@ class CartPage(BasePage):
         super().__init__(driver)
         self.url = "https://automationexercise.com/view_cart"
 
-    def open(self):
-        """Open the cart page"""
-        self.driver.get(self.url)
-
     def get_cart_items(self):
         """Get all items in the cart"""
-        items = self.find_elements(*self.CART_ITEMS)
-        cart_items = []
-        for item in items:
-            name = item.find_element(*self.ITEM_NAME).text
-            price = item.find_element(*self.ITEM_PRICE).text
-            quantity = item.find_element(*self.ITEM_QUANTITY).text
-            total = item.find_element(*self.ITEM_TOTAL).text
-            cart_items.append({
-                "name": name,
-                "price": price,
-                "quantity": quantity,
-                "total": total
-            })
-        return cart_items
+        return self.extract_rows(self.CART_ITEMS, {
+            "name": self.ITEM_NAME,
+            "price": self.ITEM_PRICE,
+            "quantity": self.ITEM_QUANTITY,
+            "total": self.ITEM_TOTAL
+        })
 
     def get_cart_total(self):
         """Get total number of items in cart"""
         return len(self.find_elements(*self.CART_ITEMS))
 
     def remove_item(self, item_index=0):
-        """Remove item from cart by index"""
+        """Remove item from cart by index and wait for its row to disappear"""
         items = self.find_elements(*self.CART_ITEMS)
         if item_index < len(items):
             remove_btn = items[item_index].find_element(*self.EMPTY_CART_BTN)
             remove_btn.click()
+            self.wait_for_staleness(items[item_index])
             return True
         return False
 
@@ -15,16 +15,13 @@ class HomePage(BasePage):
     FEATURED_ITEMS = (By.CSS_SELECTOR, ".features_items .col-sm-4")
     ADD_TO_CART_BTN = (By.CSS_SELECTOR, ".add-to-cart")
     CONTINUE_SHOPPING_BTN = (By.CSS_SELECTOR, ".btn-success")
+    CART_MODAL = (By.ID, "cartModal")
     VIEW_CART_BTN = (By.CSS_SELECTOR, "a[href='/view_cart']")
 
     def __init__(self, driver):
         super().__init__(driver)
         self.url = "https://automationexercise.com/"
 
-    def open(self):
-        """Open the home page"""
-        self.driver.get(self.url)
-
     def click_signup_login(self):
         """Click on Signup/Login button"""
         self.click(*self.SIGNUP_LOGIN_BTN)
@@ -47,20 +44,22 @@ class HomePage(BasePage):
 
     def subscribe_to_newsletter(self, email):
         """Subscribe to newsletter with given email"""
-        self.input_text(*self.SUBSCRIPTION_EMAIL, email)
+        self.fill_form({self.SUBSCRIPTION_EMAIL: email})
         self.click(*self.SUBSCRIPTION_BTN)
 
     def get_subscription_success_message(self):
-        """Get subscription success message"""
-        return self.get_text(*self.SUBSCRIPTION_SUCCESS)
+        """Get subscription success message once it is shown"""
+        return self.wait_for_element_visible(*self.SUBSCRIPTION_SUCCESS).text
 
     def add_product_to_cart(self, product_index=0):
-        """Add a product to cart by index"""
+        """Add a product to cart by index and wait for the cart modal"""
         products = self.find_elements(*self.FEATURED_ITEMS)
         if product_index < len(products):
             add_to_cart_btn = products[product_index].find_element(*self.ADD_TO_CART_BTN)
             self.driver.execute_script("arguments[0].click();", add_to_cart_btn)
+            self.wait_for_element_visible(*self.CART_MODAL)
             self.click(*self.CONTINUE_SHOPPING_BTN)
+            self.wait_for_element_invisible(*self.CART_MODAL)
             return True
         return False
 
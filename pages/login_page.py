@@ -18,21 +18,15 @@ class LoginPage(BasePage):
         super().__init__(driver)
         self.url = "https://automationexercise.com/login"
 
-    def open(self):
-        """Open the login page"""
-        self.driver.get(self.url)
-
     def signup(self, name, email):
-        """Sign up with name and email"""
-        self.input_text(*self.SIGNUP_NAME, name)
-        self.input_text(*self.SIGNUP_EMAIL, email)
-        self.click(*self.SIGNUP_BTN)
+        """Sign up with name and email and wait for the next page"""
+        self.fill_form({self.SIGNUP_NAME: name, self.SIGNUP_EMAIL: email})
+        self.click_and_wait_for_navigation(*self.SIGNUP_BTN)
 
     def login(self, email, password):
-        """Login with email and password"""
-        self.input_text(*self.LOGIN_EMAIL, email)
-        self.input_text(*self.LOGIN_PASSWORD, password)
-        self.click(*self.LOGIN_BTN)
+        """Login with email and password and wait for the resulting page"""
+        self.fill_form({self.LOGIN_EMAIL: email, self.LOGIN_PASSWORD: password})
+        self.click_and_wait_for_navigation(*self.LOGIN_BTN)
 
     def get_error_message(self):
         """Get error message if login/signup fails"""
@@ -13,6 +13,7 @@ class ProductsPage(BasePage):
     ADD_TO_CART_BTN = (By.CSS_SELECTOR, "button.cart")
     VIEW_CART_BTN = (By.CSS_SELECTOR, "a[href='/view_cart']")
     CONTINUE_SHOPPING_BTN = (By.CSS_SELECTOR, ".btn-success")
+    CART_MODAL = (By.ID, "cartModal")
     CATEGORY_TITLE = (By.CSS_SELECTOR, ".title")
     BRAND_FILTER = (By.CSS_SELECTOR, ".brands-name")
     BRAND_LINKS = (By.CSS_SELECTOR, ".brands-name a")
@@ -21,14 +22,10 @@ class ProductsPage(BasePage):
         super().__init__(driver)
         self.url = "https://automationexercise.com/products"
 
-    def open(self):
-        """Open the products page"""
-        self.driver.get(self.url)
-
     def search_product(self, product_name):
-        """Search for a product"""
+        """Search for a product and wait for the results page"""
         self.input_text(*self.SEARCH_INPUT, product_name)
-        self.click(*self.SEARCH_BTN)
+        self.click_and_wait_for_navigation(*self.SEARCH_BTN)
 
     def get_products_count(self):
         """Get total number of products displayed"""
@@ -37,31 +34,33 @@ class ProductsPage(BasePage):
 
     def get_product_details(self, product_index=0):
         """Get product details by index"""
-        products = self.find_elements(*self.PRODUCTS_LIST)
+        products = self.extract_rows(self.PRODUCTS_LIST, {
+            "name": self.PRODUCT_NAME,
+            "price": self.PRODUCT_PRICE
+        })
         if product_index < len(products):
-            product = products[product_index]
-            name = product.find_element(*self.PRODUCT_NAME).text
-            price = product.find_element(*self.PRODUCT_PRICE).text
-            return {"name": name, "price": price}
+            return products[product_index]
         return None
 
     def add_product_to_cart(self, product_index=0, quantity=1):
-        """Add a product to cart with specified quantity"""
+        """Add a product to cart with specified quantity and wait for the cart modal"""
         products = self.find_elements(*self.PRODUCTS_LIST)
         if product_index < len(products):
             product = products[product_index]
             self.input_text(*self.PRODUCT_QUANTITY, str(quantity))
             self.click(*self.ADD_TO_CART_BTN)
+            self.wait_for_element_visible(*self.CART_MODAL)
             self.click(*self.CONTINUE_SHOPPING_BTN)
+            self.wait_for_element_invisible(*self.CART_MODAL)
             return True
         return False
 
     def filter_by_brand(self, brand_name):
-        """Filter products by brand name"""
+        """Filter products by brand name and wait for the brand page"""
         brand_links = self.find_elements(*self.BRAND_LINKS)
         for link in brand_links:
             if link.text.lower() == brand_name.lower():
-                link.click()
+                self.wait_for_navigation(link.click)
                 return True
         return False
 
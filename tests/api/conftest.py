@@ -0,0 +1,26 @@
+import pytest
+import pytest_asyncio
+from faker import Faker
+from urllib.parse import urlsplit
+from utils.async_api_client import AsyncAPIClient
+from utils.cassette import CassetteServer, cassette_for
+from config.config import settings
+
+@pytest_asyncio.fixture
+async def async_api_client():
+    """Create AsyncAPIClient instance and close its connection pool afterwards"""
+    cassette = cassette_for(settings.API_BASE_URL) if settings.API_CASSETTE_MODE != "off" else None
+    if settings.API_CASSETTE_MODE == "replay":
+        # aiohttp cannot mount the cassette adapter, so replays are served over localhost
+        with CassetteServer(cassette) as server:
+            async with AsyncAPIClient(server.url + urlsplit(settings.API_BASE_URL).path) as client:
+                yield client
+    else:
+        async with AsyncAPIClient(settings.API_BASE_URL, cassette=cassette) as client:
+            yield client
+
+@pytest.fixture(autouse=True)
+def deterministic_faker(request):
+    """Seed Faker per test when recording or replaying so request bodies match the cassette"""
+    if settings.API_CASSETTE_MODE != "off":
+        Faker.seed(request.node.nodeid)
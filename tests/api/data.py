@@ -0,0 +1,35 @@
+"""
+Request payloads for the API tests.
+
+Payloads are built inside the tests rather than in fixtures, so every
+iteration of a load test (see utils.load_test) sends fresh data. Faker
+instances are not thread-safe, so each thread gets its own.
+"""
+import threading
+
+from faker import Faker
+
+_local = threading.local()
+
+
+def fake() -> Faker:
+    """Return the Faker of the calling thread"""
+    if not hasattr(_local, "faker"):
+        _local.faker = Faker()
+    return _local.faker
+
+
+def new_post() -> dict:
+    return {
+        "title": fake().sentence(),
+        "content": fake().paragraph(),
+        "user_id": 1
+    }
+
+
+def new_user() -> dict:
+    return {
+        "name": fake().name(),
+        "email": fake().email(),
+        "status": "active"
+    }
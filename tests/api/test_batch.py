@@ -0,0 +1,55 @@
+import json
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from utils.api_client import APIClient
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Echoes the path and body back; /missing/* returns 404"""
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        status = 404 if self.path.startswith("/missing") else 200
+        # Later requests answer first, so ordering must come from the client
+        time.sleep(0.05 if self.path.endswith("/0") else 0)
+        content = json.dumps({"path": self.path, "body": json.loads(body) if body else None}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def api_client(serve):
+    with serve(EchoHandler) as base_url:
+        yield APIClient(base_url, max_retries=0)
+
+
+class TestBatch:
+    def test_results_in_input_order(self, api_client):
+        batch_requests = [("POST", "/posts", {"json": {"n": i}}) for i in range(50)] + [("GET", "/posts/0")]
+        results = api_client.batch(batch_requests, max_workers=8)
+        assert [result.index for result in results] == list(range(51))
+        assert [result.response.json()["body"]["n"] for result in results[:50]] == list(range(50))
+        assert results[50].response.json()["path"] == "/posts/0"
+
+    def test_errors_are_collected(self, api_client):
+        results = api_client.batch([("GET", "/posts/1"), ("GET", "/missing/1"), ("GET", "/posts/2")])
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[1].error.response.status_code == 404
+
+    def test_rate_limit_paces_requests(self, api_client):
+        start = time.perf_counter()
+        results = api_client.batch([("GET", f"/posts/{i}") for i in range(1, 11)], rate_limit=50)
+        assert all(result.ok for result in results)
+        # Ten starts at 50/s are spread over at least 9 intervals of 20 ms
+        assert time.perf_counter() - start >= 0.18
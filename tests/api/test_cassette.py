@@ -0,0 +1,87 @@
+import asyncio
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+from utils.api_client import APIClient
+from utils.async_api_client import AsyncAPIClient
+from utils.cassette import Cassette, CassetteMiss, CassetteServer, cassette_for
+from utils.latency import LatencyRecorder
+from config.config import settings
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def origin(serve):
+    """Local server standing in for the real API during recording"""
+    with serve(EchoHandler) as base_url:
+        yield base_url
+
+
+@pytest.fixture
+def cassette_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "API_CASSETTE_DIR", str(tmp_path))
+    monkeypatch.setattr(Cassette, "_open", {})
+    return tmp_path
+
+
+class TestCassette:
+    def test_replay_without_network(self, origin, cassette_dir):
+        """Responses recorded once are served after the origin is gone."""
+        recorder = APIClient(origin, cassette_mode="record")
+        recorder.get("/users/1", params={"b": 1, "a": 2})
+        recorder.post("/posts", json={"title": "t", "body": "b"})
+        Cassette.save_all()
+        Cassette._open.clear()
+
+        player = APIClient(origin, cassette_mode="replay")
+        assert player.get("/users/1", params={"a": 2, "b": 1}).json() == {"path": "/users/1?b=1&a=2"}
+        assert player.post("/posts", json={"body": "b", "title": "t"}).json() == {"path": "/posts"}
+        with pytest.raises(CassetteMiss):
+            player.get("/users/2")
+
+    def test_localhost_stub_server(self, origin, cassette_dir):
+        """CassetteServer serves the same recordings over HTTP."""
+        recorder = APIClient(origin, cassette_mode="record")
+        recorder.get("/posts/1")
+        cassette = recorder.session.get_adapter(origin).cassette
+        with CassetteServer(cassette) as server:
+            assert requests.get(f"{server.url}/posts/1").json() == {"path": "/posts/1"}
+            assert requests.get(f"{server.url}/posts/2").status_code == 599
+
+    def test_async_client_records_and_replays_over_localhost(self, origin, cassette_dir):
+        """AsyncAPIClient records into the host's cassette and replays through CassetteServer."""
+        async def fetch(base_url, cassette=None):
+            async with AsyncAPIClient(base_url, latency=LatencyRecorder(), cassette=cassette) as client:
+                responses = await client.gather(
+                    client.get("/users/1", params={"b": 1, "a": 2}),
+                    client.post("/posts", json={"title": "t", "body": "b"})
+                )
+                return [response.json() for response in responses]
+
+        recorded = asyncio.run(fetch(origin, cassette_for(origin)))
+        Cassette.save_all()
+        Cassette._open.clear()
+
+        # The sync client finds the async recordings in the same cassette
+        player = APIClient(origin, cassette_mode="replay")
+        assert player.get("/users/1", params={"a": 2, "b": 1}).json() == recorded[0]
+        with CassetteServer(cassette_for(origin)) as server:
+            assert asyncio.run(fetch(server.url)) == recorded == [{"path": "/users/1?b=1&a=2"}, {"path": "/posts"}]
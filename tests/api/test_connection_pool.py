@@ -0,0 +1,89 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+from utils.api_client import APIClient
+from utils.latency import LatencyRecorder
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """/unavailable always answers 503, /slow takes 0.3 s, everything else 200; hits counted per method and path"""
+    protocol_version = "HTTP/1.1"
+    hits = {}
+    lock = threading.Lock()
+
+    def _reply(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with self.lock:
+            self.hits[(self.command, self.path)] = self.hits.get((self.command, self.path), 0) + 1
+        if self.path == "/slow":
+            time.sleep(0.3)
+        status = 503 if self.path == "/unavailable" else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url(serve):
+    with serve(FlakyHandler) as url:
+        yield url
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr("config.config.settings.API_RETRY_BACKOFF", 0)
+    FlakyHandler.hits.clear()
+
+
+class TestRetries:
+    def test_idempotent_request_retried(self, base_url):
+        client = APIClient(base_url, max_retries=2, latency=LatencyRecorder())
+        with pytest.raises(requests.HTTPError):
+            client.get("/unavailable")
+        assert FlakyHandler.hits[("GET", "/unavailable")] == 3
+
+    def test_post_not_retried(self, base_url):
+        client = APIClient(base_url, max_retries=2, latency=LatencyRecorder())
+        with pytest.raises(requests.HTTPError):
+            client.post("/unavailable", json={})
+        assert FlakyHandler.hits[("POST", "/unavailable")] == 1
+
+
+class TestTimeouts:
+    def test_read_timeout_raised_without_retry(self, base_url):
+        client = APIClient(base_url, max_retries=2, latency=LatencyRecorder())
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            client.get("/slow", timeout=(1, 0.05))
+        assert FlakyHandler.hits[("GET", "/slow")] == 1
+
+
+class TestPoolStats:
+    def test_counts_after_concurrent_requests(self, base_url):
+        client = APIClient(base_url, pool_maxsize=4, max_retries=0, latency=LatencyRecorder())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: client.get("/slow"), range(8)))
+        stats = client.pool_stats()[f"http://127.0.0.1:{base_url.rsplit(':', 1)[1]}"]
+        assert stats["maxsize"] == 4
+        assert stats["in_use"] == 0
+        assert stats["requests"] == 8
+        # Concurrent requests opened extra connections, which stayed open for reuse
+        assert 1 < stats["connections_created"] <= 4
+        assert stats["idle"] == stats["connections_created"]
+
+    def test_failed_stream_releases_its_connection(self, base_url):
+        client = APIClient(base_url, pool_maxsize=1, max_retries=0, latency=LatencyRecorder())
+        with pytest.raises(requests.HTTPError):
+            list(client.stream_items("/unavailable"))
+        stats = client.pool_stats()[f"http://127.0.0.1:{base_url.rsplit(':', 1)[1]}"]
+        assert stats["in_use"] == 0
@@ -0,0 +1,94 @@
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from utils.api_client import APIClient
+from utils.http_cache import ResponseCache
+
+
+class CachingHandler(BaseHTTPRequestHandler):
+    """/fresh/* is cacheable for an hour, /etag/* must be revalidated"""
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.hits.append(("GET", self.path))
+        body = json.dumps({"path": self.path}).encode()
+        if self.path.startswith("/etag"):
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._send(304, headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+                return
+            self._send(200, body, {"ETag": '"v1"', "Cache-Control": "no-cache"})
+        else:
+            self._send(200, body, {"Cache-Control": "max-age=3600"})
+
+    def do_PUT(self):
+        self.hits.append(("PUT", self.path))
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self._send(200, b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url(serve):
+    with serve(CachingHandler) as url:
+        yield url
+
+
+@pytest.fixture
+def hits():
+    CachingHandler.hits.clear()
+    return CachingHandler.hits
+
+
+class TestResponseCache:
+    def test_fresh_response_served_from_cache(self, base_url, hits):
+        api_client = APIClient(base_url, cache=ResponseCache())
+        first = api_client.get("/fresh/1")
+        second = api_client.get("/fresh/1")
+        assert second.json() == first.json()
+        assert getattr(second, "from_cache", False)
+        assert hits == [("GET", "/fresh/1")]
+
+    def test_stale_response_revalidated(self, base_url, hits):
+        """A no-cache entry with an ETag is revalidated and served from the 304."""
+        cache = ResponseCache()
+        api_client = APIClient(base_url, cache=cache)
+        api_client.get("/etag/1")
+        response = api_client.get("/etag/1")
+        assert response.status_code == 200
+        assert response.json() == {"path": "/etag/1"}
+        assert cache.stats["revalidated"] == 1
+        assert len(hits) == 2
+
+    def test_write_invalidates_resource_and_collection(self, base_url, hits):
+        api_client = APIClient(base_url, cache=ResponseCache())
+        api_client.get("/fresh")
+        api_client.get("/fresh/1")
+        api_client.put("/fresh/1", json={"title": "new"})
+        api_client.get("/fresh")
+        api_client.get("/fresh/1")
+        assert [path for method, path in hits if method == "GET"] == ["/fresh", "/fresh/1", "/fresh", "/fresh/1"]
+
+    def test_lru_eviction(self, base_url, hits):
+        api_client = APIClient(base_url, cache=ResponseCache(max_entries=1))
+        api_client.get("/fresh/1")
+        api_client.get("/fresh/2")
+        api_client.get("/fresh/1")
+        assert len(hits) == 3
+
+    def test_disk_tier_survives_new_cache(self, base_url, hits, tmp_path):
+        APIClient(base_url, cache=ResponseCache(disk_dir=str(tmp_path))).get("/fresh/1")
+        response = APIClient(base_url, cache=ResponseCache(disk_dir=str(tmp_path))).get("/fresh/1")
+        assert response.from_cache
+        assert len(hits) == 1
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+from utils.json_stream import iter_json_array
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonStream:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+    def test_items_split_across_chunks(self, chunk_size):
+        """Items are yielded intact whatever the chunk boundaries."""
+        items = [{"id": i, "name": "Zoë ✓", "tags": [1, 2.5, None]} for i in range(20)] + [123456, "x", True]
+        body = json.dumps(items, indent=1).encode()
+        assert list(iter_json_array(chunked(body, chunk_size))) == items
+
+    def test_empty_array(self):
+        assert list(iter_json_array([b" [ ", b"] "])) == []
+
+    def test_items_yielded_before_body_ends(self):
+        """The first item is available before the rest of the body arrives."""
+        def chunks():
+            yield b'[{"id": 1}, '
+            raise AssertionError("read past the first item")
+        assert next(iter_json_array(chunks())) == {"id": 1}
+
+    @pytest.mark.parametrize("body", [b'{"id": 1}', b'[1, 2', b'[1 2]', b'[1] 2'])
+    def test_malformed_body(self, body):
+        with pytest.raises(ValueError):
+            list(iter_json_array([body]))
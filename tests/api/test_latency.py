@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from utils.latency import LatencyHistogram, LatencyRecorder, normalize_endpoint
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_bucket_error(self):
+        """Percentiles of 1..1000 ms stay within the histogram's relative error."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.02)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.02)
+        assert histogram.percentile(100) == pytest.approx(1.0)
+
+    def test_single_slow_sample_does_not_move_p90(self):
+        """One outlier shows up in max but not in p90."""
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(0.1)
+        histogram.record(5.0)
+        summary = histogram.summary()
+        assert summary["p90"] == pytest.approx(0.1, rel=0.02)
+        assert summary["max"] == pytest.approx(5.0)
+
+    def test_merge(self):
+        """Merging combines counts and extremes."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.01)
+        second.record(0.2)
+        first.merge(second)
+        assert first.count == 2
+        assert first.summary()["max"] == pytest.approx(0.2)
+
+    def test_phases_aggregated(self):
+        """Phase breakdowns get their own summaries, merged along with the totals."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.1, {"connect": 0.02, "wait": 0.08})
+        second.record(0.3, {"connect": 0.0, "wait": 0.3})
+        first.merge(second)
+        phases = first.summary()["phases"]
+        assert phases["wait"]["mean"] == pytest.approx(0.19)
+        assert phases["connect"]["p99"] == pytest.approx(0.02, rel=0.02)
+
+
+class TestLatencyRecorder:
+    def test_endpoints_grouped_by_template(self):
+        """Numeric ids and query strings collapse into one endpoint key."""
+        recorder = LatencyRecorder()
+        recorder.record("get", "/users/1", 0.1)
+        recorder.record("GET", "users/2?x=1", 0.3)
+        report = recorder.report()
+        assert list(report) == ["GET /users/{id}"]
+        assert report["GET /users/{id}"]["count"] == 2
+
+    def test_json_round_trip_merges_like_the_original(self):
+        """Worker recorders shipped as JSON merge into the same report as in-process ones."""
+        worker, direct, merged = LatencyRecorder(), LatencyRecorder(), LatencyRecorder()
+        for ms in range(1, 101):
+            worker.record("GET", "/posts/1", ms / 1000, {"wait": ms / 2000})
+        direct.merge(worker)
+        merged.merge(LatencyRecorder.from_json(json.loads(json.dumps(worker.to_json()))))
+        assert merged.report() == direct.report()
+
+    def test_normalize_endpoint(self):
+        assert normalize_endpoint("/posts/12/comments") == "/posts/{id}/comments"
@@ -0,0 +1,80 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from utils.api_client import APIClient
+from utils.pagination import CursorPagination, LinkHeaderPagination, OffsetPagination, PagePagination
+
+ITEMS = [{"id": i} for i in range(1, 26)]
+
+
+class PaginatedHandler(BaseHTTPRequestHandler):
+    """Serves ITEMS with json-server style paging, Link headers and cursors"""
+    protocol_version = "HTTP/1.1"
+    requested = []
+
+    def do_GET(self):
+        self.requested.append(self.path)
+        parts = urlsplit(self.path)
+        query = {key: int(values[0]) for key, values in parse_qs(parts.query).items()}
+        headers = {"Content-Type": "application/json"}
+        if parts.path == "/cursor":
+            start = query.get("cursor", 0)
+            page = ITEMS[start:start + 10]
+            next_cursor = start + 10 if start + 10 < len(ITEMS) else None
+            body = {"data": page, "next_cursor": next_cursor}
+        else:
+            limit = query.get("_limit", 10)
+            start = query.get("_start", (query.get("_page", 1) - 1) * limit)
+            body = ITEMS[start:start + limit]
+            if "_page" in query and start + limit < len(ITEMS):
+                headers["Link"] = f'<http://{self.headers["Host"]}/items?_page={query["_page"] + 1}&_limit={limit}>; rel="next"'
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def api_client(serve):
+    with serve(PaginatedHandler) as base_url:
+        yield APIClient(base_url)
+
+
+class TestPagination:
+    @pytest.mark.parametrize("endpoint, pagination", [
+        ("/items", PagePagination(page_size=10)),
+        ("/items", OffsetPagination(limit=10)),
+        ("/items", LinkHeaderPagination(first_page_params={"_page": 1, "_limit": 10})),
+        ("/cursor", CursorPagination()),
+    ])
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_iter_items_walks_all_pages(self, api_client, endpoint, pagination, prefetch):
+        """Every strategy yields all items exactly once, in order."""
+        items = list(api_client.iter_items(endpoint, pagination=pagination, prefetch=prefetch))
+        assert items == ITEMS
+
+    def test_iter_pages_yields_responses(self, api_client):
+        pages = list(api_client.iter_pages("/items", pagination=PagePagination(page_size=10)))
+        assert [len(page.items) for page in pages] == [10, 10, 5]
+
+    def test_abandoned_walk_stops_prefetching(self, api_client):
+        """Breaking out of the iterator does not leave the producer blocked."""
+        for page in api_client.iter_pages("/items", pagination=PagePagination(page_size=5), prefetch=1):
+            break
+        assert page.items == ITEMS[:5]
+        for thread in threading.enumerate():
+            if thread.name == "page-prefetch":
+                thread.join(timeout=2)
+                assert not thread.is_alive()
+        # The consumed page, one queued page and the one the producer held when stopped
+        walked = [path for path in PaginatedHandler.requested if "_limit=5" in path]
+        assert 1 <= len(walked) <= 3
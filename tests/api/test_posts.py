@@ -2,9 +2,8 @@ import pytest
 import allure
 from utils.api_client import APIClient
 from tests.api.models import Post, ErrorResponse
-from faker import Faker
-
-fake = Faker()
+from utils.pagination import PagePagination
+from tests.api.data import new_post
 
 # Define maximum acceptable response times (in seconds)
 MAX_GET_TIME = 1.0
@@ -16,14 +15,7 @@ MAX_DELETE_TIME = 1.0
 def api_client():
     return APIClient("https://jsonplaceholder.typicode.com")
 
-@pytest.fixture
-def test_post():
-    return {
-        "title": fake.sentence(),
-        "content": fake.paragraph(),
-        "user_id": 1
-    }
-
+@pytest.mark.load
 @allure.feature("Post API")
 @allure.story("Post Management")
 class TestPostAPI:
@@ -39,16 +31,33 @@ class TestPostAPI:
             assert api_client.check_response_time(response, MAX_GET_TIME), \
                 f"Response time {response.elapsed_time:.2f}s exceeded maximum {MAX_GET_TIME}s"
 
+    @allure.title("Stream all posts")
+    def test_stream_posts(self, api_client):
+        with allure.step("Stream posts one at a time"):
+            post_ids = [post["id"] for post in api_client.stream_items("/posts")]
+            assert len(post_ids) > 0
+            assert len(set(post_ids)) == len(post_ids)
+
     @allure.title("Get post by ID")
     def test_get_post_by_id(self, api_client):
         with allure.step("Get post with ID 1"):
-            response = api_client.get("/posts/1")
+            response = api_client.get("/posts/1", response_model=Post)
             assert response.status_code == 200
-            post = Post(**response.json())
+            post = response.model
             assert post.id == 1
             assert api_client.check_response_time(response, MAX_GET_TIME), \
                 f"Response time {response.elapsed_time:.2f}s exceeded maximum {MAX_GET_TIME}s"
 
+    @allure.title("Get post latency percentiles")
+    def test_get_post_latency_percentiles(self, api_client):
+        with allure.step("Get posts 1-20"):
+            for post_id in range(1, 21):
+                api_client.get(f"/posts/{post_id}")
+        with allure.step("Check p90 latency"):
+            p90 = api_client.latency.percentile("GET", "/posts/1", 90)
+            assert api_client.check_percentile("GET", "/posts/1", 90, MAX_GET_TIME), \
+                f"p90 response time {p90:.2f}s exceeded maximum {MAX_GET_TIME}s"
+
     @allure.title("Get posts by user ID")
     def test_get_posts_by_user(self, api_client):
         with allure.step("Get posts for user ID 1"):
@@ -60,12 +69,22 @@ class TestPostAPI:
             assert api_client.check_response_time(response, MAX_GET_TIME), \
                 f"Response time {response.elapsed_time:.2f}s exceeded maximum {MAX_GET_TIME}s"
 
+    @allure.title("Get posts by user ID across pages")
+    def test_iter_posts_by_user(self, api_client):
+        with allure.step("Walk all pages of posts for user ID 1"):
+            posts = list(api_client.iter_items(
+                "/posts", params={"userId": 1}, pagination=PagePagination(page_size=5)
+            ))
+            assert len(posts) > 0
+            assert all(post["userId"] == 1 for post in posts)
+
     @allure.title("Create new post")
-    def test_create_post(self, api_client, test_post):
+    def test_create_post(self, api_client):
+        test_post = new_post()
         with allure.step("Create new post"):
-            response = api_client.post("/posts", json=test_post)
+            response = api_client.post("/posts", json=test_post, response_model=Post)
             assert response.status_code == 201
-            created_post = Post(**response.json())
+            created_post = response.model
             assert created_post.title == test_post["title"]
             assert created_post.content == test_post["content"]
             assert created_post.user_id == test_post["user_id"]
@@ -73,11 +92,12 @@ class TestPostAPI:
                 f"Response time {response.elapsed_time:.2f}s exceeded maximum {MAX_POST_TIME}s"
 
     @allure.title("Update post")
-    def test_update_post(self, api_client, test_post):
+    def test_update_post(self, api_client):
+        test_post = new_post()
         with allure.step("Update post with ID 1"):
-            response = api_client.put("/posts/1", json=test_post)
+            response = api_client.put("/posts/1", json=test_post, response_model=Post)
             assert response.status_code == 200
-            updated_post = Post(**response.json())
+            updated_post = response.model
             assert updated_post.title == test_post["title"]
             assert updated_post.content == test_post["content"]
             assert api_client.check_response_time(response, MAX_PUT_TIME), \
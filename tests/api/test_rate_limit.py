@@ -0,0 +1,44 @@
+import pytest
+from utils.rate_limit import RateLimiter
+
+
+class FakeClock:
+    """perf_counter/sleep pair where sleeping advances the clock"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("utils.rate_limit.time", clock)
+    return clock
+
+
+class TestRateLimiter:
+    def test_calls_spaced_at_rate(self, clock):
+        limiter = RateLimiter(10)
+        starts = []
+        for _ in range(5):
+            limiter.acquire()
+            starts.append(clock.now)
+        assert starts == pytest.approx([100.0, 100.1, 100.2, 100.3, 100.4])
+
+    def test_idle_time_is_not_banked(self, clock):
+        limiter = RateLimiter(10)
+        limiter.acquire()
+        clock.now += 5
+        limiter.acquire()
+        limiter.acquire()
+        assert clock.now == pytest.approx(105.1)
+
+    def test_rate_must_be_positive(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
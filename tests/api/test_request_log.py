@@ -0,0 +1,51 @@
+import json
+import logging
+import queue
+
+from utils.request_log import RequestLog, TraceWriter, _DeferredQueueHandler
+
+
+class TestRequestLog:
+    def test_sampling_skips_info_but_not_errors(self, caplog):
+        logger = logging.getLogger("tests.request_log")
+        request_log = RequestLog(logger, sample_rate=0)
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            request_log.completed("GET", "http://api/posts/1", 200, 0.01)
+            request_log.failed("GET", "http://api/posts/1", ConnectionError("refused"))
+        assert [record.levelno for record in caplog.records] == [logging.ERROR]
+
+    def test_messages_are_formatted_lazily(self, caplog):
+        logger = logging.getLogger("tests.request_log")
+        request_log = RequestLog(logger, sample_rate=1)
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            request_log.completed("GET", "http://api/posts/1", 200, 0.0123, from_cache=True)
+        record = caplog.records[0]
+        assert record.args == ("GET", "http://api/posts/1", 200, 0.0123, " (cached)")
+        assert record.getMessage() == "GET http://api/posts/1 -> 200 in 0.012s (cached)"
+
+    def test_queue_handler_leaves_formatting_to_the_listener(self):
+        records = queue.SimpleQueue()
+        logger = logging.getLogger("tests.request_log.queue")
+        logger.addHandler(_DeferredQueueHandler(records))
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        try:
+            RequestLog(logger, sample_rate=1).completed("GET", "http://api/posts/1", 200, 0.0123)
+        finally:
+            logger.handlers.clear()
+            logger.propagate = True
+            logger.setLevel(logging.NOTSET)
+        record = records.get_nowait()
+        assert record.msg == "%s %s -> %s in %.3fs%s"
+        assert record.args == ("GET", "http://api/posts/1", 200, 0.0123, "")
+
+    def test_trace_writer_appends_jsonl(self, tmp_path):
+        path = tmp_path / "trace.jsonl"
+        trace = TraceWriter(str(path))
+        trace.write("GET", "http://api/posts/1", 200, 0.0125)
+        trace.write("POST", "http://api/posts", None, 0.5, error="ConnectTimeout")
+        trace.close()
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [(line["method"], line["status"], line["ms"]) for line in lines] == [
+            ("GET", 200, 12.5), ("POST", None, 500.0)]
+        assert lines[1]["error"] == "ConnectTimeout"
@@ -0,0 +1,83 @@
+import asyncio
+import socket
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import urllib3
+from utils.api_client import APIClient
+from utils.async_api_client import AsyncAPIClient
+from utils import timing
+from utils.latency import LatencyRecorder
+
+SERVER_DELAY = 0.05
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Spends SERVER_DELAY before answering, as a slow backend would"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(SERVER_DELAY)
+        content = b'{"id": 1}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url(serve):
+    # A host name, so the first request has a DNS phase to measure
+    with serve(SlowHandler) as url:
+        yield url.replace("127.0.0.1", "localhost")
+
+
+class TestPhaseTimings:
+    def test_server_time_attributed_to_wait(self, base_url):
+        latency = LatencyRecorder()
+        api_client = APIClient(base_url, latency=latency)
+        first = api_client.get("/posts/1")
+        second = api_client.get("/posts/1")
+
+        assert first.timings.new_connection and not second.timings.new_connection
+        assert second.timings.connect == 0 and second.timings.dns == 0
+        for response in (first, second):
+            assert response.timings.wait >= SERVER_DELAY
+            assert sum(response.timings.as_dict().values()) <= response.timings.total
+        phases = latency.report()["GET /posts/{id}"]["phases"]
+        assert phases["wait"]["mean"] >= SERVER_DELAY
+
+    def test_async_client_timings(self, base_url):
+        async def fetch():
+            async with AsyncAPIClient(base_url, latency=LatencyRecorder()) as api_client:
+                return await api_client.get("/posts/1")
+
+        response = asyncio.run(fetch())
+        assert response.timings.new_connection
+        assert response.timings.wait >= SERVER_DELAY
+        assert response.timings.total == pytest.approx(response.elapsed_time)
+
+    def test_connect_timeout_falls_through_to_next_address(self, base_url, monkeypatch):
+        """An address that times out is skipped like create_connection would, not fatal."""
+        unreachable = "192.0.2.1"
+        resolve = socket.getaddrinfo
+        connect = urllib3.util.connection.create_connection
+
+        def getaddrinfo(host, *args):
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (unreachable, 0))] + resolve(host, *args)
+
+        def create_connection(address, *args, **kwargs):
+            if address[0] == unreachable:
+                raise socket.timeout("timed out")
+            return connect(address, *args, **kwargs)
+
+        monkeypatch.setattr(timing.socket, "getaddrinfo", getaddrinfo)
+        monkeypatch.setattr(urllib3.util.connection, "create_connection", create_connection)
+        response = APIClient(base_url, max_retries=0, latency=LatencyRecorder()).get("/posts/1")
+        assert response.json() == {"id": 1}
+        assert response.timings.new_connection
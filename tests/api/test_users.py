@@ -2,9 +2,7 @@ import pytest
 import allure
 from utils.api_client import APIClient
 from tests.api.models import User, ErrorResponse
-from faker import Faker
-
-fake = Faker()
+from tests.api.data import new_user
 
 # Define maximum acceptable response times (in seconds)
 MAX_GET_TIME = 1.0
@@ -16,14 +14,7 @@ MAX_DELETE_TIME = 1.0
 def api_client():
     return APIClient("https://jsonplaceholder.typicode.com")  # Using JSONPlaceholder as example API
 
-@pytest.fixture
-def test_user():
-    return {
-        "name": fake.name(),
-        "email": fake.email(),
-        "status": "active"
-    }
-
+@pytest.mark.load
 @allure.feature("User API")
 @allure.story("User Management")
 class TestUserAPI:
@@ -42,30 +33,32 @@ class TestUserAPI:
     @allure.title("Get user by ID")
     def test_get_user_by_id(self, api_client):
         with allure.step("Get user with ID 1"):
-            response = api_client.get("/users/1")
+            response = api_client.get("/users/1", response_model=User)
             assert response.status_code == 200
-            user = User(**response.json())
+            user = response.model
             assert user.id == 1
             assert api_client.check_response_time(response, MAX_GET_TIME), \
                 f"Response time {response.elapsed_time:.2f}s exceeded maximum {MAX_GET_TIME}s"
 
     @allure.title("Create new user")
-    def test_create_user(self, api_client, test_user):
+    def test_create_user(self, api_client):
+        test_user = new_user()
         with allure.step("Create new user"):
-            response = api_client.post("/users", json=test_user)
+            response = api_client.post("/users", json=test_user, response_model=User)
             assert response.status_code == 201
-            created_user = User(**response.json())
+            created_user = response.model
             assert created_user.name == test_user["name"]
             assert created_user.email == test_user["email"]
             assert api_client.check_response_time(response, MAX_POST_TIME), \
                 f"Response time {response.elapsed_time:.2f}s exceeded maximum {MAX_POST_TIME}s"
 
     @allure.title("Update user")
-    def test_update_user(self, api_client, test_user):
+    def test_update_user(self, api_client):
+        test_user = new_user()
         with allure.step("Update user with ID 1"):
-            response = api_client.put("/users/1", json=test_user)
+            response = api_client.put("/users/1", json=test_user, response_model=User)
             assert response.status_code == 200
-            updated_user = User(**response.json())
+            updated_user = response.model
             assert updated_user.name == test_user["name"]
             assert updated_user.email == test_user["email"]
             assert api_client.check_response_time(response, MAX_PUT_TIME), \
@@ -79,6 +72,18 @@ class TestUserAPI:
             assert api_client.check_response_time(response, MAX_DELETE_TIME), \
                 f"Response time {response.elapsed_time:.2f}s exceeded maximum {MAX_DELETE_TIME}s"
 
+    @allure.title("Get users concurrently")
+    @pytest.mark.asyncio
+    async def test_get_users_concurrently(self, async_api_client):
+        with allure.step("Get users 1-10 concurrently"):
+            responses = await async_api_client.gather(
+                *(async_api_client.get(f"/users/{user_id}") for user_id in range(1, 11))
+            )
+            users = [User(**response.json()) for response in responses]
+            assert [user.id for user in users] == list(range(1, 11))
+            assert all(async_api_client.check_response_time(r, MAX_GET_TIME) for r in responses), \
+                f"Slowest response {max(r.elapsed_time for r in responses):.2f}s exceeded maximum {MAX_GET_TIME}s"
+
     @allure.title("Get non-existent user")
     def test_get_nonexistent_user(self, api_client):
         with allure.step("Try to get user with non-existent ID"):
@@ -0,0 +1,37 @@
+import json
+from typing import List
+
+import jsonschema
+import pydantic
+import pytest
+from tests.api.models import Comment
+from tests.api.test_api_client import USER_SCHEMA
+from utils.validation import get_schema_validator, get_type_adapter, validate_content
+
+
+class TestValidation:
+    def test_validators_are_cached(self):
+        """Adapters and schema validators are built once and reused."""
+        assert get_type_adapter(List[Comment]) is get_type_adapter(List[Comment])
+        assert get_schema_validator(USER_SCHEMA) is get_schema_validator(USER_SCHEMA)
+
+    def test_list_validated_from_bytes(self):
+        """A list body is validated straight into model instances."""
+        content = json.dumps([
+            {"id": i, "post_id": 1, "user_id": 2, "content": "text"} for i in range(100)
+        ]).encode()
+        comments = validate_content(content, response_model=List[Comment])
+        assert len(comments) == 100
+        assert all(isinstance(comment, Comment) for comment in comments)
+
+    def test_schema_and_model_errors(self):
+        """Invalid bodies raise the underlying validation error."""
+        with pytest.raises(jsonschema.ValidationError):
+            validate_content(b'{"id": 1}', json_schema=USER_SCHEMA)
+        with pytest.raises(pydantic.ValidationError):
+            validate_content(b'{"id": 1}', response_model=Comment)
+
+    def test_schema_then_model(self):
+        """With both a schema and a model the schema is checked and the model returned."""
+        content = b'{"id": 1, "name": "Leanne", "email": "leanne@example.com", "post_id": 1, "user_id": 1, "content": "x"}'
+        assert validate_content(content, response_model=Comment, json_schema=USER_SCHEMA).id == 1
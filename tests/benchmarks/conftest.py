@@ -0,0 +1,32 @@
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    """Answers every request with a small JSON body and no server-side work"""
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, delayed ACKs add ~40 ms
+    disable_nagle_algorithm = True
+    body = json.dumps({"id": 1, "title": "title", "content": "content", "user_id": 1}).encode()
+
+    def _reply(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def stub_api_url(serve):
+    """Base URL of a localhost API stub"""
+    with serve(StubAPIHandler) as base_url:
+        yield base_url
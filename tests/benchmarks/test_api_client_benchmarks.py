@@ -0,0 +1,54 @@
+from typing import List
+
+import allure
+import pytest
+from requests.adapters import BaseAdapter
+from tests.api.models import Post, User
+from utils.api_client import APIClient
+from utils.cassette import build_response
+from utils.latency import LatencyRecorder
+from utils.validation import validate_content
+
+pytestmark = pytest.mark.benchmark
+
+POSTS = b"[" + b",".join(
+    b'{"id": %d, "title": "title %d", "content": "content", "user_id": %d}' % (i, i, i % 10) for i in range(100)
+) + b"]"
+
+
+class InMemoryAdapter(BaseAdapter):
+    """Answers without touching the network, leaving only the client's own work"""
+
+    def send(self, request, **kwargs):
+        return build_response(request, 200, {"Content-Type": "application/json"}, b'{"id": 1}')
+
+    def close(self):
+        pass
+
+
+@allure.feature("Benchmarks")
+@allure.story("API client")
+class TestAPIClientBenchmarks:
+    @allure.title("Per-request overhead of APIClient._make_request")
+    def test_make_request_overhead(self, benchmark):
+        api_client = APIClient("http://benchmark.invalid", latency=LatencyRecorder())
+        api_client.session.mount("http://", InMemoryAdapter())
+        benchmark(api_client.get, "/posts/1")
+
+    @allure.title("GET against a localhost stub")
+    def test_get_localhost(self, benchmark, stub_api_url):
+        api_client = APIClient(stub_api_url, latency=LatencyRecorder())
+        benchmark(api_client.get, "/posts/1")
+
+
+@allure.feature("Benchmarks")
+@allure.story("Model validation")
+class TestValidationBenchmarks:
+    @allure.title("Validate a single User")
+    def test_validate_user(self, benchmark):
+        payload = {"id": 1, "name": "Jane", "email": "jane@example.com", "status": "active"}
+        benchmark(User.model_validate, payload)
+
+    @allure.title("Validate a 100 post JSON body")
+    def test_validate_post_list(self, benchmark):
+        benchmark(validate_content, POSTS, List[Post], None)
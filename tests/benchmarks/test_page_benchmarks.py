@@ -0,0 +1,37 @@
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+
+pytestmark = pytest.mark.benchmark
+
+NAME_INPUT = (By.ID, "name")
+COUNTER_BUTTON = (By.ID, "counter")
+ITEM_ROWS = (By.CSS_SELECTOR, "li.item")
+ITEM_FIELDS = {"title": (By.CSS_SELECTOR, ".title"), "price": (By.CSS_SELECTOR, ".price")}
+
+
+@pytest.fixture
+def page(headless_driver, static_site_url):
+    headless_driver.get(static_site_url)
+    return BasePage(headless_driver)
+
+
+@allure.feature("Benchmarks")
+@allure.story("Page objects")
+class TestPageBenchmarks:
+    @allure.title("Raw WebDriver find_element, for reference")
+    def test_raw_find_element(self, benchmark, page):
+        benchmark(page.driver.find_element, *NAME_INPUT)
+
+    @allure.title("BasePage.find_element")
+    def test_find_element(self, benchmark, page):
+        benchmark(page.find_element, *NAME_INPUT)
+
+    @allure.title("BasePage.click")
+    def test_click(self, benchmark, page):
+        benchmark(page.click, *COUNTER_BUTTON)
+
+    @allure.title("BasePage.extract_rows")
+    def test_extract_rows(self, benchmark, page):
+        benchmark(page.extract_rows, ITEM_ROWS, ITEM_FIELDS)
@@ -0,0 +1,58 @@
+import functools
+import threading
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from utils.driver_resolver import resolve_chromedriver
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+
+class QuietStaticHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def _serve(handler) -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope="session")
+def serve():
+    """Context manager running a request handler on localhost and yielding its base URL"""
+    return _serve
+
+
+@pytest.fixture(scope="session")
+def static_site_url(serve):
+    """URL of the static test page served from localhost"""
+    with serve(functools.partial(QuietStaticHandler, directory=str(STATIC_DIR))) as base_url:
+        yield f"{base_url}/index.html"
+
+
+@pytest.fixture(scope="session")
+def headless_driver(tmp_path_factory):
+    """Headless Chrome, or skip when no browser is available"""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument(f"--user-data-dir={tmp_path_factory.mktemp('chrome-profile')}")
+    try:
+        driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+    except Exception as e:
+        # webdriver-manager fails in several ways when no browser is installed
+        pytest.skip(f"Headless Chrome is not available: {e}")
+    yield driver
+    driver.quit()
@@ -0,0 +1,58 @@
+import pytest
+from utils.durations import DurationHistory, DurationStore, base_nodeid, order_items
+
+
+class Item:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DurationStore(str(tmp_path / "durations.db"), history_size=3)
+
+
+class TestDurationStore:
+    def test_history_uses_recent_runs(self, store):
+        for call in (10.0, 1.0, 2.0, 3.0):
+            store.record_run({"t::a": {"setup": 0.5, "call": call, "teardown": 0.5}}, {})
+        history = store.history()["t::a"]
+        assert history.runs == 3
+        assert history.mean == pytest.approx(3.0)
+
+    def test_skipped_runs_ignored_and_failures_counted(self, store):
+        store.record_run({"t::a": {"call": 1.0}}, {"t::a": "failed"})
+        store.record_run({"t::a": {"setup": 0.01}}, {"t::a": "skipped"})
+        store.record_run({"t::a": {"call": 1.0}}, {})
+        history = store.history()["t::a"]
+        assert history.runs == 2
+        assert history.failure_rate == 0.5
+
+    def test_missing_database_has_no_history(self, tmp_path):
+        assert DurationStore(str(tmp_path / "none.db")).history() == {}
+
+
+class TestDurationHistory:
+    def test_regression_threshold(self):
+        history = DurationHistory([1.0, 1.1, 0.9, 1.0, 1.0], failures=0)
+        assert history.is_regression(2.0, sigma=3, min_delta=0.5, min_runs=5)
+        assert not history.is_regression(1.2, sigma=3, min_delta=0.5, min_runs=5)
+        assert not history.is_regression(2.0, sigma=3, min_delta=0.5, min_runs=6)
+
+
+class TestOrdering:
+    def test_orders(self):
+        history = {
+            "t::slow": DurationHistory([5.0], failures=0),
+            "t::quick": DurationHistory([0.1], failures=0),
+            "t::flaky": DurationHistory([3.0, 3.0], failures=1),
+        }
+        items = [Item("t::quick"), Item("t::slow@shard-1"), Item("t::flaky"), Item("t::new")]
+        order_items(items, history, "longest")
+        assert [item.nodeid for item in items] == ["t::slow@shard-1", "t::flaky", "t::new", "t::quick"]
+        order_items(items, history, "fastest-fail")
+        assert [item.nodeid for item in items] == ["t::flaky", "t::quick", "t::new", "t::slow@shard-1"]
+
+    def test_base_nodeid_keeps_parameter_ids(self):
+        assert base_nodeid("t.py::test[a@example.com]@shard-0") == "t.py::test[a@example.com]"
+        assert base_nodeid("t.py::test[a@example.com]") == "t.py::test[a@example.com]"
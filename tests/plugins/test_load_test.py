@@ -0,0 +1,84 @@
+import time
+
+import allure
+import pytest
+from utils.load_test import LoadTest
+
+LOAD_TEST_MODULE = """
+import pytest
+from utils.latency import LatencyRecorder
+
+SESSION_LATENCY = LatencyRecorder()
+calls = []
+
+
+class FakeClient:
+    pool_maxsize = 10
+    latency = SESSION_LATENCY
+
+
+@pytest.fixture(scope="module")
+def api_client():
+    return FakeClient()
+
+
+@pytest.mark.load
+def test_scenario(api_client):
+    calls.append(1)
+    api_client.latency.record("GET", "/posts", 0.001)
+
+
+def test_unmarked_runs_once(api_client):
+    calls.append(1)
+
+
+def test_latency_merged_into_session(api_client):
+    assert api_client.latency is SESSION_LATENCY
+    assert SESSION_LATENCY.histogram("GET", "/posts").count == len(calls) - 1 > 1
+
+
+@pytest.mark.load
+def test_failing_scenario(api_client):
+    raise ConnectionError("refused")
+"""
+
+
+class TestLoadTest:
+    def test_counts_iterations_and_errors(self):
+        calls = []
+
+        def scenario():
+            calls.append(1)
+            if len(calls) % 2:
+                raise ConnectionError("refused")
+
+        result = LoadTest(scenario, duration=0.2, concurrency=1, name="flaky").run()
+        assert result.iterations == len(calls) > 1
+        assert result.errors == {"ConnectionError": (len(calls) + 1) // 2}
+        assert result.error_rate == pytest.approx(result.error_count / len(calls))
+        assert result.throughput == pytest.approx(len(calls) / result.duration)
+        assert result.summary()["iteration_latency"]["count"] == len(calls)
+
+    def test_stops_at_deadline(self):
+        start = time.perf_counter()
+        result = LoadTest(lambda: time.sleep(0.05), duration=0.2, concurrency=4).run()
+        # No iteration starts after the deadline, so the overrun is at most one iteration
+        assert time.perf_counter() - start < 0.2 + 0.05 + 0.1
+        assert 4 * 3 <= result.iterations <= 4 * 5
+
+    def test_rps_paces_iterations(self):
+        result = LoadTest(lambda: None, duration=0.5, concurrency=4, rps=20).run()
+        assert 8 <= result.iterations <= 12
+
+
+class TestLoadTestPlugin:
+    def test_marked_tests_are_replayed(self, pytester, monkeypatch):
+        attached = []
+        monkeypatch.setattr(allure, "attach", lambda body, name=None, **kwargs: attached.append((name, body)))
+        pytester.makepyfile(test_scenarios=LOAD_TEST_MODULE)
+        result = pytester.runpytest_inprocess("-p", "utils.load_test", "-p", "no:cacheprovider",
+                                              "--load-duration", "0.2", "--load-concurrency", "2")
+        result.assert_outcomes(passed=3, failed=1)
+        result.stdout.fnmatch_lines(["*Error rate 100.00% exceeded maximum*"])
+        assert [name for name, _ in attached] == ["Load test result", "Load test result"]
+        assert '"request_latency"' in attached[0][1]
@@ -1,26 +1,38 @@
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.core.os_manager import ChromeType
 from pages.home_page import HomePage
 from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
+from utils.driver_resolver import resolve_chromedriver
+from utils.accounts import ensure_account
+from utils.auth_cache import AuthSessionCache
+from utils.state_bootstrap import StateBootstrap
+from config.config import settings
 
-@pytest.fixture(scope="function")
-def driver():
-    """Create and configure Chrome WebDriver"""
-    options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-notifications")
-    
-    # Configure ChromeDriver for Mac ARM
-    service = Service(ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install())
-    driver = webdriver.Chrome(service=service, options=options)
-    
-    yield driver
-    driver.quit()
+@pytest.fixture(scope="session")
+def driver_factory(tmp_path_factory):
+    """Return a callable that creates a configured Chrome WebDriver"""
+    def create_driver():
+        options = webdriver.ChromeOptions()
+        options.add_argument("--start-maximized")
+        options.add_argument("--disable-notifications")
+
+        # Isolated profile and download dir per browser (and per xdist worker)
+        options.add_argument(f"--user-data-dir={tmp_path_factory.mktemp('chrome-profile')}")
+        options.add_experimental_option("prefs", {
+            "download.default_directory": str(tmp_path_factory.mktemp("downloads"))
+        })
+        if settings.NETWORK_STATS_ENABLED:
+            # Network events of the performance log feed the per-page request blocking stats
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        # Configure ChromeDriver for Mac ARM
+        service = Service(resolve_chromedriver(ChromeType.CHROMIUM))
+        return webdriver.Chrome(service=service, options=options)
+    return create_driver
 
 @pytest.fixture
 def home_page(driver):
@@ -42,11 +54,39 @@ def cart_page(driver):
     """Create CartPage instance"""
     return CartPage(driver)
 
-@pytest.fixture
-def registered_user():
-    """Return test user credentials"""
-    return {
+@pytest.fixture(scope="session")
+def registered_user(worker_id):
+    """Return test user credentials, isolated per xdist worker; the account is created once if missing"""
+    email = settings.TEST_USER_EMAIL
+    if worker_id != "master":
+        email = settings.TEST_USER_EMAIL_PER_WORKER.format(worker=worker_id)
+    user = {
         "name": "Test User",
-        "email": "test@example.com",
-        "password": "password123"
-    } 
\ No newline at end of file
+        "email": email,
+        "password": settings.TEST_USER_PASSWORD
+    }
+    ensure_account(user)
+    return user
+
+@pytest.fixture
+def state_bootstrap():
+    """Set up login and cart state over HTTP, to be injected into the driver"""
+    return StateBootstrap()
+
+@pytest.fixture(scope="session")
+def auth_cache():
+    """Log each test user in once per session and reuse the captured browser state"""
+    def login(driver, user):
+        login_page = LoginPage(driver)
+        login_page.open()
+        login_page.login(user["email"], user["password"])
+
+    def validate(snapshot):
+        return StateBootstrap().load_cookies(snapshot.cookies).is_logged_in()
+
+    return AuthSessionCache(login, validate)
+
+@pytest.fixture
+def auth_snapshot(driver, registered_user, auth_cache):
+    """Put the driver in the logged-in state of the test user"""
+    return auth_cache.authenticate(driver, registered_user)
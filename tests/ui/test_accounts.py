@@ -0,0 +1,53 @@
+import json
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+
+import pytest
+from utils.accounts import AccountError, ensure_account
+from utils.api_client import APIClient
+from utils.latency import LatencyRecorder
+
+
+class AccountsHandler(BaseHTTPRequestHandler):
+    """createAccount API: 201 for new emails, 400 for known ones, always HTTP 200"""
+    protocol_version = "HTTP/1.1"
+    accounts = {}
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers.get("Content-Length") or 0)).decode())
+        email = form["email"][0]
+        if "@" not in email:
+            body = {"responseCode": 400, "message": "Bad request, email parameter is missing in POST request."}
+        elif email in self.accounts:
+            body = {"responseCode": 400, "message": "Email already exists!"}
+        else:
+            self.accounts[email] = form
+            body = {"responseCode": 201, "message": "User created!"}
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def api_client(serve):
+    with serve(AccountsHandler) as base_url:
+        yield APIClient(base_url, max_retries=0, latency=LatencyRecorder())
+
+
+class TestEnsureAccount:
+    def test_created_once_per_email(self, api_client):
+        user = {"name": "Test User", "email": "test+gw0@example.com", "password": "secret"}
+        assert ensure_account(user, api_client)
+        assert not ensure_account(user, api_client)
+        assert AccountsHandler.accounts[user["email"]]["password"] == ["secret"]
+        assert AccountsHandler.accounts[user["email"]]["mobile_number"] == ["5550100"]
+
+    def test_other_errors_raise(self, api_client):
+        with pytest.raises(AccountError, match="email parameter is missing"):
+            ensure_account({"name": "Test User", "email": "invalid", "password": "secret"}, api_client)
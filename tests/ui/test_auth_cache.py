@@ -0,0 +1,76 @@
+import time
+
+from utils.auth_cache import AuthSessionCache, AuthSnapshot
+
+BASE_URL = "https://automationexercise.com"
+USER = {"email": "user@example.com", "password": "secret"}
+
+
+class FakeDriver:
+    """Holds browser cookies and localStorage behind CDP and execute_script."""
+
+    def __init__(self):
+        self.cookies = []
+        self.local_storage = {}
+        self.current_url = "data:,"
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+        if command == "Network.getCookies":
+            return {"cookies": self.cookies}
+        if command == "Network.setCookies":
+            self.cookies.extend(params["cookies"])
+        return {}
+
+    def execute_script(self, script):
+        return dict(self.local_storage)
+
+
+def make_cache(logins, expires=-1, **kwargs):
+    def login(driver, user):
+        logins.append(user["email"])
+        driver.current_url = f"{BASE_URL}/"
+        driver.cookies = [{"name": "sessionid", "value": f"session-{len(logins)}", "domain": "automationexercise.com",
+                           "path": "/", "secure": True, "httpOnly": True, "expires": expires, "size": 41}]
+        driver.local_storage = {"theme": "dark"}
+    return AuthSessionCache(login, base_url=BASE_URL, **kwargs)
+
+
+class TestAuthSessionCache:
+    def test_logs_in_once_and_restores_into_other_drivers(self):
+        logins = []
+        cache = make_cache(logins)
+        first = cache.authenticate(FakeDriver(), USER)
+        assert first.cookies == [{"name": "sessionid", "value": "session-1", "domain": "automationexercise.com",
+                                  "path": "/", "secure": True, "httpOnly": True}]
+        assert first.local_storage == {"theme": "dark"}
+
+        driver = FakeDriver()
+        assert cache.authenticate(driver, USER) is first
+        assert logins == [USER["email"]]
+        assert driver.cookies == first.cookies
+        command, params = driver.cdp_commands[-1]
+        assert command == "Page.addScriptToEvaluateOnNewDocument"
+        assert '"theme": "dark"' in params["source"]
+
+    def test_expired_cookie_triggers_login(self):
+        logins = []
+        cache = make_cache(logins, expires=time.time() - 1)
+        cache.authenticate(FakeDriver(), USER)
+        cache.authenticate(FakeDriver(), USER)
+        assert len(logins) == 2
+
+    def test_rejected_snapshot_triggers_login(self):
+        logins = []
+        verdicts = [False]
+        cache = make_cache(logins, validate=lambda snapshot: verdicts.pop(), validate_interval=0)
+        cache.authenticate(FakeDriver(), USER)
+        snapshot = cache.authenticate(FakeDriver(), USER)
+        assert len(logins) == 2
+        assert snapshot.cookies[0]["value"] == "session-2"
+
+    def test_snapshot_max_age(self):
+        snapshot = AuthSnapshot([], {}, captured_at=time.time() - 120)
+        assert snapshot.is_expired(max_age=60)
+        assert not snapshot.is_expired(max_age=3600)
@@ -3,7 +3,6 @@ import allure
 from faker import Faker
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-import time
 
 fake = Faker()
 
@@ -40,8 +39,7 @@ class TestHomePage:
         
         with allure.step("Generate and enter email"):
             email = fake.email()
-            home_page.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)  # Wait for scroll animation
+            home_page.scroll_to_element(*home_page.SUBSCRIPTION_EMAIL)
         
         with allure.step("Subscribe to newsletter"):
             home_page.subscribe_to_newsletter(email)
@@ -131,7 +129,6 @@ class TestProducts:
         
         with allure.step("Search for products"):
             products_page.search_product("dress")
-            time.sleep(1)  # Wait for search results to load
         
         with allure.step("Verify search results"):
             assert products_page.get_products_count() > 0
@@ -153,7 +150,6 @@ class TestProducts:
         
         with allure.step("Add product to cart"):
             products_page.add_product_to_cart(0, 2)
-            time.sleep(1)  # Wait for cart update
         
         with allure.step("Verify cart update"):
             cart_page.open()
@@ -172,7 +168,6 @@ class TestProducts:
         
         with allure.step("Apply brand filter"):
             products_page.filter_by_brand("Polo")
-            time.sleep(1)  # Wait for filter to apply
         
         with allure.step("Verify filtered results"):
             assert "Polo" in products_page.get_category_title()
@@ -194,11 +189,9 @@ class TestShoppingCart:
         
         with allure.step("Add first product"):
             products_page.add_product_to_cart(0)
-            time.sleep(1)  # Wait for cart update
         
         with allure.step("Add second product"):
             products_page.add_product_to_cart(1)
-            time.sleep(1)  # Wait for cart update
         
         with allure.step("Verify cart contents"):
             cart_page.open()
@@ -207,23 +200,19 @@ class TestShoppingCart:
     @allure.title("Remove product from cart")
     @allure.description("""
     Test Steps:
-    1. Open products page
-    2. Add product to cart
-    3. Open cart
-    4. Remove product
-    5. Verify cart is empty
+    1. Add product to cart through the API
+    2. Open cart
+    3. Remove product
+    4. Verify cart is empty
     """)
-    def test_remove_product(self, products_page, cart_page):
+    def test_remove_product(self, cart_page, state_bootstrap):
         with allure.step("Add product to cart"):
-            products_page.open()
-            products_page.add_product_to_cart(0)
-            time.sleep(1)  # Wait for cart update
+            state_bootstrap.add_to_cart(1).inject(cart_page.driver)
         
         with allure.step("Open cart and remove product"):
             cart_page.open()
             initial_count = cart_page.get_cart_total()
             cart_page.remove_item(0)
-            time.sleep(1)  # Wait for removal
         
         with allure.step("Verify product removal"):
             assert cart_page.get_cart_total() < initial_count
@@ -231,24 +220,18 @@ class TestShoppingCart:
     @allure.title("Clear cart")
     @allure.description("""
     Test Steps:
-    1. Open products page
-    2. Add multiple products
-    3. Open cart
-    4. Clear cart
-    5. Verify cart is empty
+    1. Add multiple products to cart through the API
+    2. Open cart
+    3. Clear cart
+    4. Verify cart is empty
     """)
-    def test_clear_cart(self, products_page, cart_page):
+    def test_clear_cart(self, cart_page, state_bootstrap):
         with allure.step("Add products to cart"):
-            products_page.open()
-            products_page.add_product_to_cart(0)
-            time.sleep(1)  # Wait for cart update
-            products_page.add_product_to_cart(1)
-            time.sleep(1)  # Wait for cart update
+            state_bootstrap.add_to_cart(1, 2).inject(cart_page.driver)
         
         with allure.step("Clear cart"):
             cart_page.open()
             cart_page.clear_cart()
-            time.sleep(1)  # Wait for cart update
         
         with allure.step("Verify cart is empty"):
             assert cart_page.is_cart_empty()
@@ -259,27 +242,16 @@ class TestEndToEnd:
     @allure.title("Complete purchase flow")
     @allure.description("""
     Test Steps:
-    1. Open home page
-    2. Login with valid credentials
-    3. Add products to cart
-    4. Verify cart contents
-    5. Proceed to checkout
+    1. Restore the logged-in session of the test user
+    2. Add products to cart through the API
+    3. Open cart and verify its contents
+    4. Proceed to checkout
     """)
-    def test_complete_purchase(self, home_page, login_page, products_page, cart_page, registered_user):
-        with allure.step("Login to account"):
-            home_page.open()
-            home_page.click_signup_login()
-            login_page.login(registered_user["email"], registered_user["password"])
-            time.sleep(1)  # Wait for login
-        
-        with allure.step("Add products to cart"):
-            products_page.open()
-            products_page.add_product_to_cart(0)
-            time.sleep(1)  # Wait for cart update
-            products_page.add_product_to_cart(1)
-            time.sleep(1)  # Wait for cart update
+    def test_complete_purchase(self, cart_page, auth_snapshot, state_bootstrap):
+        with allure.step("Add products to the cart of the logged-in user"):
+            state_bootstrap.load_cookies(auth_snapshot.cookies).add_to_cart(1, 2).inject(cart_page.driver)
         
         with allure.step("Verify cart and proceed to checkout"):
             cart_page.open()
             assert cart_page.get_cart_total() == 2
-            cart_page.proceed_to_checkout() 
\ No newline at end of file
+            cart_page.proceed_to_checkout()
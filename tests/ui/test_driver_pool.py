@@ -0,0 +1,155 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+from utils.driver_pool import DriverPool, track_origin
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def new_window(self, type_hint):
+        self.driver.counter += 1
+        handle = f"tab-{self.driver.counter}"
+        self.driver.handles.append(handle)
+        self.driver.current_window_handle = handle
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Minimal stand-in for a Chrome WebDriver."""
+
+    def __init__(self):
+        self.session_id = id(self)
+        self.counter = 0
+        self.handles = ["tab-0"]
+        self.crashed = False
+        self._handle = "tab-0"
+        self.current_url = "https://automationexercise.com/view_cart"
+        self.cdp_commands = []
+        self.cleared_origins = []
+        self.switch_to = FakeSwitchTo(self)
+        self.quit_called = False
+
+    @property
+    def window_handles(self):
+        return list(self.handles)
+
+    @property
+    def current_window_handle(self):
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+        return self._handle
+
+    @current_window_handle.setter
+    def current_window_handle(self, handle):
+        self._handle = handle
+
+    def close(self):
+        self.handles.remove(self.current_window_handle)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append(cmd)
+        if cmd == "Storage.clearDataForOrigin":
+            self.cleared_origins.append(params["origin"])
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeRemoteDriver(FakeDriver):
+    """Driver without CDP; records what it clears on each page it visits."""
+
+    def __getattribute__(self, name):
+        if name == "execute_cdp_cmd":
+            raise AttributeError(name)
+        return super().__getattribute__(name)
+
+    def __init__(self):
+        super().__init__()
+        self.cleared = []
+
+    def get(self, url):
+        self.current_url = url
+
+    def delete_all_cookies(self):
+        self.cleared.append(("cookies", self.current_url))
+
+    def execute_script(self, script, *args):
+        if "localStorage.clear()" in script and "sessionStorage.clear()" in script:
+            self.cleared.append(("storage", self.current_url))
+
+
+@pytest.fixture
+def launched():
+    return []
+
+
+@pytest.fixture
+def pool(launched):
+    def factory():
+        driver = FakeDriver()
+        launched.append(driver)
+        return driver
+    return DriverPool(factory, max_size=1, max_uses=2)
+
+
+class TestDriverPool:
+    def test_driver_is_reused_between_tests(self, pool, launched):
+        """A released driver is handed out again instead of launching a new one."""
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+        assert second is first
+        assert len(launched) == 1
+
+    def test_reset_clears_state(self, pool):
+        """Release wipes cookies and storage and leaves a single fresh window."""
+        driver = pool.acquire()
+        driver.handles.append("popup")
+        pool.release(driver)
+        assert driver.window_handles == [driver.current_window_handle]
+        assert "Network.clearBrowserCookies" in driver.cdp_commands
+        assert "Storage.clearDataForOrigin" in driver.cdp_commands
+
+    def test_opened_origins_cleared_on_release(self, pool):
+        """Storage of every origin a page opened is wiped, not just the last URL's."""
+        driver = pool.acquire()
+        track_origin(driver, "http://localhost:8000/form")
+        track_origin(FakeDriver(), "http://unpooled.example/")
+        pool.release(driver)
+        assert sorted(driver.cleared_origins) == ["http://localhost:8000", "https://automationexercise.com"]
+
+    def test_driver_recycled_after_max_uses(self, pool, launched):
+        """A driver is quit once it has served max_uses tests."""
+        driver = pool.acquire()
+        pool.release(driver)
+        pool.acquire()
+        pool.release(driver)
+        assert driver.quit_called
+        assert pool.acquire() is not driver
+        assert len(launched) == 2
+
+    def test_crashed_driver_replaced(self, pool, launched):
+        """An unresponsive idle driver is discarded on acquire."""
+        driver = pool.acquire()
+        pool.release(driver)
+        driver.crashed = True
+        replacement = pool.acquire()
+        assert replacement is not driver
+        assert driver.quit_called
+
+    def test_reset_without_cdp_clears_storage_per_origin(self):
+        """Without CDP, cookies and local/session storage are cleared on a page of every visited origin."""
+        driver = FakeRemoteDriver()
+        pool = DriverPool(lambda: driver, max_size=1, max_uses=2)
+        pool.acquire()
+        pool.track_origin(driver, "http://localhost:8000/form")
+        pool.release(driver)
+        assert sorted(driver.cleared) == [
+            ("cookies", "http://localhost:8000"), ("cookies", "https://automationexercise.com"),
+            ("storage", "http://localhost:8000"), ("storage", "https://automationexercise.com")
+        ]
+        assert driver.current_url == "about:blank"
+        assert pool.acquire() is driver
@@ -0,0 +1,59 @@
+import pytest
+from config.config import settings
+from utils import driver_resolver
+
+
+@pytest.fixture
+def installs(monkeypatch, tmp_path):
+    """Point the resolver at an empty cache and count webdriver-manager installs."""
+    calls = []
+    binary = tmp_path / "chromedriver"
+    binary.write_text("")
+    binary.chmod(0o755)
+
+    class FakeManager:
+        def __init__(self, chrome_type):
+            self.chrome_type = chrome_type
+
+        def install(self):
+            calls.append(self.chrome_type)
+            return str(binary)
+
+    monkeypatch.setattr(settings, "DRIVER_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(driver_resolver, "ChromeDriverManager", FakeManager)
+    monkeypatch.setattr(driver_resolver, "_browser_version", lambda chrome_type: "120")
+    monkeypatch.setattr(driver_resolver, "_resolved", {})
+    return calls
+
+
+class TestDriverResolver:
+    def test_driver_installed_once(self, installs):
+        """Repeated resolution in one process does not hit webdriver-manager again."""
+        first = driver_resolver.resolve_chromedriver()
+        second = driver_resolver.resolve_chromedriver()
+        assert first == second
+        assert len(installs) == 1
+
+    def test_manifest_reused_across_processes(self, installs, monkeypatch):
+        """A fresh process reuses the manifest entry without installing."""
+        path = driver_resolver.resolve_chromedriver()
+        monkeypatch.setattr(driver_resolver, "_resolved", {})
+        assert driver_resolver.resolve_chromedriver() == path
+        assert len(installs) == 1
+
+    def test_unknown_version_falls_back_to_cached_driver(self, installs, monkeypatch):
+        """Without a detectable browser version any cached driver of the same type is used."""
+        path = driver_resolver.resolve_chromedriver()
+        monkeypatch.setattr(driver_resolver, "_resolved", {})
+        monkeypatch.setattr(driver_resolver, "_browser_version", lambda chrome_type: None)
+        assert driver_resolver.resolve_chromedriver() == path
+        assert len(installs) == 1
+
+    def test_process_cache_skips_version_detection(self, installs, monkeypatch):
+        """Once a browser type is resolved the browser is not queried for its version again."""
+        detections = []
+        monkeypatch.setattr(driver_resolver, "_browser_version",
+                            lambda chrome_type: detections.append(chrome_type) or "120")
+        path = driver_resolver.resolve_chromedriver()
+        assert driver_resolver.resolve_chromedriver() == path
+        assert len(detections) == 1
@@ -0,0 +1,120 @@
+import pytest
+from selenium.common.exceptions import ElementNotInteractableException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+
+FIELD = (By.ID, "email")
+BUTTON = (By.ID, "submit")
+
+
+class FakeElement:
+    """Element that can be detached from the document or hidden."""
+
+    def __init__(self):
+        self.stale = False
+        self.interactable = True
+        self.enabled = True
+        self.clicks = 0
+        self.value = ""
+
+    def _check(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale")
+        if not self.interactable:
+            raise ElementNotInteractableException("hidden")
+
+    def click(self):
+        self._check()
+        # Browsers ignore clicks on disabled buttons without raising
+        if self.enabled:
+            self.clicks += 1
+
+    def clear(self):
+        self._check()
+        self.value = ""
+
+    def send_keys(self, text):
+        self._check()
+        self.value += text
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale")
+        return self.value
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return self.enabled
+
+
+class FakeDriver:
+    """Counts element lookups; each lookup of a locator returns its current element."""
+
+    def __init__(self):
+        self.elements = {FIELD: FakeElement(), BUTTON: FakeElement()}
+        self.lookups = 0
+
+    def find_element(self, by, value):
+        self.lookups += 1
+        return self.elements[(by, value)]
+
+    def refresh(self):
+        pass
+
+    def execute_script(self, script, *args):
+        return "complete"
+
+
+class TestElementCache:
+    def test_repeated_interactions_share_one_lookup(self):
+        driver = FakeDriver()
+        page = BasePage(driver)
+        page.input_text(*FIELD, "user@example.com")
+        assert page.get_text(*FIELD) == "user@example.com"
+        page.input_text(*FIELD, "other@example.com")
+        page.click(*BUTTON)
+        page.click(*BUTTON)
+        assert driver.lookups == 2
+        assert driver.elements[BUTTON].clicks == 2
+
+    def test_stale_handle_is_resolved_again(self):
+        driver = FakeDriver()
+        page = BasePage(driver)
+        page.click(*BUTTON)
+        driver.elements[BUTTON].stale = True
+        driver.elements[BUTTON] = FakeElement()
+        page.click(*BUTTON)
+        assert driver.lookups == 2
+        assert driver.elements[BUTTON].clicks == 1
+
+    def test_not_interactable_handle_waits_again(self):
+        driver = FakeDriver()
+        page = BasePage(driver)
+        page.click(*BUTTON)
+        driver.elements[BUTTON].interactable = False
+        driver.elements[BUTTON] = FakeElement()
+        page.click(*BUTTON)
+        assert driver.elements[BUTTON].clicks == 1
+
+    def test_disabled_handle_waits_until_clickable(self):
+        driver = FakeDriver()
+        page = BasePage(driver)
+        page.find_element(*BUTTON)
+        driver.elements[BUTTON].enabled = False
+        with pytest.raises(TimeoutException):
+            page.click(*BUTTON, timeout=0.2)
+        driver.elements[BUTTON].enabled = True
+        page.click(*BUTTON)
+        assert driver.elements[BUTTON].clicks == 1
+
+    def test_navigation_clears_the_cache(self):
+        driver = FakeDriver()
+        page = BasePage(driver)
+        page.get_text(*FIELD)
+        page.refresh_page()
+        page.get_text(*FIELD)
+        assert driver.lookups == 2
@@ -0,0 +1,51 @@
+from selenium.webdriver.common.by import By
+
+from pages.base_page import FILL_FORM_JS, BasePage
+
+NAME = (By.CSS_SELECTOR, "input[data-qa='signup-name']")
+EMAIL = (By.CSS_SELECTOR, "input[data-qa='signup-email']")
+PHONE = (By.ID, "phone")
+
+
+class FakeElement:
+    def __init__(self):
+        self.value = ""
+
+    def clear(self):
+        self.value = ""
+
+    def send_keys(self, text):
+        self.value += text
+
+
+class FakeDriver:
+    """Runs the fill script against a set of present locators."""
+
+    def __init__(self, present):
+        self.present = present
+        self.scripts = []
+        self.elements = {}
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        return [field for field in args[0] if tuple(field[:2]) not in self.present]
+
+    def find_element(self, by, value):
+        return self.elements.setdefault((by, value), FakeElement())
+
+
+class TestFillForm:
+    def test_fields_set_in_one_script(self):
+        driver = FakeDriver({NAME, EMAIL})
+        BasePage(driver).fill_form({NAME: "Test User", EMAIL: "user@example.com"})
+        assert driver.scripts == [(FILL_FORM_JS, ([[*NAME, "Test User"], [*EMAIL, "user@example.com"]],))]
+        assert driver.elements == {}
+
+    def test_keystroke_and_missing_fields_are_typed(self):
+        driver = FakeDriver({NAME})
+        BasePage(driver).fill_form({NAME: "Test User", EMAIL: "user@example.com", PHONE: "555-0100"},
+                                   keystroke_fields=[PHONE])
+        assert driver.scripts[0][1] == ([[*NAME, "Test User"], [*EMAIL, "user@example.com"]],)
+        assert driver.elements[EMAIL].value == "user@example.com"
+        assert driver.elements[PHONE].value == "555-0100"
+        assert NAME not in driver.elements
@@ -0,0 +1,65 @@
+import json
+
+from utils.network_blocker import BlockedSizes, NetworkBlocker, effective_patterns
+
+ADS = "https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js"
+SITE = "https://automationexercise.com/static/js/main.js"
+
+
+def log_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class FakeDriver:
+    """Serves a canned performance log and records CDP commands."""
+
+    def __init__(self, log):
+        self.log = log
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+        return {}
+
+    def get_log(self, log_type):
+        entries, self.log = self.log, []
+        return entries
+
+
+def page_load(blocked):
+    log = [
+        log_entry("Network.requestWillBeSent", requestId="1", request={"url": SITE}),
+        log_entry("Network.loadingFinished", requestId="1", encodedDataLength=2000),
+        log_entry("Network.requestWillBeSent", requestId="2", request={"url": ADS}),
+        log_entry("Network.requestWillBeSent", requestId="3", request={"url": "data:image/png;base64,AAAA"}),
+    ]
+    if blocked:
+        log.append(log_entry("Network.loadingFailed", requestId="2", blockedReason="inspector"))
+    else:
+        log.append(log_entry("Network.loadingFinished", requestId="2", encodedDataLength=50000))
+    return log
+
+
+class TestNetworkBlocker:
+    def test_allowed_domains_are_never_blocked(self):
+        patterns = effective_patterns(["*googlesyndication.com*", "*automationexercise*", "*google*"],
+                                      ["automationexercise.com", "fonts.googleapis.com"])
+        assert patterns == ["*googlesyndication.com*"]
+
+    def test_apply_sets_blocked_urls(self, tmp_path):
+        blocker = NetworkBlocker(["*doubleclick.net*"], [], BlockedSizes(str(tmp_path / "sizes.json")))
+        driver = FakeDriver([])
+        assert blocker.apply(driver)
+        assert driver.cdp_commands[-1] == ("Network.setBlockedURLs", {"urls": ["*doubleclick.net*"]})
+
+    def test_bytes_saved_estimated_from_unblocked_runs(self, tmp_path):
+        sizes = BlockedSizes(str(tmp_path / "sizes.json"))
+        blocker = NetworkBlocker(["*googlesyndication.com*"], ["automationexercise.com"], sizes)
+
+        unblocked = blocker.page_stats(FakeDriver(page_load(blocked=False)))
+        assert unblocked == {"requests": 2, "bytes": 52000, "blocked_requests": 0, "blocked_bytes": 0}
+        sizes.save()
+
+        reloaded = NetworkBlocker(["*googlesyndication.com*"], [], BlockedSizes(str(tmp_path / "sizes.json")))
+        blocked = reloaded.page_stats(FakeDriver(page_load(blocked=True)))
+        assert blocked == {"requests": 2, "bytes": 2000, "blocked_requests": 1, "blocked_bytes": 50000}
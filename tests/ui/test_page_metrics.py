@@ -0,0 +1,79 @@
+import json
+
+import pytest
+from pages.base_page import BasePage
+from utils.page_metrics import PageMetricsRegistry, PerformanceBudgetExceeded, page_metrics
+
+METRICS = {"ttfb": 120.0, "load": 1800.0, "lcp": 900.0, "cls": 0.02, "tbt": 40.0, "js_heap_used": 5_000_000}
+
+
+class FakeDriver:
+    """Records navigation and returns canned performance metrics."""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.current_url = None
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append(command)
+        return {}
+
+    def get(self, url):
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        return self.metrics
+
+
+class FastPage(BasePage):
+    PERFORMANCE_BUDGET = {"lcp": 500}
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.url = "https://automationexercise.com/fast"
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    page_metrics.reset()
+    yield
+    page_metrics.reset()
+
+
+class TestPageMetrics:
+    def test_open_collects_metrics_per_page(self, monkeypatch):
+        monkeypatch.setattr("config.config.settings.PAGE_BUDGET_MODE", "warn")
+        driver = FakeDriver(METRICS)
+        page = FastPage(driver)
+        page.open()
+        assert driver.current_url == page.url
+        assert driver.cdp_commands[-1] == "Page.addScriptToEvaluateOnNewDocument"
+        assert page.last_metrics == METRICS
+        report = page_metrics.report()["FastPage"]
+        assert report["opens"] == 1
+        assert report["lcp"]["median"] == 900.0
+        # The class budget tightens lcp below the measured 900 ms
+        assert report["budget_violations"] == [{"lcp": {"value": 900.0, "budget": 500}}]
+
+    def test_budget_can_fail_the_test(self, monkeypatch):
+        monkeypatch.setattr("config.config.settings.PAGE_BUDGET_MODE", "fail")
+        with pytest.raises(PerformanceBudgetExceeded, match="lcp=900"):
+            FastPage(FakeDriver(METRICS)).open()
+
+    def test_report_percentiles(self):
+        registry = PageMetricsRegistry()
+        for load in range(1, 11):
+            registry.record("HomePage", {"load": float(load), "tbt": None})
+        report = registry.report()["HomePage"]
+        assert report["load"] == {"median": 5.5, "p90": 10.0, "max": 10.0}
+        assert "tbt" not in report
+
+    def test_json_merge(self):
+        worker, controller = PageMetricsRegistry(), PageMetricsRegistry()
+        worker.record("HomePage", {"load": 2.0}, {"load": (2.0, 1.0)})
+        controller.record("HomePage", {"load": 1.0})
+        controller.merge_json(json.loads(json.dumps(worker.to_json())))
+        report = controller.report()["HomePage"]
+        assert report["opens"] == 2
+        assert report["budget_violations"] == [{"load": {"value": 2.0, "budget": 1.0}}]
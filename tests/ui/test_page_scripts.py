@@ -0,0 +1,78 @@
+"""Runs the in-browser scripts of BasePage in headless Chrome against tests/static/index.html."""
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from utils.page_metrics import page_metrics
+
+NAME = (By.ID, "name")
+EMAIL = (By.NAME, "email")
+MESSAGE = (By.CLASS_NAME, "message")
+SIZE = (By.XPATH, "//select[@id='size']")
+HIDDEN = (By.ID, "hidden")
+DISABLED = (By.CSS_SELECTOR, "#disabled")
+
+
+class StaticPage(BasePage):
+    def __init__(self, driver, url):
+        super().__init__(driver)
+        self.url = url
+
+
+@pytest.fixture
+def page(headless_driver, static_site_url):
+    headless_driver.get(static_site_url)
+    return StaticPage(headless_driver, static_site_url)
+
+
+def value_of(page, locator):
+    return page.driver.find_element(*locator).get_property("value")
+
+
+class TestFillFormScript:
+    def test_sets_values_and_fires_events(self, page):
+        page.fill_form({NAME: "Test User", EMAIL: "user@example.com", MESSAGE: "Hello", SIZE: "M"})
+        assert [value_of(page, locator) for locator in (NAME, EMAIL, MESSAGE, SIZE)] == \
+            ["Test User", "user@example.com", "Hello", "M"]
+        events = page.driver.execute_script("return window.__events;")
+        assert events == [[event, field] for field in ("name", "email", "message", "size")
+                          for event in ("input", "change")]
+
+    @pytest.mark.parametrize("locator", [HIDDEN, DISABLED], ids=["hidden", "disabled"])
+    def test_non_interactable_fields_are_not_filled(self, page, locator):
+        with pytest.raises(WebDriverException):
+            page.fill_form({locator: "value"}, timeout=1)
+        assert value_of(page, locator) == ""
+
+    def test_keystroke_fields_typed(self, page):
+        page.fill_form({NAME: "Test User", EMAIL: "user@example.com"}, keystroke_fields=[EMAIL])
+        assert [value_of(page, NAME), value_of(page, EMAIL)] == ["Test User", "user@example.com"]
+
+
+class TestExtractRowsScript:
+    def test_locators_and_attributes(self, page):
+        rows = page.extract_rows((By.CSS_SELECTOR, "li.item"), {
+            "title": (By.CLASS_NAME, "title"),
+            "sku": (By.CSS_SELECTOR, ".title", "data-sku"),
+            "price": (By.XPATH, ".//span[@class='price']"),
+            "link": (By.LINK_TEXT, "View", "href"),
+            "missing": (By.ID, "nope")
+        })
+        assert [row["title"] for row in rows] == ["First", "Second", "Third"]
+        assert [row["sku"] for row in rows] == ["A1", "B2", "C3"]
+        assert rows[1]["price"] == "Rs. 200"
+        assert rows[2]["link"].endswith("/product/3")
+        assert all(row["missing"] is None for row in rows)
+
+
+class TestMetricsScripts:
+    def test_open_collects_navigation_metrics(self, page):
+        page.open()
+        metrics = page.last_metrics
+        assert 0 <= metrics["ttfb"] <= metrics["dom_content_loaded"] <= metrics["load"]
+        assert metrics["transfer_size"] >= 0
+        assert metrics["cls"] == 0
+        # The early observer was installed through CDP, so long tasks are counted
+        assert metrics["tbt"] == 0
+        assert metrics in page_metrics.samples("StaticPage")
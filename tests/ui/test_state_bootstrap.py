@@ -0,0 +1,103 @@
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+
+import pytest
+from utils.api_client import APIClient
+from utils.http_cache import ResponseCache
+from utils.latency import LatencyRecorder, latency_recorder
+from utils.state_bootstrap import BootstrapError, StateBootstrap
+
+LOGIN_FORM = (
+    '<form action="/login" method="POST">'
+    '<input type="hidden" name="csrfmiddlewaretoken" value="form-token">'
+    '</form>'
+)
+
+
+class ShopHandler(BaseHTTPRequestHandler):
+    """Minimal login form with a CSRF token and a session-keyed cart"""
+    protocol_version = "HTTP/1.1"
+    carts = {}
+
+    def _session(self):
+        cookies = dict(part.strip().split("=", 1) for part in self.headers.get("Cookie", "").split(";") if "=" in part)
+        return cookies.get("sessionid")
+
+    def _reply(self, body, cookies=()):
+        content = body.encode()
+        self.send_response(200)
+        for cookie in cookies:
+            self.send_header("Set-Cookie", cookie)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        if self.path == "/login":
+            self._reply(LOGIN_FORM, ["csrftoken=cookie-token; Path=/"])
+        elif self.path.startswith("/add_to_cart/"):
+            session = self._session() or "anonymous"
+            self.carts.setdefault(session, []).append(int(self.path.rsplit("/", 1)[1]))
+            self._reply("Added", [f"sessionid={session}; Path=/; HttpOnly"])
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers.get("Content-Length") or 0)).decode())
+        valid = form.get("csrfmiddlewaretoken") == ["form-token"] and form.get("password") == ["secret"]
+        if valid and self.headers.get("Referer", "").endswith("/login"):
+            self._reply(f"Logged in as {form['email'][0]}", ["sessionid=user-session; Path=/; HttpOnly"])
+        else:
+            self._reply(LOGIN_FORM)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeDriver:
+    """Records the cookies set through CDP."""
+
+    def __init__(self):
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+        return {}
+
+
+@pytest.fixture(scope="module")
+def shop_url(serve):
+    with serve(ShopHandler) as base_url:
+        yield base_url
+
+
+class TestStateBootstrap:
+    def test_login_and_cart_share_the_session(self, shop_url):
+        bootstrap = StateBootstrap(shop_url).login("user@example.com", "secret").add_to_cart(1, 2, quantity=2)
+        assert ShopHandler.carts["user-session"] == [1, 1, 2, 2]
+        assert bootstrap.session.cookies.get("sessionid") == "user-session"
+
+    def test_shared_client_keeps_its_cache_but_cart_bypasses_it(self, shop_url):
+        cache = ResponseCache(default_ttl=60)
+        client = APIClient(shop_url, cache=cache, latency=LatencyRecorder())
+        StateBootstrap(shop_url, api_client=client).add_to_cart(7, quantity=3)
+        assert client.cache is cache
+        assert ShopHandler.carts["anonymous"].count(7) == 3
+
+    def test_own_client_stays_out_of_the_latency_report(self, shop_url):
+        before = latency_recorder.histogram("GET", "/login").count
+        bootstrap = StateBootstrap(shop_url).login("user@example.com", "secret")
+        assert bootstrap.api_client.latency is not latency_recorder
+        assert latency_recorder.histogram("GET", "/login").count == before
+
+    def test_rejected_login_raises(self, shop_url):
+        with pytest.raises(BootstrapError):
+            StateBootstrap(shop_url).login("user@example.com", "wrong")
+
+    def test_cookies_injected_through_cdp(self, shop_url):
+        driver = FakeDriver()
+        StateBootstrap(shop_url).login("user@example.com", "secret").inject(driver)
+        command, params = driver.cdp_commands[-1]
+        assert command == "Network.setCookies"
+        session = next(cookie for cookie in params["cookies"] if cookie["name"] == "sessionid")
+        assert session["value"] == "user-session"
+        assert session["httpOnly"] and session["path"] == "/"
@@ -0,0 +1,57 @@
+"""
+Test accounts on automationexercise.com, created through the site's public API.
+
+Under ``--parallel`` every xdist worker logs in with an account of its own
+(TEST_USER_EMAIL_PER_WORKER), so carts of concurrent tests never mix. Those
+accounts are created on first use with POST /api/createAccount; the API
+answers 200 with a responseCode in the body, 400 when the email is taken.
+"""
+from typing import Dict, Optional
+import logging
+
+from config.config import settings
+from utils.api_client import APIClient
+from utils.latency import LatencyRecorder
+
+# Profile fields the createAccount API requires besides name, email and password
+ACCOUNT_PROFILE = {
+    "title": "Mr",
+    "birth_date": "1",
+    "birth_month": "1",
+    "birth_year": "1990",
+    "firstname": "Test",
+    "lastname": "User",
+    "company": "Test",
+    "address1": "1 Test Street",
+    "address2": "",
+    "country": "United States",
+    "zipcode": "10001",
+    "state": "New York",
+    "city": "New York",
+    "mobile_number": "5550100"
+}
+
+logger = logging.getLogger(__name__)
+
+
+class AccountError(Exception):
+    """Raised when a test account can neither be created nor found"""
+
+
+def ensure_account(user: Dict[str, str], api_client: Optional[APIClient] = None) -> bool:
+    """
+    Create the account of user unless it already exists; True if it was created
+    """
+    # Set-up traffic stays out of the session latency report
+    client = api_client or APIClient(settings.BASE_URL, cassette_mode="off", latency=LatencyRecorder())
+    response = client.post(
+        "/api/createAccount",
+        data={**ACCOUNT_PROFILE, "name": user["name"], "email": user["email"], "password": user["password"]}
+    )
+    body = response.json()
+    if body.get("responseCode") == 201:
+        logger.info(f"Created test account {user['email']}")
+        return True
+    if body.get("responseCode") == 400 and "exists" in body.get("message", "").lower():
+        return False
+    raise AccountError(f"Could not create test account {user['email']}: {body.get('message')}")
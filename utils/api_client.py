@@ -1,14 +1,89 @@
 import requests
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 import logging
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+from config.config import settings
+from utils.cassette import CassetteAdapter, build_response, cassette_for
+from utils.http_cache import ResponseCache, cache_key
+from utils.latency import LatencyRecorder, latency_recorder
+from utils.json_stream import iter_json_array
+from utils.pagination import PagePagination, Pagination
+from utils.rate_limit import RateLimiter
+from utils.request_log import RequestLog
+from utils.timing import TimedHTTPAdapter
+from utils.validation import get_type_adapter, validate_content
+import queue
+import threading
 import time
 
+# Marks the end of a paginated walk in the prefetch queue
+_PAGES_DONE = object()
+
+# (method, endpoint) or (method, endpoint, request kwargs) for APIClient.batch
+BatchRequest = Union[Tuple[str, str], Tuple[str, str, Dict[str, Any]]]
+
+
+class BatchResult:
+    """
+    Outcome of one request of a batch: either a response or the error it raised
+    """
+
+    def __init__(self, index: int, response: Optional[requests.Response] = None,
+                 error: Optional[Exception] = None):
+        self.index = index
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class APIClient:
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        latency: Optional[LatencyRecorder] = None,
+        cassette_mode: Optional[str] = None,
+        cache: Optional[ResponseCache] = None
+    ):
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
         self.logger = logging.getLogger(__name__)
+        self.request_log = RequestLog(self.logger)
+        self.latency = latency or latency_recorder
+        self.pool_maxsize = pool_maxsize or settings.API_POOL_MAXSIZE
+        self.cache = cache or (ResponseCache.shared() if settings.API_CACHE_ENABLED else None)
+
+        # Retries only apply to idempotent methods (urllib3's default allow-list). Read
+        # timeouts are not retried: that would multiply API_READ_TIMEOUT and surface
+        # as a ConnectionError instead of requests' ReadTimeout
+        retries = Retry(
+            total=settings.API_MAX_RETRIES if max_retries is None else max_retries,
+            read=False,
+            backoff_factor=settings.API_RETRY_BACKOFF,
+            status_forcelist=settings.API_RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False
+        )
+        adapter = TimedHTTPAdapter(
+            pool_connections=pool_connections or settings.API_POOL_CONNECTIONS,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=settings.API_POOL_BLOCK,
+            max_retries=retries
+        )
+
+        cassette_mode = cassette_mode or settings.API_CASSETTE_MODE
+        if cassette_mode != "off":
+            adapter = CassetteAdapter(cassette_for(self.base_url), cassette_mode, inner=adapter)
+
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _make_request(
         self,
@@ -16,40 +91,278 @@ class APIClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        timeout: int = 30
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        response_model: Any = None,
+        json_schema: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        use_cache: bool = True
     ) -> requests.Response:
         """
-        Make HTTP request with proper error handling and logging
+        Make HTTP request with proper error handling and logging.
+
+        When response_model (a pydantic model or type such as List[Post])
+        or json_schema is given, the body is validated with a cached
+        validator and the result is stored on response.model. With
+        stream=True the body is left unread and validation is skipped.
+
+        With a response cache, fresh GETs are served without a request
+        (response.from_cache is True), stale ones are revalidated, and any
+        other method invalidates the cached resource and its collection.
+        use_cache=False sends a GET that changes server state straight to
+        the server.
+
+        Latency is measured with the monotonic perf_counter_ns clock and
+        response.timings breaks it down into dns/connect/tls/send/wait/body
+        phases (see utils.timing); the phases are aggregated in the latency
+        report as well.
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if endpoint.startswith(("http://", "https://")):
+            url = endpoint
+        else:
+            url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if timeout is None:
+            timeout = (settings.API_CONNECT_TIMEOUT, settings.API_READ_TIMEOUT)
+
+        key = cached = None
+        if self.cache is not None and use_cache and method == "GET" and not stream:
+            key = cache_key(url, params)
+            cached = self.cache.lookup(key)
+            if cached is not None and not cached.is_fresh():
+                headers = {**(headers or {}), **cached.conditional_headers()}
         
+        start_ns = time.perf_counter_ns()
         try:
-            self.logger.info(f"Making {method} request to {url}")
-            start_time = time.time()
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                headers=headers,
-                timeout=timeout
-            )
-            response_time = time.time() - start_time
-            response.elapsed_time = response_time
-            self.logger.info(f"Request completed in {response_time:.2f} seconds")
+            if cached is not None and cached.is_fresh():
+                response = self._response_from_cache(cached)
+                response.elapsed_time = 0.0
+                self.request_log.completed(method, url, response.status_code, 0.0, from_cache=True)
+            else:
+                self.request_log.started(method, url)
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    data=data,
+                    headers=headers,
+                    timeout=timeout,
+                    stream=stream
+                )
+                end_ns = time.perf_counter_ns()
+                response_time = (end_ns - start_ns) / 1e9
+                # Cassette replays never reach the transport, so they carry no timings
+                timings = getattr(response, "timings", None)
+                if timings is not None:
+                    timings.finish(start_ns, end_ns)
+                if cached is not None and response.status_code == 304:
+                    response = self._response_from_cache(self.cache.refresh(cached, response))
+                    response.timings = timings
+                elif key is not None:
+                    self.cache.store(key, response)
+                elif self.cache is not None and method not in ("GET", "HEAD", "OPTIONS"):
+                    self.cache.invalidate(url)
+                response.elapsed_time = response_time
+                self.latency.record(method, endpoint, response_time, timings.as_dict() if timings else None)
+                self.request_log.completed(method, url, response.status_code, response_time)
+            if stream and not response.ok:
+                # The caller never gets to read or close a failed stream; release its connection
+                response.close()
             response.raise_for_status()
+            if not stream and (response_model is not None or json_schema is not None):
+                response.model = validate_content(response.content, response_model, json_schema)
             return response
         except RequestException as e:
-            self.logger.error(f"Request failed: {str(e)}")
+            self.request_log.failed(method, url, e, (time.perf_counter_ns() - start_ns) / 1e9)
             raise
 
+    def _response_from_cache(self, entry) -> requests.Response:
+        response = build_response(None, entry.status, dict(entry.headers), entry.content,
+                                  reason=entry.reason, url=entry.key)
+        response.from_cache = True
+        return response
+
+    def stream_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        item_model: Any = None,
+        chunk_size: int = 64 * 1024,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Stream a JSON array response, yielding items one at a time.
+
+        The body is downloaded and parsed incrementally, so memory stays flat
+        regardless of payload size. With item_model each item is validated
+        with the cached TypeAdapter for that model.
+        """
+        adapter = get_type_adapter(item_model) if item_model is not None else None
+        response = self._make_request("GET", endpoint, params=params, stream=True, **kwargs)
+        with response:
+            for item in iter_json_array(response.iter_content(chunk_size)):
+                yield adapter.validate_python(item) if adapter else item
+
+    def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        pagination: Optional[Pagination] = None,
+        prefetch: int = 1,
+        **kwargs
+    ) -> Iterator[requests.Response]:
+        """
+        Walk a paginated collection, yielding one response per page.
+
+        Pages are fetched by a background thread up to ``prefetch`` pages
+        ahead of the caller, so the next page downloads while the current one
+        is processed. Each response carries its parsed items as
+        response.items. prefetch=0 fetches pages synchronously.
+        """
+        pagination = pagination or PagePagination()
+
+        def fetch_pages():
+            target, page_params = endpoint, {**(params or {}), **pagination.first_params()}
+            while True:
+                response = self._make_request("GET", target, params=page_params, **kwargs)
+                response.items = pagination.items(response)
+                yield response
+                next_page = pagination.next_page(target, page_params, response)
+                if next_page is None:
+                    return
+                target, page_params = next_page
+
+        if prefetch <= 0:
+            yield from fetch_pages()
+            return
+
+        pages = queue.Queue(maxsize=prefetch)
+        stopped = threading.Event()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for page in fetch_pages():
+                    if not put(page):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(_PAGES_DONE)
+
+        threading.Thread(target=produce, name="page-prefetch", daemon=True).start()
+        try:
+            while True:
+                page = pages.get()
+                if page is _PAGES_DONE:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            stopped.set()
+
+    def iter_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        pagination: Optional[Pagination] = None,
+        item_model: Any = None,
+        prefetch: int = 1,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Walk a paginated collection item by item, optionally validating each item
+        """
+        adapter = get_type_adapter(item_model) if item_model is not None else None
+        for page in self.iter_pages(endpoint, params, pagination, prefetch, **kwargs):
+            for item in page.items:
+                yield adapter.validate_python(item) if adapter else item
+
+    def batch(
+        self,
+        batch_requests: Iterable[BatchRequest],
+        max_workers: Optional[int] = None,
+        rate_limit: Optional[float] = None
+    ) -> List[BatchResult]:
+        """
+        Send many requests concurrently and return their results in input order.
+
+        Requests run on a thread pool sharing this client's session, so
+        max_workers defaults to the connection pool size; more workers than
+        pooled connections would open throwaway connections. With rate_limit
+        set, request starts are paced to that many per second. Errors are
+        collected on the result instead of raised.
+        """
+        limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        def send(index: int, request: BatchRequest) -> BatchResult:
+            method, endpoint, kwargs = (*request, {})[:3]
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                return BatchResult(index, response=self._make_request(method.upper(), endpoint, **kwargs))
+            except Exception as e:
+                return BatchResult(index, error=e)
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_maxsize,
+                                thread_name_prefix="api-batch") as executor:
+            futures = [executor.submit(send, index, request) for index, request in enumerate(batch_requests)]
+            results = [future.result() for future in futures]
+        failed = sum(1 for result in results if not result.ok)
+        if failed:
+            self.logger.warning("%d of %d batched requests failed", failed, len(results))
+        return results
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return connection pool utilisation per host.
+
+        in_use counts connections currently checked out, idle counts open
+        keep-alive connections waiting for reuse and connections_created is
+        the number of connections opened over the pool's lifetime.
+        """
+        stats = {}
+        for adapter in set(self.session.adapters.values()):
+            adapter = getattr(adapter, "inner", adapter)
+            if adapter is None:
+                continue
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None or pool.pool is None:
+                    continue
+                maxsize = pool.pool.maxsize
+                stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                    "maxsize": maxsize,
+                    "in_use": maxsize - pool.pool.qsize(),
+                    "idle": sum(1 for conn in list(pool.pool.queue) if conn is not None),
+                    "connections_created": pool.num_connections,
+                    "requests": pool.num_requests
+                }
+        return stats
+
     def check_response_time(self, response: requests.Response, max_time: float) -> bool:
         """
         Check if response time is within acceptable limits
         """
         return response.elapsed_time <= max_time
 
+    def check_percentile(self, method: str, endpoint: str, percentile: float, max_time: float) -> bool:
+        """
+        Check if the given latency percentile of an endpoint is within limits
+        """
+        return self.latency.percentile(method, endpoint, percentile) <= max_time
+
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
         return self._make_request("GET", endpoint, params=params, **kwargs)
 
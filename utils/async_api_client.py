@@ -0,0 +1,197 @@
+import aiohttp
+import asyncio
+import json as jsonlib
+from typing import Dict, Any, Optional, Awaitable, List
+from config.config import settings
+from utils.cassette import Cassette, request_key
+from utils.latency import LatencyRecorder, latency_recorder
+from utils.request_log import RequestLog
+from utils.timing import PhaseTimings, timing_trace_config
+import logging
+import time
+
+
+class AsyncResponse:
+    """
+    Fully read HTTP response returned by AsyncAPIClient.
+
+    Mirrors the parts of requests.Response the test suites rely on.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        reason: Optional[str],
+        headers: Dict[str, str],
+        content: bytes,
+        elapsed_time: float,
+        timings: Optional[PhaseTimings] = None
+    ):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.elapsed_time = elapsed_time
+        self.timings = timings
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content)
+
+
+class AsyncAPIClient:
+    """
+    asyncio counterpart of APIClient.
+
+    Requests share one keep-alive connection pool and at most
+    ``max_concurrency`` of them are in flight at once, so callers can fan out
+    hundreds of calls with asyncio.gather without overwhelming the server.
+    Responses are recorded into ``cassette`` when one is given; replays go
+    through a CassetteServer instead (see utils.cassette).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_concurrency: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30,
+        latency: Optional[LatencyRecorder] = None,
+        cassette: Optional[Cassette] = None
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.logger = logging.getLogger(__name__)
+        self.request_log = RequestLog(self.logger)
+        self.latency = latency or latency_recorder
+        self.cassette = cassette
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector, trace_configs=[timing_trace_config()])
+        return self._session
+
+    async def close(self):
+        """
+        Close the underlying session and its connection pool
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncResponse:
+        """
+        Make HTTP request with bounded concurrency, error handling and logging
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        session = self._get_session()
+        if timeout is None:
+            client_timeout = aiohttp.ClientTimeout(
+                sock_connect=settings.API_CONNECT_TIMEOUT,
+                sock_read=settings.API_READ_TIMEOUT
+            )
+        else:
+            client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        async with self._semaphore:
+            timings = PhaseTimings()
+            start_ns = time.perf_counter_ns()
+            try:
+                self.request_log.started(method, url)
+                async with session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                    timeout=client_timeout,
+                    trace_request_ctx=timings
+                ) as raw:
+                    content = await raw.read()
+                    end_ns = time.perf_counter_ns()
+                    timings.finish(start_ns, end_ns)
+                    response_time = (end_ns - start_ns) / 1e9
+                    self.latency.record(method, endpoint, response_time, timings.as_dict())
+                    self.request_log.completed(method, url, raw.status, response_time)
+                    if self.cassette is not None:
+                        body = jsonlib.dumps(json) if json is not None else None
+                        self.cassette.add(request_key(method, str(raw.request_info.url), body),
+                                          raw.status, raw.reason, dict(raw.headers), content)
+                    raw.raise_for_status()
+                    return AsyncResponse(
+                        method=method,
+                        url=str(raw.url),
+                        status_code=raw.status,
+                        reason=raw.reason,
+                        headers=dict(raw.headers),
+                        content=content,
+                        elapsed_time=response_time,
+                        timings=timings
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.request_log.failed(method, url, e, (time.perf_counter_ns() - start_ns) / 1e9)
+                raise
+
+    def check_response_time(self, response: AsyncResponse, max_time: float) -> bool:
+        """
+        Check if response time is within acceptable limits
+        """
+        return response.elapsed_time <= max_time
+
+    def check_percentile(self, method: str, endpoint: str, percentile: float, max_time: float) -> bool:
+        """
+        Check if the given latency percentile of an endpoint is within limits
+        """
+        return self.latency.percentile(method, endpoint, percentile) <= max_time
+
+    async def gather(self, *requests: Awaitable[AsyncResponse], return_exceptions: bool = False) -> List[Any]:
+        """
+        Run request coroutines concurrently and return their results in order
+        """
+        return await asyncio.gather(*requests, return_exceptions=return_exceptions)
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncResponse:
+        return await self._make_request("GET", endpoint, params=params, **kwargs)
+
+    async def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncResponse:
+        return await self._make_request("POST", endpoint, json=json, **kwargs)
+
+    async def put(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> AsyncResponse:
+        return await self._make_request("PUT", endpoint, json=json, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> AsyncResponse:
+        return await self._make_request("DELETE", endpoint, **kwargs)
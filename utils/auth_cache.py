@@ -0,0 +1,174 @@
+"""
+Session-wide cache of authenticated browser state.
+
+Logging in through the UI costs a page load and a form submission. The
+AuthSessionCache does it once per user: after the first login it snapshots
+the browser's cookies and localStorage, and later tests restore the snapshot
+into their (fresh or reset) driver before the first navigation.
+
+A snapshot is dropped and the user logged in again, lazily on the next
+authenticate() call, when:
+
+* one of its cookies has expired, or it is older than AUTH_SNAPSHOT_MAX_AGE,
+* the optional ``validate`` callable rejects it; it is consulted at most
+  every AUTH_SNAPSHOT_VALIDATE_INTERVAL seconds per user,
+* a test calls invalidate() after finding itself logged out.
+"""
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+import json
+import logging
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from config.config import settings
+from utils.state_bootstrap import inject_cookies
+
+# Copies localStorage into the first document of the origin loaded in this tab
+RESTORE_STORAGE_JS = """
+(function (origin, items) {
+    if (location.origin !== origin || sessionStorage.getItem('__authSnapshotRestored')) { return; }
+    Object.keys(items).forEach(function (key) { localStorage.setItem(key, items[key]); });
+    sessionStorage.setItem('__authSnapshotRestored', '1');
+})(%s, %s);
+"""
+
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+
+
+class AuthSnapshot:
+    """Cookies and localStorage of a logged-in browser"""
+
+    def __init__(self, cookies: List[Dict[str, Any]], local_storage: Dict[str, str],
+                 captured_at: Optional[float] = None):
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.captured_at = time.time() if captured_at is None else captured_at
+        self.validated_at = self.captured_at
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Expiry of the first persistent cookie to expire; None for session cookies only"""
+        expiries = [cookie["expires"] for cookie in self.cookies if "expires" in cookie]
+        return min(expiries) if expiries else None
+
+    def is_expired(self, max_age: float, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        if now - self.captured_at > max_age:
+            return True
+        return self.expires_at is not None and now >= self.expires_at
+
+
+def _normalize_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a CDP or WebDriver cookie to the Network.setCookies format"""
+    entry = {field: cookie[field] for field in COOKIE_FIELDS if cookie.get(field) is not None}
+    # CDP reports session cookies with expires -1, WebDriver names the field expiry
+    expires = cookie.get("expires", cookie.get("expiry"))
+    if expires is not None and expires > 0:
+        entry["expires"] = expires
+    return entry
+
+
+class AuthSessionCache:
+    """
+    Logs each user in once and restores the captured state into other drivers
+    """
+
+    def __init__(
+        self,
+        login: Callable[[Any, Dict[str, str]], None],
+        validate: Optional[Callable[[AuthSnapshot], bool]] = None,
+        base_url: Optional[str] = None,
+        max_age: Optional[float] = None,
+        validate_interval: Optional[float] = None
+    ):
+        self.login = login
+        self.validate = validate
+        self.base_url = (base_url or settings.BASE_URL).rstrip("/")
+        self.max_age = settings.AUTH_SNAPSHOT_MAX_AGE if max_age is None else max_age
+        self.validate_interval = (settings.AUTH_SNAPSHOT_VALIDATE_INTERVAL if validate_interval is None
+                                  else validate_interval)
+        self.logger = logging.getLogger(__name__)
+        self._snapshots: Dict[str, AuthSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[AuthSnapshot]:
+        """
+        Return the usable snapshot of a user, dropping it if it has expired
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            return None
+        if snapshot.is_expired(self.max_age):
+            self.logger.info(f"Auth snapshot of {key} expired, logging in again")
+            self.invalidate(key)
+            return None
+        if self.validate is not None and time.time() - snapshot.validated_at >= self.validate_interval:
+            if not self.validate(snapshot):
+                self.logger.info(f"Auth snapshot of {key} was rejected by the server, logging in again")
+                self.invalidate(key)
+                return None
+            snapshot.validated_at = time.time()
+        return snapshot
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._snapshots.pop(key, None)
+
+    def authenticate(self, driver, user: Dict[str, str]) -> AuthSnapshot:
+        """
+        Put the driver in the logged-in state of the user, logging in only
+        when no usable snapshot exists
+        """
+        key = user["email"]
+        snapshot = self.get(key)
+        if snapshot is not None:
+            self.restore(driver, snapshot)
+            return snapshot
+        self.login(driver, user)
+        snapshot = self.capture(driver)
+        with self._lock:
+            self._snapshots[key] = snapshot
+        self.logger.info(f"Captured auth snapshot of {key} ({len(snapshot.cookies)} cookies)")
+        return snapshot
+
+    def capture(self, driver) -> AuthSnapshot:
+        """
+        Snapshot the cookies of the base URL and the localStorage of the current page
+        """
+        cookies = None
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                cookies = driver.execute_cdp_cmd("Network.getCookies", {"urls": [self.base_url]})["cookies"]
+            except WebDriverException as e:
+                self.logger.debug(f"Could not read cookies through CDP: {str(e)}")
+        if cookies is None:
+            cookies = driver.get_cookies()
+        local_storage = {}
+        if urlsplit(driver.current_url).hostname == urlsplit(self.base_url).hostname:
+            local_storage = driver.execute_script("return Object.assign({}, window.localStorage);") or {}
+        return AuthSnapshot([_normalize_cookie(cookie) for cookie in cookies], local_storage)
+
+    def restore(self, driver, snapshot: AuthSnapshot):
+        """
+        Set the snapshot's cookies and localStorage before the next navigation
+        """
+        inject_cookies(driver, snapshot.cookies, self.base_url)
+        if not snapshot.local_storage:
+            return
+        parts = urlsplit(self.base_url)
+        source = RESTORE_STORAGE_JS % (json.dumps(f"{parts.scheme}://{parts.netloc}"),
+                                       json.dumps(snapshot.local_storage))
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                # The pool gives every test a new tab, which drops the script again
+                driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+                return
+            except WebDriverException as e:
+                self.logger.debug(f"Could not install the localStorage restore script: {str(e)}")
+        if urlsplit(driver.current_url).hostname != parts.hostname:
+            driver.get(self.base_url)
+        driver.execute_script(source)
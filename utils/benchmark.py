@@ -0,0 +1,170 @@
+"""
+Pytest plugin for micro-benchmarks of the framework's own hot paths.
+
+Tests marked ``benchmark`` only run with ``--run-benchmarks``. They take the
+``benchmark`` fixture, which times a callable over several rounds (each
+round repeats the call enough times to last BENCHMARK_MIN_ROUND_TIME) and
+compares the median time per call with the stored baseline in
+BENCHMARK_BASELINE_PATH. A result slower than the baseline by more than
+BENCHMARK_TOLERANCE fails the test. Benchmarks without a baseline record
+one; ``--benchmark-save`` re-records all of them.
+
+Baselines are machine-specific: record them on the machine that checks
+them.
+"""
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import json
+import statistics
+import time
+
+import allure
+import pytest
+from filelock import FileLock
+
+from config.config import settings
+
+WARMUP_CALLS = 3
+
+
+class BenchmarkResult:
+    """Per-call timings of one benchmark, in seconds"""
+
+    def __init__(self, name: str, round_times: List[float], iterations: int):
+        self.name = name
+        self.rounds = len(round_times)
+        self.iterations = iterations
+        per_call = [round_time / iterations for round_time in round_times]
+        self.median = statistics.median(per_call)
+        self.min = min(per_call)
+        self.max = max(per_call)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "median": self.median,
+            "min": self.min,
+            "max": self.max,
+            "rounds": self.rounds,
+            "iterations": self.iterations
+        }
+
+
+class BenchmarkSession:
+    """Holds the baseline and the results of the current run"""
+
+    def __init__(self, config):
+        self.path = Path(config.getoption("benchmark_baseline") or settings.BENCHMARK_BASELINE_PATH)
+        self.save = config.getoption("benchmark_save")
+        self.tolerance = settings.BENCHMARK_TOLERANCE
+        self.results: Dict[str, BenchmarkResult] = {}
+        try:
+            self.baseline: Dict[str, Dict[str, Any]] = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.baseline = {}
+
+    def check(self, result: BenchmarkResult):
+        self.results[result.name] = result
+        baseline = self.baseline.get(result.name)
+        if baseline is None or self.save:
+            return
+        limit = baseline["median"] * (1 + self.tolerance)
+        if result.median > limit:
+            pytest.fail(
+                f"Benchmark {result.name} regressed: median {result.median * 1e6:.1f}us per call, "
+                f"baseline {baseline['median'] * 1e6:.1f}us (tolerance {self.tolerance:.0%})",
+                pytrace=False
+            )
+
+    def pytest_sessionfinish(self, session):
+        recorded = {name: result.to_json() for name, result in self.results.items()
+                    if self.save or name not in self.baseline}
+        if not recorded:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # xdist workers may finish at the same time
+        with FileLock(str(self.path) + ".lock"):
+            try:
+                baseline = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                baseline = {}
+            baseline.update(recorded)
+            self.path.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        terminalreporter.section("benchmarks")
+        for name, result in sorted(self.results.items()):
+            baseline = self.baseline.get(name)
+            change = f"{result.median / baseline['median'] - 1:+.1%} vs baseline" if baseline else "new baseline"
+            terminalreporter.write_line(
+                f"{name}: median {result.median * 1e6:.1f}us, min {result.min * 1e6:.1f}us "
+                f"({result.rounds}x{result.iterations}) {change}"
+            )
+
+
+class Benchmark:
+    """Callable returned by the benchmark fixture"""
+
+    def __init__(self, name: str, session: BenchmarkSession, rounds: Optional[int] = None):
+        self.name = name
+        self.session = session
+        self.rounds = rounds or settings.BENCHMARK_ROUNDS
+
+    def _iterations(self, func: Callable, args, kwargs) -> int:
+        """Number of calls per round so a round lasts at least BENCHMARK_MIN_ROUND_TIME"""
+        iterations = 1
+        while True:
+            start = time.perf_counter_ns()
+            for _ in range(iterations):
+                func(*args, **kwargs)
+            elapsed = (time.perf_counter_ns() - start) / 1e9
+            if elapsed >= settings.BENCHMARK_MIN_ROUND_TIME:
+                return iterations
+            iterations *= 2 if elapsed <= 0 else min(max(int(settings.BENCHMARK_MIN_ROUND_TIME / elapsed), 2), 10)
+
+    def __call__(self, func: Callable, *args, **kwargs) -> BenchmarkResult:
+        for _ in range(WARMUP_CALLS):
+            func(*args, **kwargs)
+        iterations = self._iterations(func, args, kwargs)
+        round_times = []
+        for _ in range(self.rounds):
+            start = time.perf_counter_ns()
+            for _ in range(iterations):
+                func(*args, **kwargs)
+            round_times.append((time.perf_counter_ns() - start) / 1e9)
+        result = BenchmarkResult(self.name, round_times, iterations)
+        allure.attach(json.dumps(result.to_json(), indent=2), name=f"Benchmark {self.name}",
+                      attachment_type=allure.attachment_type.JSON)
+        self.session.check(result)
+        return result
+
+
+@pytest.fixture
+def benchmark(request) -> Benchmark:
+    """Time a callable and compare it with the stored baseline"""
+    session = request.config.pluginmanager.get_plugin("benchmark-session")
+    return Benchmark(request.node.nodeid, session)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "framework benchmarks")
+    group.addoption("--run-benchmarks", action="store_true", default=False,
+                    help="Run tests marked benchmark")
+    group.addoption("--benchmark-save", action="store_true", default=False,
+                    help="Record new baselines instead of comparing against them")
+    group.addoption("--benchmark-baseline", default=None,
+                    help="Baseline file (defaults to BENCHMARK_BASELINE_PATH)")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(BenchmarkSession(config), "benchmark-session")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("run_benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --run-benchmarks")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
@@ -0,0 +1,286 @@
+"""
+Record/replay layer for APIClient.
+
+In record mode every request goes to the real server and the response is
+captured into a gzip-compressed JSON cassette (AsyncAPIClient records into
+the same cassette as APIClient). In replay mode responses are served from
+the cassette without touching the network, either in-process through
+CassetteAdapter or over localhost through CassetteServer (for clients that
+cannot mount a requests adapter, such as AsyncAPIClient).
+
+Requests are matched on method, path, sorted query and a hash of the body;
+the host is ignored so a cassette recorded against the real API can be
+served from the localhost stub.
+"""
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import requests
+from filelock import FileLock
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from config.config import settings
+
+# Bodies are stored decoded, so transport-level headers no longer apply
+DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMiss(ConnectionError):
+    """Raised in replay mode when no recorded response matches a request"""
+
+
+def _body_hash(body) -> str:
+    if not body:
+        return ""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    try:
+        # Key order must not matter for JSON payloads
+        body = json.dumps(json.loads(body), sort_keys=True).encode("utf-8")
+    except ValueError:
+        pass
+    return hashlib.sha1(body).hexdigest()
+
+
+def request_key(method: str, url: str, body=None) -> str:
+    """Return the matching key for a request"""
+    parts = urlsplit(url)
+    key = f"{method.upper()} {parts.path or '/'}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    if query:
+        key += f"?{query}"
+    body_hash = _body_hash(body)
+    if body_hash:
+        key += f" {body_hash}"
+    return key
+
+
+def build_response(
+    request: Optional[requests.PreparedRequest],
+    status_code: int,
+    headers: Dict[str, str],
+    content: bytes,
+    reason: Optional[str] = None,
+    url: Optional[str] = None
+) -> requests.Response:
+    """Build a fully read requests.Response without a network connection"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response._content_consumed = True
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = url or request.url
+    response.request = request
+    response.elapsed = timedelta(0)
+    return response
+
+
+class Cassette:
+    """
+    On-disk store of recorded request/response pairs.
+
+    Identical requests recorded several times are replayed in order; once the
+    recordings are exhausted the last one keeps being served.
+    """
+
+    _open: Dict[str, "Cassette"] = {}
+    _open_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._interactions: Dict[str, List[dict]] = {}
+        self._recorded: Dict[str, List[dict]] = {}
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def open(cls, path: str) -> "Cassette":
+        """
+        Return the shared cassette for a path, so all clients record into one store
+        """
+        with cls._open_lock:
+            key = str(Path(path).resolve())
+            if key not in cls._open:
+                cls._open[key] = cls(path)
+            return cls._open[key]
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            self._interactions = json.load(f)["interactions"]
+
+    def find(self, key: str) -> Optional[dict]:
+        with self._lock:
+            recordings = self._interactions.get(key)
+            if not recordings:
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            return recordings[min(position, len(recordings) - 1)]
+
+    def add(self, key: str, status_code: int, reason: Optional[str], headers: Dict[str, str], content: bytes):
+        entry = {
+            "status": status_code,
+            "reason": reason,
+            "headers": {name: value for name, value in headers.items() if name.lower() not in DROPPED_HEADERS},
+            "body": base64.b64encode(content).decode("ascii")
+        }
+        with self._lock:
+            self._recorded.setdefault(key, []).append(entry)
+            self._interactions.setdefault(key, []).append(entry)
+
+    def save(self):
+        """
+        Merge newly recorded interactions into the file on disk
+        """
+        with self._lock:
+            recorded, self._recorded = self._recorded, {}
+        if not recorded:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # xdist workers may record into the same cassette concurrently
+        with FileLock(str(self.path) + ".lock"):
+            interactions = {}
+            if self.path.exists():
+                with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                    interactions = json.load(f)["interactions"]
+            for key, entries in recorded.items():
+                interactions[key] = entries
+            with gzip.open(self.path, "wt", encoding="utf-8") as f:
+                json.dump({"version": 1, "interactions": interactions}, f, separators=(",", ":"))
+        logger.info(f"Saved {len(recorded)} recorded requests to {self.path}")
+
+    @classmethod
+    def save_all(cls):
+        with cls._open_lock:
+            cassettes = list(cls._open.values())
+        for cassette in cassettes:
+            cassette.save()
+
+
+atexit.register(Cassette.save_all)
+
+
+def cassette_for(base_url: str) -> Cassette:
+    """Return the shared cassette recording the traffic of an API host"""
+    host = urlsplit(base_url).netloc.replace(":", "_")
+    return Cassette.open(os.path.join(settings.API_CASSETTE_DIR, f"{host}.json.gz"))
+
+
+def _response_from_entry(request: requests.PreparedRequest, entry: dict) -> requests.Response:
+    return build_response(
+        request,
+        status_code=entry["status"],
+        headers=entry["headers"],
+        content=base64.b64decode(entry["body"]),
+        reason=entry["reason"]
+    )
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    requests transport adapter that records to or replays from a cassette
+    """
+
+    def __init__(self, cassette: Cassette, mode: str, inner: Optional[BaseAdapter] = None):
+        super().__init__()
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.cassette = cassette
+        self.mode = mode
+        self.inner = inner
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        key = request_key(request.method, request.url, request.body)
+        if self.mode == "replay":
+            entry = self.cassette.find(key)
+            if entry is None:
+                raise CassetteMiss(f"No recorded response for {key} in {self.cassette.path}", request=request)
+            return _response_from_entry(request, entry)
+
+        response = self.inner.send(request, **kwargs)
+        self.cassette.add(key, response.status_code, response.reason, dict(response.headers), response.content)
+        return response
+
+    def close(self):
+        if self.inner is not None:
+            self.inner.close()
+
+
+class CassetteServer:
+    """
+    Localhost HTTP stub serving responses from a cassette
+    """
+
+    def __init__(self, cassette: Cassette, host: str = "127.0.0.1", port: int = 0):
+        self.cassette = cassette
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        cassette = self.cassette
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                entry = cassette.find(request_key(self.command, self.path, body))
+                if entry is None:
+                    self.send_error(599, "No recorded response")
+                    return
+                content = base64.b64decode(entry["body"])
+                self.send_response(entry["status"], entry["reason"])
+                for name, value in entry["headers"].items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _serve
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return Handler
+
+    def start(self) -> "CassetteServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "CassetteServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
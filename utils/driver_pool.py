@@ -0,0 +1,169 @@
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Set
+from urllib.parse import urlsplit
+import logging
+import threading
+import weakref
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.config import settings
+
+# Storage types wiped per origin through the CDP Storage domain
+STORAGE_TYPES = "local_storage,indexeddb,websql,cache_storage,service_workers"
+
+CLEAR_STORAGE_JS = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+# Pool that handed out each live driver, so page objects can report the origins they open
+_owners: "weakref.WeakValueDictionary[int, DriverPool]" = weakref.WeakValueDictionary()
+
+
+class DriverPool:
+    """
+    Pool of warm WebDriver instances shared across tests.
+
+    Browsers are launched lazily through ``factory`` and handed back to the
+    pool after each test. On release the browser state (cookies, storage and
+    extra windows) is reset so the next test starts from a clean slate.
+    A browser is recycled after ``max_uses`` tests or as soon as it stops
+    responding.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        max_size: Optional[int] = None,
+        max_uses: Optional[int] = None
+    ):
+        self.factory = factory
+        self.max_size = max_size or settings.DRIVER_POOL_SIZE
+        self.max_uses = max_uses or settings.DRIVER_MAX_USES
+        self.logger = logging.getLogger(__name__)
+        self._idle: Deque[WebDriver] = deque()
+        self._uses: Dict[int, int] = {}
+        self._origins: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self) -> WebDriver:
+        """
+        Return a ready-to-use driver, launching a new one if none is idle
+        """
+        while True:
+            with self._lock:
+                driver = self._idle.popleft() if self._idle else None
+            if driver is None:
+                driver = self.factory()
+                with self._lock:
+                    self._uses[id(driver)] = 0
+                    self._origins[id(driver)] = set()
+                self.logger.info(f"Launched new browser (session {driver.session_id})")
+                _owners[id(driver)] = self
+                return driver
+            if self._is_alive(driver):
+                _owners[id(driver)] = self
+                return driver
+            self.logger.warning(f"Discarding unresponsive browser (session {driver.session_id})")
+            self._discard(driver)
+
+    def release(self, driver: WebDriver, discard: bool = False):
+        """
+        Return a driver to the pool, resetting its state or recycling it
+        """
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            uses = self._uses[id(driver)]
+        if discard or uses >= self.max_uses:
+            self._discard(driver)
+            return
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            self.logger.warning(f"Browser reset failed, recycling it: {str(e)}")
+            self._discard(driver)
+            return
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(driver)
+                return
+        self._discard(driver)
+
+    def track_origin(self, driver: WebDriver, url: str):
+        """
+        Remember an origin whose storage must be wiped on reset
+        """
+        parts = urlsplit(url)
+        if parts.scheme in ("http", "https"):
+            with self._lock:
+                self._origins.setdefault(id(driver), set()).add(f"{parts.scheme}://{parts.netloc}")
+
+    def reset(self, driver: WebDriver):
+        """
+        Reset cookies, local/session storage and open windows of a driver
+        """
+        self.track_origin(driver, driver.current_url)
+        self.track_origin(driver, settings.BASE_URL)
+
+        # A fresh tab gets a fresh sessionStorage for every origin
+        handles = driver.window_handles
+        driver.switch_to.new_window("tab")
+        fresh_handle = driver.current_window_handle
+        for handle in handles:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh_handle)
+
+        with self._lock:
+            origins = self._origins.pop(id(driver), set())
+            self._origins[id(driver)] = set()
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in origins:
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": STORAGE_TYPES}
+                )
+        else:
+            # Without CDP, cookies and storage are only reachable from a page of their own origin
+            for origin in origins:
+                driver.get(origin)
+                driver.delete_all_cookies()
+                driver.execute_script(CLEAR_STORAGE_JS)
+            driver.get("about:blank")
+
+    def close(self):
+        """
+        Quit every idle browser held by the pool
+        """
+        with self._lock:
+            drivers = list(self._idle)
+            self._idle.clear()
+        for driver in drivers:
+            self._discard(driver)
+
+    def _is_alive(self, driver: WebDriver) -> bool:
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver: WebDriver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._origins.pop(id(driver), None)
+        _owners.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            self.logger.warning(f"Failed to quit browser: {str(e)}")
+
+
+def track_origin(driver: WebDriver, url: str):
+    """
+    Record an origin opened by a pooled driver, so its storage is wiped when
+    the driver goes back to the pool; a no-op for drivers outside a pool
+    """
+    pool = _owners.get(id(driver))
+    if pool is not None:
+        pool.track_origin(driver, url)
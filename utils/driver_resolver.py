@@ -0,0 +1,79 @@
+from pathlib import Path
+from typing import Dict, Optional
+import json
+import logging
+import os
+
+from filelock import FileLock
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+from config.config import settings
+
+MANIFEST_NAME = "chromedriver-manifest.json"
+
+logger = logging.getLogger(__name__)
+
+# Paths resolved by this process per browser type, so repeated fixture calls
+# skip version detection and the disk entirely
+_resolved: Dict[str, str] = {}
+
+
+def _cache_dir() -> Path:
+    return Path(os.path.expanduser(settings.DRIVER_CACHE_DIR))
+
+
+def _browser_version(chrome_type: str) -> Optional[str]:
+    """Return the installed browser major version, if it can be detected"""
+    try:
+        version = OperationSystemManager().get_browser_version_from_os(chrome_type)
+    except Exception as e:
+        logger.warning(f"Could not detect {chrome_type} version: {str(e)}")
+        return None
+    return version.split(".")[0] if version else None
+
+
+def _read_manifest(path: Path) -> Dict[str, str]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def resolve_chromedriver(chrome_type: str = ChromeType.GOOGLE) -> str:
+    """
+    Return a chromedriver binary path, downloading it at most once per machine.
+
+    Resolved paths are kept in an on-disk manifest keyed by browser type and
+    major version. The manifest is guarded by a file lock so parallel xdist
+    workers wait for a single download instead of racing each other. Once a
+    matching entry exists the resolver never touches the network.
+    """
+    if chrome_type in _resolved:
+        return _resolved[chrome_type]
+
+    version = _browser_version(chrome_type)
+    key = f"{chrome_type}-{version or 'unknown'}"
+
+    cache_dir = _cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = cache_dir / MANIFEST_NAME
+
+    with FileLock(str(manifest_path) + ".lock", timeout=settings.DRIVER_CACHE_LOCK_TIMEOUT):
+        manifest = _read_manifest(manifest_path)
+        path = manifest.get(key)
+        if not path and version is None:
+            # Version detection failed: fall back to any driver for this browser type
+            path = next((p for k, p in manifest.items() if k.startswith(f"{chrome_type}-")), None)
+        if path and os.access(path, os.X_OK):
+            logger.info(f"Using cached chromedriver for {key}: {path}")
+        else:
+            logger.info(f"Resolving chromedriver for {key} via webdriver-manager")
+            path = ChromeDriverManager(chrome_type=chrome_type).install()
+            manifest[key] = path
+            tmp_path = manifest_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(manifest, indent=2))
+            tmp_path.replace(manifest_path)
+
+    _resolved[chrome_type] = path
+    return path
@@ -0,0 +1,231 @@
+"""
+Pytest plugin keeping a history of test durations.
+
+Every run appends the setup/call/teardown durations and outcome of each
+test to a SQLite database (TEST_DURATIONS_PATH). The history drives:
+
+* sharding of ``--parallel`` runs (see utils.sharding),
+* ``--duration-order longest`` (longest tests first, the default under
+  ``--parallel``) and ``--duration-order fastest-fail`` (tests that failed
+  recently first, then the quickest ones, for smoke runs),
+* duration regression flags: a test whose total duration exceeds its
+  historical mean by more than DURATION_REGRESSION_SIGMA standard
+  deviations (and DURATION_REGRESSION_MIN_DELTA seconds) is listed in the
+  terminal summary.
+
+Only the xdist controller (or a plain pytest process) writes the history.
+"""
+from pathlib import Path
+from typing import Dict, List, Optional
+import math
+import re
+import sqlite3
+import time
+
+import pytest
+
+from config.config import settings
+
+PHASES = ("setup", "call", "teardown")
+# xdist appends "@<group>" to the nodeids of tests marked with xdist_group
+XDIST_GROUP_SUFFIX = re.compile(r"@[\w.-]+$")
+ORDERS = ("none", "longest", "fastest-fail")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS durations (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    setup REAL NOT NULL DEFAULT 0,
+    call REAL NOT NULL DEFAULT 0,
+    teardown REAL NOT NULL DEFAULT 0,
+    outcome TEXT NOT NULL,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE INDEX IF NOT EXISTS durations_nodeid ON durations (nodeid, run_id);
+"""
+
+
+class DurationHistory:
+    """Duration statistics of one test over its recent runs"""
+
+    def __init__(self, totals: List[float], failures: int):
+        self.runs = len(totals)
+        self.mean = sum(totals) / self.runs
+        variance = sum((total - self.mean) ** 2 for total in totals) / (self.runs - 1) if self.runs > 1 else 0.0
+        self.stdev = math.sqrt(variance)
+        self.failure_rate = failures / self.runs
+
+    def is_regression(self, duration: float, sigma: float, min_delta: float, min_runs: int) -> bool:
+        """
+        True if duration is an outlier against at least min_runs runs of history
+        """
+        if self.runs < min_runs:
+            return False
+        return duration - self.mean > max(sigma * self.stdev, min_delta)
+
+
+class DurationStore:
+    """
+    SQLite store of per-test, per-phase durations
+    """
+
+    def __init__(self, path: Optional[str] = None, history_size: Optional[int] = None):
+        self.path = Path(path or settings.TEST_DURATIONS_PATH)
+        self.history_size = history_size or settings.TEST_DURATIONS_HISTORY
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(self.path), timeout=30)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def record_run(self, results: Dict[str, Dict[str, float]], outcomes: Dict[str, str]):
+        """
+        Store one run: phase durations in seconds and the outcome per nodeid
+        """
+        if not results:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connect()
+        try:
+            with connection:
+                run_id = connection.execute("INSERT INTO runs (started) VALUES (?)", (time.time(),)).lastrowid
+                connection.executemany(
+                    "INSERT INTO durations (run_id, nodeid, setup, call, teardown, outcome) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(run_id, nodeid, *(phases.get(phase, 0.0) for phase in PHASES), outcomes.get(nodeid, "passed"))
+                     for nodeid, phases in results.items()]
+                )
+        finally:
+            connection.close()
+
+    def history(self) -> Dict[str, DurationHistory]:
+        """
+        Return statistics over the last history_size runs of every test.
+
+        Skipped runs are ignored, their durations say nothing about the test.
+        """
+        if not self.path.exists():
+            return {}
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                """
+                SELECT nodeid, setup + call + teardown, outcome FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS recent
+                    FROM durations WHERE outcome != 'skipped'
+                ) WHERE recent <= ?
+                """,
+                (self.history_size,)
+            ).fetchall()
+        except sqlite3.DatabaseError:
+            return {}
+        finally:
+            connection.close()
+        totals: Dict[str, List[float]] = {}
+        failures: Dict[str, int] = {}
+        for nodeid, total, outcome in rows:
+            totals.setdefault(nodeid, []).append(total)
+            failures[nodeid] = failures.get(nodeid, 0) + (outcome == "failed")
+        return {nodeid: DurationHistory(values, failures[nodeid]) for nodeid, values in totals.items()}
+
+    def mean_durations(self) -> Dict[str, float]:
+        """
+        Return the mean total duration of every test with history
+        """
+        return {nodeid: history.mean for nodeid, history in self.history().items()}
+
+
+def base_nodeid(nodeid: str) -> str:
+    """Strip the xdist group suffix added under --dist loadgroup"""
+    return XDIST_GROUP_SUFFIX.sub("", nodeid)
+
+
+def order_items(items: list, history: Dict[str, DurationHistory], order: str):
+    """
+    Reorder collected items in place by their duration history
+    """
+    if order == "none" or not items:
+        return
+    known = sorted(entry.mean for entry in history.values())
+    default = known[len(known) // 2] if known else 1.0
+
+    def mean(item) -> float:
+        entry = history.get(base_nodeid(item.nodeid))
+        return entry.mean if entry else default
+
+    if order == "longest":
+        items.sort(key=lambda item: -mean(item))
+    else:
+        # Recently failing tests first, then the quickest, so a broken build fails fast
+        def failure_rate(item) -> float:
+            entry = history.get(base_nodeid(item.nodeid))
+            return entry.failure_rate if entry else 0.0
+        items.sort(key=lambda item: (-failure_rate(item), mean(item)))
+
+
+class DurationRecorder:
+    """Collects test durations on the controller and appends them to the store"""
+
+    def __init__(self, store: DurationStore):
+        self.store = store
+        self.results: Dict[str, Dict[str, float]] = {}
+        self.outcomes: Dict[str, str] = {}
+        self.regressions: List[tuple] = []
+
+    def pytest_runtest_logreport(self, report):
+        nodeid = base_nodeid(report.nodeid)
+        phases = self.results.setdefault(nodeid, {})
+        phases[report.when] = phases.get(report.when, 0.0) + report.duration
+        if report.failed:
+            self.outcomes[nodeid] = "failed"
+        elif report.skipped and self.outcomes.get(nodeid) != "failed":
+            self.outcomes[nodeid] = "skipped"
+
+    def pytest_sessionfinish(self, session):
+        if not self.results:
+            return
+        history = self.store.history()
+        for nodeid, phases in self.results.items():
+            entry = history.get(nodeid)
+            duration = sum(phases.values())
+            if entry is not None and self.outcomes.get(nodeid) != "skipped" and entry.is_regression(
+                    duration, settings.DURATION_REGRESSION_SIGMA, settings.DURATION_REGRESSION_MIN_DELTA,
+                    settings.DURATION_REGRESSION_MIN_RUNS):
+                self.regressions.append((nodeid, duration, entry))
+        self.store.record_run(self.results, self.outcomes)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.regressions:
+            return
+        terminalreporter.section("duration regressions")
+        for nodeid, duration, entry in sorted(self.regressions, key=lambda regression: regression[1] - regression[2].mean,
+                                              reverse=True):
+            terminalreporter.write_line(
+                f"{nodeid}: {duration:.2f}s vs mean {entry.mean:.2f}s (stdev {entry.stdev:.2f}s over {entry.runs} runs)"
+            )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--duration-order",
+        action="store",
+        choices=ORDERS,
+        default=None,
+        help="Order tests by duration history: longest first (default with --parallel) or fastest-fail first"
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    order = config.getoption("duration_order")
+    if order is None:
+        order = "longest" if config.getoption("parallel", 0) else "none"
+    order_items(items, DurationStore().history() if order != "none" else {}, order)
+
+
+def pytest_configure(config):
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(DurationStore()), "duration-recorder")
@@ -0,0 +1,263 @@
+"""
+Opt-in HTTP cache for idempotent GETs made through APIClient.
+
+Entries live in an in-memory LRU bounded by entry count and total body
+size, with an optional on-disk tier that survives across runs. Freshness
+follows Cache-Control (no-store, no-cache, max-age) and Expires; stale
+entries carrying an ETag or Last-Modified are revalidated with
+If-None-Match / If-Modified-Since and refreshed on 304. Vary is not
+supported, so only enable the cache for APIs that do not negotiate content.
+"""
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+
+import requests
+
+from config.config import settings
+
+CACHEABLE_STATUSES = {200, 203}
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Return the cache key for a GET of url with params"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True) + [(k, str(v)) for k, v in (params or {}).items()]
+    return f"{parts.scheme}://{parts.netloc}{parts.path.rstrip('/')}?{urlencode(sorted(query))}"
+
+
+def _key_path(key: str) -> str:
+    return key.split("?", 1)[0]
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _freshness_lifetime(headers, default_ttl: float) -> Optional[float]:
+    """Seconds the response stays fresh, or None if it must not be stored"""
+    directives = _parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    if directives.get("max-age") is not None:
+        try:
+            return max(int(directives["max-age"]) - int(headers.get("Age", 0)), 0)
+        except ValueError:
+            return 0
+    if headers.get("Expires"):
+        try:
+            expires = parsedate_to_datetime(headers["Expires"]).timestamp()
+            date = parsedate_to_datetime(headers["Date"]).timestamp() if headers.get("Date") else time.time()
+            return max(expires - date, 0)
+        except (TypeError, ValueError):
+            return 0
+    return default_ttl
+
+
+class CacheEntry:
+    def __init__(self, key: str, status: int, reason: Optional[str], headers: Dict[str, str],
+                 content: bytes, expires_at: float):
+        self.key = key
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.headers.get("ETag"):
+            headers["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def to_json(self) -> dict:
+        return {
+            "key": self.key,
+            "status": self.status,
+            "reason": self.reason,
+            "headers": self.headers,
+            "content": base64.b64encode(self.content).decode("ascii"),
+            "expires_at": self.expires_at
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "CacheEntry":
+        return cls(data["key"], data["status"], data["reason"], data["headers"],
+                   base64.b64decode(data["content"]), data["expires_at"])
+
+
+class ResponseCache:
+    """
+    Two-tier LRU response cache
+    """
+
+    _shared: Optional["ResponseCache"] = None
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        disk_dir: Optional[str] = None
+    ):
+        self.max_entries = max_entries or settings.API_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or settings.API_CACHE_MAX_BYTES
+        self.default_ttl = settings.API_CACHE_DEFAULT_TTL if default_ttl is None else default_ttl
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0, "invalidated": 0}
+
+    @classmethod
+    def shared(cls) -> "ResponseCache":
+        """
+        Return the session-wide cache configured from settings
+        """
+        if cls._shared is None:
+            cls._shared = cls(disk_dir=settings.API_CACHE_DIR or None)
+        return cls._shared
+
+    def _disk_path(self, key: str) -> Path:
+        # Prefixing with the path hash lets invalidation find every query variant
+        path_hash = hashlib.sha1(_key_path(key).encode()).hexdigest()[:16]
+        return self.disk_dir / f"{path_hash}-{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.disk_dir is None:
+            return None
+        try:
+            entry = CacheEntry.from_json(json.loads(self._disk_path(key).read_text()))
+        except (OSError, ValueError, KeyError):
+            return None
+        self._put_memory(entry)
+        return entry
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Return the entry for key and count a hit if it is fresh
+        """
+        entry = self.get(key)
+        with self._lock:
+            if entry is not None and entry.is_fresh():
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+        return entry
+
+    def store(self, key: str, response: requests.Response) -> Optional[CacheEntry]:
+        """
+        Cache a response if its status and headers allow it
+        """
+        if response.status_code not in CACHEABLE_STATUSES:
+            return None
+        lifetime = _freshness_lifetime(response.headers, self.default_ttl)
+        if lifetime is None:
+            return None
+        has_validator = "ETag" in response.headers or "Last-Modified" in response.headers
+        if lifetime <= 0 and not has_validator:
+            return None
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in ("content-encoding", "transfer-encoding", "content-length")}
+        entry = CacheEntry(key, response.status_code, response.reason, headers,
+                           response.content, time.time() + lifetime)
+        if entry.size > self.max_bytes:
+            return None
+        self._put_memory(entry)
+        self._write_disk(entry)
+        with self._lock:
+            self.stats["stored"] += 1
+        return entry
+
+    def refresh(self, entry: CacheEntry, not_modified: requests.Response) -> CacheEntry:
+        """
+        Extend a stale entry after a 304 Not Modified
+        """
+        for name in ("Cache-Control", "Expires", "Date", "ETag", "Last-Modified"):
+            if name in not_modified.headers:
+                entry.headers[name] = not_modified.headers[name]
+        lifetime = _freshness_lifetime(entry.headers, self.default_ttl) or 0
+        entry.expires_at = time.time() + lifetime
+        self._write_disk(entry)
+        with self._lock:
+            self.stats["revalidated"] += 1
+        return entry
+
+    def invalidate(self, url: str):
+        """
+        Drop every entry for a resource and its parent collection
+        """
+        path = cache_key(url).split("?", 1)[0]
+        targets = {path, path.rsplit("/", 1)[0]}
+        with self._lock:
+            keys = [key for key in self._entries if _key_path(key) in targets]
+            for key in keys:
+                self._bytes -= self._entries.pop(key).size
+            self.stats["invalidated"] += len(keys)
+        if self.disk_dir is not None:
+            for target in targets:
+                path_hash = hashlib.sha1(target.encode()).hexdigest()[:16]
+                for file in self.disk_dir.glob(f"{path_hash}-*.json"):
+                    file.unlink(missing_ok=True)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.disk_dir is not None:
+            for file in self.disk_dir.glob("*.json"):
+                file.unlink(missing_ok=True)
+
+    def _put_memory(self, entry: CacheEntry):
+        with self._lock:
+            previous = self._entries.pop(entry.key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[entry.key] = entry
+            self._bytes += entry.size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def _write_disk(self, entry: CacheEntry):
+        if self.disk_dir is None:
+            return
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            path = self._disk_path(entry.key)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(entry.to_json()))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry to disk: {str(e)}")
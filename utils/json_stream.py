@@ -0,0 +1,70 @@
+from typing import Any, Iterable, Iterator
+import codecs
+import json
+
+WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Incrementally parse a top-level JSON array, yielding one item at a time.
+
+    Only the item currently being decoded is held in memory, so the cost of
+    walking a collection does not grow with the size of the payload. Raises
+    ValueError if the body is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    state = "start"
+    chunks = iter(chunks)
+    eof = False
+
+    while True:
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            buffer += text_decoder.decode(b"", final=True)
+        else:
+            buffer += text_decoder.decode(chunk)
+
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+            if state == "start":
+                if buffer[pos] != "[":
+                    raise ValueError(f"Expected a JSON array, got {buffer[pos]!r}")
+                pos += 1
+                state = "first"
+            elif state in ("first", "separator") and buffer[pos] == "]":
+                pos += 1
+                state = "done"
+            elif state == "separator":
+                if buffer[pos] != ",":
+                    raise ValueError(f"Expected ',' or ']' in JSON array, got {buffer[pos]!r}")
+                pos += 1
+                state = "item"
+            elif state in ("first", "item"):
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    break
+                # A value ending exactly at the buffer edge may be a truncated number
+                if end == len(buffer) and not eof:
+                    break
+                pos = end
+                state = "separator"
+                yield item
+            else:
+                raise ValueError(f"Unexpected data after JSON array: {buffer[pos:pos + 20]!r}")
+        buffer = buffer[pos:]
+
+        if eof:
+            if state != "done":
+                raise ValueError("Truncated JSON array")
+            return
@@ -0,0 +1,242 @@
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import json
+import math
+import re
+import threading
+
+# Values below 2**SUB_BUCKET_BITS microseconds are stored exactly; above that
+# each power of two is split into 2**(SUB_BUCKET_BITS - 1) linear buckets,
+# which bounds the relative error of any reported value to under 1.6%.
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+ID_SEGMENT = re.compile(r"^\d+$")
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Collapse numeric path segments so /users/1 and /users/2 share a histogram"""
+    path = urlsplit(endpoint).path.strip("/")
+    segments = ["{id}" if ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return "/" + "/".join(segments)
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of latencies.
+
+    Recording is O(1) and memory grows with the number of distinct buckets,
+    not samples, so every request can be recorded even under load.
+    """
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        # Per-phase histograms (dns, connect, wait, ...) of the same samples
+        self.phases: Dict[str, "LatencyHistogram"] = {}
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < (1 << SUB_BUCKET_BITS):
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        return shift * SUB_BUCKET_HALF + (value >> shift)
+
+    @staticmethod
+    def _highest_value(index: int) -> int:
+        if index < (1 << SUB_BUCKET_BITS):
+            return index
+        shift = index // SUB_BUCKET_HALF - 1
+        mantissa = index - shift * SUB_BUCKET_HALF
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float, phases: Optional[Dict[str, float]] = None):
+        """
+        Record a latency sample given in seconds, optionally with its phase breakdown
+        """
+        if phases:
+            for phase, phase_seconds in phases.items():
+                histogram = self.phases.get(phase)
+                if histogram is None:
+                    with self._lock:
+                        histogram = self.phases.setdefault(phase, LatencyHistogram())
+                histogram.record(phase_seconds)
+        value = max(int(seconds * 1_000_000), 0)
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Add all samples of another histogram to this one
+        """
+        with other._lock:
+            counts = dict(other._counts)
+            count, total, low, high = other.count, other.total, other.min, other.max
+            phases = dict(other.phases)
+        for phase, histogram in phases.items():
+            with self._lock:
+                mine = self.phases.setdefault(phase, LatencyHistogram())
+            mine.merge(histogram)
+        with self._lock:
+            for index, bucket_count in counts.items():
+                self._counts[index] = self._counts.get(index, 0) + bucket_count
+            self.count += count
+            self.total += total
+            if low is not None and (self.min is None or low < self.min):
+                self.min = low
+            if high is not None and (self.max is None or high > self.max):
+                self.max = high
+
+    def to_json(self) -> dict:
+        """
+        Return the raw buckets as JSON-serializable data, e.g. to ship them
+        from an xdist worker to the controller
+        """
+        with self._lock:
+            data = {
+                "counts": [[index, count] for index, count in self._counts.items()],
+                "count": self.count,
+                "total": self.total,
+                "min": self.min,
+                "max": self.max
+            }
+            phases = dict(self.phases)
+        if phases:
+            data["phases"] = {phase: histogram.to_json() for phase, histogram in phases.items()}
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram._counts = {index: count for index, count in data["counts"]}
+        histogram.count, histogram.total = data["count"], data["total"]
+        histogram.min, histogram.max = data["min"], data["max"]
+        histogram.phases = {phase: cls.from_json(phase_data) for phase, phase_data in data.get("phases", {}).items()}
+        return histogram
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Return the latency in seconds at the given percentile (0-100)
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = max(math.ceil(percentile / 100 * self.count), 1)
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= target:
+                    return min(self._highest_value(index), self.max) / 1_000_000
+            return self.max / 1_000_000
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return count, mean and p50/p90/p99/max latencies in seconds.
+
+        When phases were recorded, "phases" holds the mean, p50 and p99 of
+        each phase so a slow percentile can be attributed to the network
+        (dns/connect/tls) or the server (wait).
+        """
+        if not self.count:
+            return {"count": 0}
+        summary = {
+            "count": self.count,
+            "min": self.min / 1_000_000,
+            "mean": self.total / self.count / 1_000_000,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max / 1_000_000
+        }
+        if self.phases:
+            summary["phases"] = {
+                phase: {
+                    "mean": histogram.total / histogram.count / 1_000_000,
+                    "p50": histogram.percentile(50),
+                    "p99": histogram.percentile(99)
+                }
+                for phase, histogram in sorted(self.phases.items()) if histogram.count
+            }
+        return summary
+
+
+class LatencyRecorder:
+    """
+    Per method/endpoint latency histograms shared by API clients
+    """
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, method: str, endpoint: str) -> LatencyHistogram:
+        key = (method.upper(), normalize_endpoint(endpoint))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, LatencyHistogram())
+        return histogram
+
+    def record(self, method: str, endpoint: str, seconds: float, phases: Optional[Dict[str, float]] = None):
+        self.histogram(method, endpoint).record(seconds, phases)
+
+    def percentile(self, method: str, endpoint: str, percentile: float) -> float:
+        return self.histogram(method, endpoint).percentile(percentile)
+
+    def merge(self, other: "LatencyRecorder"):
+        """
+        Add all histograms of another recorder to this one
+        """
+        with other._lock:
+            items = list(other._histograms.items())
+        for (method, endpoint), histogram in items:
+            self.histogram(method, endpoint).merge(histogram)
+
+    def to_json(self) -> list:
+        """
+        Return every histogram as JSON-serializable data, see LatencyHistogram.to_json
+        """
+        with self._lock:
+            items = list(self._histograms.items())
+        return [[method, endpoint, histogram.to_json()] for (method, endpoint), histogram in items]
+
+    @classmethod
+    def from_json(cls, data: list) -> "LatencyRecorder":
+        recorder = cls()
+        for method, endpoint, histogram in data:
+            recorder._histograms[(method, endpoint)] = LatencyHistogram.from_json(histogram)
+        return recorder
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return a summary per "METHOD /endpoint" key
+        """
+        with self._lock:
+            items = sorted(self._histograms.items())
+        return {f"{method} {endpoint}": histogram.summary() for (method, endpoint), histogram in items if histogram.count}
+
+    def export_json(self, path: str):
+        """
+        Write the report to a JSON file
+        """
+        Path(path).write_text(json.dumps(self.report(), indent=2))
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+# Shared by every client so the session report covers the whole run
+latency_recorder = LatencyRecorder()
@@ -0,0 +1,206 @@
+"""
+Load-generation mode that replays existing API test scenarios.
+
+``pytest tests/api --load-duration 30 --load-concurrency 20 [--load-rps 100]``
+runs every test marked ``load`` (and using the ``api_client`` fixture)
+repeatedly from a pool of threads for the given duration instead of once,
+then reports throughput, error rate and latency percentiles. The test fails
+when the error rate exceeds LOAD_MAX_ERROR_RATE.
+
+Fixture values are shared by all iterations and threads, so load scenarios
+build their request data inside the test body.
+"""
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+import inspect
+import json
+import logging
+import threading
+import time
+
+import allure
+import pytest
+
+from config.config import settings
+from utils.latency import LatencyHistogram, LatencyRecorder
+from utils.rate_limit import RateLimiter
+
+
+class LoadTestResult:
+    """
+    Outcome of a load test run
+    """
+
+    def __init__(
+        self,
+        name: str,
+        duration: float,
+        iterations: int,
+        errors: Counter,
+        iteration_latency: LatencyHistogram,
+        request_latency: Dict[str, Dict[str, float]]
+    ):
+        self.name = name
+        self.duration = duration
+        self.iterations = iterations
+        self.errors = errors
+        self.iteration_latency = iteration_latency
+        self.request_latency = request_latency
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        return self.error_count / self.iterations if self.iterations else 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.iterations / self.duration if self.duration else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "name": self.name,
+            "duration": self.duration,
+            "iterations": self.iterations,
+            "throughput": self.throughput,
+            "error_rate": self.error_rate,
+            "errors": dict(self.errors),
+            "iteration_latency": self.iteration_latency.summary(),
+            "request_latency": self.request_latency
+        }
+
+
+class LoadTest:
+    """
+    Runs a scenario callable from a pool of threads for a fixed duration.
+
+    With ``rps`` set, scenario starts are paced to that rate across all
+    threads; otherwise each thread starts the next iteration as soon as the
+    previous one finishes (closed-loop concurrency).
+    """
+
+    def __init__(
+        self,
+        scenario: Callable[[], None],
+        duration: float,
+        concurrency: int = 10,
+        rps: Optional[float] = None,
+        name: Optional[str] = None,
+        latency: Optional[LatencyRecorder] = None
+    ):
+        self.scenario = scenario
+        self.duration = duration
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rps) if rps else None
+        self.name = name or getattr(scenario, "__name__", "scenario")
+        self.latency = latency
+        self.logger = logging.getLogger(__name__)
+
+    def run(self) -> LoadTestResult:
+        iteration_latency = LatencyHistogram()
+        errors = Counter()
+        lock = threading.Lock()
+        iterations = [0]
+        start = time.perf_counter()
+        deadline = start + self.duration
+
+        def worker():
+            while True:
+                if self.limiter:
+                    self.limiter.acquire()
+                iteration_start = time.perf_counter()
+                if iteration_start >= deadline:
+                    return
+                try:
+                    self.scenario()
+                except Exception as e:
+                    with lock:
+                        errors[type(e).__name__] += 1
+                iteration_latency.record(time.perf_counter() - iteration_start)
+                with lock:
+                    iterations[0] += 1
+
+        self.logger.info(f"Starting load test {self.name}: {self.concurrency} threads for {self.duration}s")
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for future in [executor.submit(worker) for _ in range(self.concurrency)]:
+                future.result()
+        elapsed = time.perf_counter() - start
+
+        result = LoadTestResult(
+            name=self.name,
+            duration=elapsed,
+            iterations=iterations[0],
+            errors=errors,
+            iteration_latency=iteration_latency,
+            request_latency=self.latency.report() if self.latency else {}
+        )
+        self.logger.info(
+            f"Load test {self.name} finished: {result.throughput:.1f} it/s, "
+            f"error rate {result.error_rate:.2%}"
+        )
+        return result
+
+
+@contextmanager
+def _no_step(title):
+    yield
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("load", "load-generation mode")
+    group.addoption("--load-duration", type=float, default=0,
+                    help="Replay each test marked load for this many seconds")
+    group.addoption("--load-concurrency", type=int, default=10,
+                    help="Number of threads replaying each scenario")
+    group.addoption("--load-rps", type=float, default=None,
+                    help="Target scenario iterations per second across all threads")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    config = pyfuncitem.config
+    duration = config.getoption("load_duration")
+    if not duration or not pyfuncitem.get_closest_marker("load") or inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    if "api_client" not in pyfuncitem.funcargs:
+        raise pytest.UsageError(f"{pyfuncitem.nodeid} is marked load but does not use the api_client fixture")
+
+    api_client = pyfuncitem.funcargs["api_client"]
+    concurrency = config.getoption("load_concurrency")
+    if concurrency > api_client.pool_maxsize:
+        logging.getLogger(__name__).warning(
+            f"Load concurrency {concurrency} exceeds API_POOL_MAXSIZE {api_client.pool_maxsize}; "
+            f"connections will churn"
+        )
+    kwargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+
+    # Record this run separately, then fold it into the session-wide report
+    session_latency = api_client.latency
+    api_client.latency = LatencyRecorder()
+    load_test = LoadTest(
+        lambda: pyfuncitem.obj(**kwargs),
+        duration=duration,
+        concurrency=concurrency,
+        rps=config.getoption("load_rps"),
+        name=pyfuncitem.nodeid,
+        latency=api_client.latency
+    )
+    try:
+        # Allure steps are disabled while replaying so iterations do not flood the report
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(allure, "step", _no_step)
+            result = load_test.run()
+    finally:
+        session_latency.merge(api_client.latency)
+        api_client.latency = session_latency
+
+    summary = json.dumps(result.summary(), indent=2)
+    allure.attach(summary, name="Load test result", attachment_type=allure.attachment_type.JSON)
+    assert result.error_rate <= settings.LOAD_MAX_ERROR_RATE, \
+        f"Error rate {result.error_rate:.2%} exceeded maximum {settings.LOAD_MAX_ERROR_RATE:.2%}: {summary}"
+    return True
+
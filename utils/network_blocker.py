@@ -0,0 +1,206 @@
+"""
+Blocks third-party ads and trackers through the CDP Network domain.
+
+NETWORK_BLOCKED_URLS holds Network.setBlockedURLs wildcard patterns;
+patterns that would also match a domain of NETWORK_ALLOWED_DOMAINS are
+dropped, so an over-broad pattern never blocks the site under test.
+Blocking is applied per tab, which is why BasePage re-applies it before
+every navigation.
+
+With NETWORK_STATS_ENABLED (and the goog:loggingPrefs performance log
+enabled on the driver) every page load also reports how many requests it
+made, how many were blocked, and an estimate of the bytes saved. Blocked
+requests never download anything, so the estimate uses the sizes of the
+same URLs seen in runs with blocking disabled, kept in
+NETWORK_BLOCKED_SIZES_PATH.
+"""
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+import atexit
+import json
+import logging
+import re
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from config.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _pattern_regex(pattern: str) -> "re.Pattern":
+    # CDP patterns only know the * wildcard
+    return re.compile(".*".join(re.escape(part) for part in pattern.split("*")))
+
+
+def _size_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.netloc}{parts.path}"
+
+
+def effective_patterns(patterns: List[str], allowed_domains: List[str]) -> List[str]:
+    """
+    Return the patterns that do not match any allowed domain
+    """
+    kept = []
+    for pattern in patterns:
+        regex = _pattern_regex(pattern)
+        clash = next((domain for domain in allowed_domains
+                      if regex.fullmatch(f"https://{domain}/") or regex.fullmatch(f"https://www.{domain}/")), None)
+        if clash:
+            logger.warning(f"Not blocking {pattern}: it matches allowed domain {clash}")
+        else:
+            kept.append(pattern)
+    return kept
+
+
+class BlockedSizes:
+    """
+    Memo of response sizes of blockable URLs, learned while blocking is off
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._sizes: Optional[Dict[str, int]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, int]:
+        if self._sizes is None:
+            try:
+                self._sizes = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._sizes = {}
+        return self._sizes
+
+    def learn(self, url: str, size: int):
+        with self._lock:
+            sizes = self._load()
+            if sizes.get(_size_key(url)) != size:
+                sizes[_size_key(url)] = size
+                self._dirty = True
+
+    def estimate(self, url: str) -> int:
+        """
+        Known size of the URL, else the mean size of known URLs on its host
+        """
+        with self._lock:
+            sizes = self._load()
+            key = _size_key(url)
+            if key in sizes:
+                return sizes[key]
+            host = urlsplit(url).netloc
+            same_host = [size for known, size in sizes.items() if known.startswith(host + "/")]
+            return sum(same_host) // len(same_host) if same_host else 0
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.write_text(json.dumps(self._sizes, indent=2, sort_keys=True))
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Could not save blocked request sizes: {str(e)}")
+
+
+class NetworkBlocker:
+    """
+    Applies URL blocking to a driver's current tab and reads per-page stats
+    """
+
+    def __init__(
+        self,
+        blocked_urls: Optional[List[str]] = None,
+        allowed_domains: Optional[List[str]] = None,
+        sizes: Optional[BlockedSizes] = None
+    ):
+        self.patterns = effective_patterns(
+            settings.NETWORK_BLOCKED_URLS if blocked_urls is None else blocked_urls,
+            settings.NETWORK_ALLOWED_DOMAINS if allowed_domains is None else allowed_domains
+        )
+        self._regexes = [_pattern_regex(pattern) for pattern in self.patterns]
+        self.sizes = sizes or BlockedSizes(settings.NETWORK_BLOCKED_SIZES_PATH)
+
+    def is_blockable(self, url: str) -> bool:
+        return any(regex.fullmatch(url) for regex in self._regexes)
+
+    def apply(self, driver) -> bool:
+        """
+        Enable blocking in the current tab; False if the driver has no CDP
+        """
+        if not settings.NETWORK_BLOCKING_ENABLED or not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+            return True
+        except WebDriverException as e:
+            logger.debug(f"Could not enable request blocking: {str(e)}")
+            return False
+
+    def drain(self, driver) -> List[dict]:
+        """
+        Return and clear the Network events of the performance log
+        """
+        if not settings.NETWORK_STATS_ENABLED:
+            return []
+        try:
+            entries = driver.get_log("performance")
+        except (WebDriverException, AttributeError, ValueError):
+            # The performance log is not enabled on this driver
+            return []
+        events = []
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            if message.get("method", "").startswith("Network."):
+                events.append(message)
+        return events
+
+    def page_stats(self, driver) -> Dict[str, int]:
+        """
+        Count requests, blocked requests and estimated bytes saved since the last drain
+        """
+        events = self.drain(driver)
+        if not events:
+            return {}
+        urls: Dict[str, str] = {}
+        stats = {"requests": 0, "bytes": 0, "blocked_requests": 0, "blocked_bytes": 0}
+        for event in events:
+            method, params = event["method"], event.get("params", {})
+            if method == "Network.requestWillBeSent":
+                url = params.get("request", {}).get("url", "")
+                if url.startswith(("http://", "https://")) and params.get("requestId") not in urls:
+                    urls[params["requestId"]] = url
+                    stats["requests"] += 1
+            elif method == "Network.loadingFinished" and params.get("requestId") in urls:
+                size = int(params.get("encodedDataLength", 0))
+                stats["bytes"] += size
+                url = urls[params["requestId"]]
+                if self.is_blockable(url):
+                    self.sizes.learn(url, size)
+            elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+                url = urls.get(params.get("requestId"))
+                if url is not None:
+                    stats["blocked_requests"] += 1
+                    stats["blocked_bytes"] += self.sizes.estimate(url)
+        return stats
+
+
+_blocker: Optional[NetworkBlocker] = None
+
+
+def get_network_blocker() -> NetworkBlocker:
+    """
+    Return the process-wide blocker configured from settings
+    """
+    global _blocker
+    if _blocker is None:
+        _blocker = NetworkBlocker()
+        atexit.register(_blocker.sizes.save)
+    return _blocker
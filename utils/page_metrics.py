@@ -0,0 +1,175 @@
+"""
+Browser-side performance metrics for page objects.
+
+BasePage.open() installs EARLY_OBSERVER_JS before navigating (through the CDP
+Page domain, so it runs before any page script) and reads COLLECT_JS once
+the load event has finished. Collected per open:
+
+    Navigation Timing  ttfb, dom_content_loaded, load, transfer_size (ms/bytes)
+    Resource Timing    resource_count, resource_bytes, slowest_resources
+    Web vitals         fcp, lcp (ms), cls, tbt (ms, long tasks after FCP)
+    Memory             js_heap_used, js_heap_total (bytes, Chrome only)
+    Request blocking   requests, bytes, blocked_requests, blocked_bytes (see utils.network_blocker)
+
+Browsers without CDP still report everything except tbt, since long tasks
+are not buffered by the Performance Timeline. Metrics are aggregated per
+page object in ``page_metrics`` and checked against budgets: the
+PAGE_BUDGETS setting, overridden per page by a PERFORMANCE_BUDGET class
+attribute.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import json
+import statistics
+import threading
+
+# Keeps LCP, CLS and long-task totals on window.__pageMetrics from the first byte
+OBSERVER_JS = """
+(function () {
+    if (window.__pageMetrics) { return; }
+    var metrics = window.__pageMetrics = {lcp: null, cls: 0, longTasks: []};
+    function observe(type, callback) {
+        try {
+            new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+                .observe({type: type, buffered: true});
+        } catch (e) {}
+    }
+    observe('largest-contentful-paint', function (entry) { metrics.lcp = entry.startTime; });
+    observe('layout-shift', function (entry) { if (!entry.hadRecentInput) { metrics.cls += entry.value; } });
+    observe('longtask', function (entry) { metrics.longTasks.push([entry.startTime, entry.duration]); });
+})();
+"""
+
+# Returns null until the load event has finished, so it can be polled. Without
+# the early observer, buffered entries arrive asynchronously: wait one poll for them.
+COLLECT_JS = "var fresh = !window.__pageMetrics;" + OBSERVER_JS + """
+var nav = performance.getEntriesByType('navigation')[0];
+if (fresh || !nav || nav.loadEventEnd === 0) { return null; }
+var metrics = window.__pageMetrics;
+var fcpEntry = performance.getEntriesByName('first-contentful-paint')[0];
+var fcp = fcpEntry ? fcpEntry.startTime : null;
+var tbt = null;
+if (window.__pageMetricsEarly) {
+    tbt = metrics.longTasks.reduce(function (total, task) {
+        return fcp !== null && task[0] >= fcp ? total + Math.max(task[1] - 50, 0) : total;
+    }, 0);
+}
+var resources = performance.getEntriesByType('resource');
+var slowest = resources.slice().sort(function (a, b) { return b.duration - a.duration; }).slice(0, 5);
+var memory = performance.memory || {};
+return {
+    ttfb: nav.responseStart,
+    dom_content_loaded: nav.domContentLoadedEventEnd,
+    load: nav.loadEventEnd,
+    transfer_size: nav.transferSize,
+    resource_count: resources.length,
+    resource_bytes: resources.reduce(function (total, r) { return total + (r.transferSize || 0); }, 0),
+    slowest_resources: slowest.map(function (r) { return {name: r.name, type: r.initiatorType, duration: r.duration}; }),
+    fcp: fcp,
+    lcp: metrics.lcp,
+    cls: metrics.cls,
+    tbt: tbt,
+    js_heap_used: memory.usedJSHeapSize || null,
+    js_heap_total: memory.totalJSHeapSize || null
+};
+"""
+
+# Installed through CDP; marks the observers as running from the start of the document
+EARLY_OBSERVER_JS = "window.__pageMetricsEarly = true;" + OBSERVER_JS
+
+# Metrics that are aggregated and can carry a budget
+NUMERIC_METRICS = ("ttfb", "dom_content_loaded", "load", "transfer_size", "resource_count", "resource_bytes",
+                   "fcp", "lcp", "cls", "tbt", "js_heap_used", "js_heap_total",
+                   "requests", "bytes", "blocked_requests", "blocked_bytes")
+
+
+class PerformanceBudgetExceeded(AssertionError):
+    """Raised when a page load breaks its performance budget"""
+
+
+def budget_violations(metrics: Dict[str, Any], budget: Dict[str, float]) -> Dict[str, tuple]:
+    """
+    Return {metric: (value, limit)} for every budgeted metric over its limit
+    """
+    return {
+        name: (metrics[name], limit) for name, limit in budget.items()
+        if metrics.get(name) is not None and metrics[name] > limit
+    }
+
+
+class PageMetricsRegistry:
+    """
+    Collects the metrics of every page open, grouped by page object
+    """
+
+    def __init__(self):
+        self._samples: Dict[str, List[Dict[str, Any]]] = {}
+        self._violations: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, page: str, metrics: Dict[str, Any], violations: Optional[Dict[str, tuple]] = None):
+        with self._lock:
+            self._samples.setdefault(page, []).append(metrics)
+            if violations:
+                self._violations.setdefault(page, []).append(
+                    {name: {"value": value, "budget": limit} for name, (value, limit) in violations.items()}
+                )
+
+    def samples(self, page: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._samples.get(page, []))
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the count, median, p90 and max of every metric per page object
+        """
+        with self._lock:
+            samples = {page: list(entries) for page, entries in self._samples.items()}
+            violations = {page: list(entries) for page, entries in self._violations.items()}
+        report = {}
+        for page, entries in sorted(samples.items()):
+            summary: Dict[str, Any] = {"opens": len(entries)}
+            for name in NUMERIC_METRICS:
+                values = sorted(entry[name] for entry in entries if entry.get(name) is not None)
+                if values:
+                    summary[name] = {
+                        "median": statistics.median(values),
+                        "p90": values[min(int(len(values) * 0.9), len(values) - 1)],
+                        "max": values[-1]
+                    }
+            if page in violations:
+                summary["budget_violations"] = violations[page]
+            report[page] = summary
+        return report
+
+    def export_json(self, path: str):
+        Path(path).write_text(json.dumps(self.report(), indent=2))
+
+    def to_json(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Return the raw samples and violations, e.g. to ship them from an xdist worker to the controller
+        """
+        with self._lock:
+            return {
+                "samples": {page: list(entries) for page, entries in self._samples.items()},
+                "violations": {page: list(entries) for page, entries in self._violations.items()}
+            }
+
+    def merge_json(self, data: Dict[str, Dict[str, List[Dict[str, Any]]]]):
+        """
+        Add the samples and violations exported by another registry's to_json
+        """
+        with self._lock:
+            for page, entries in data["samples"].items():
+                self._samples.setdefault(page, []).extend(entries)
+            for page, entries in data["violations"].items():
+                self._violations.setdefault(page, []).extend(entries)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._violations.clear()
+
+
+# Shared by every page object so the session report covers the whole run
+page_metrics = PageMetricsRegistry()
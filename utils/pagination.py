@@ -0,0 +1,103 @@
+"""
+Pagination strategies for APIClient.iter_pages / iter_items.
+
+A strategy knows the params of the first page, how to find the next page
+from the current response and where the items live in the body. Defaults
+match json-server style APIs such as JSONPlaceholder (_page/_limit,
+_start/_limit and RFC 5988 Link headers).
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+# (endpoint or absolute URL, query params) of the next page
+NextPage = Optional[Tuple[str, Dict[str, Any]]]
+
+
+class Pagination:
+    """Base strategy: a single unpaginated page"""
+
+    def __init__(self, items_field: Optional[str] = None):
+        self.items_field = items_field
+
+    def first_params(self) -> Dict[str, Any]:
+        return {}
+
+    def items(self, response: requests.Response) -> List[Any]:
+        data = response.json()
+        return data[self.items_field] if self.items_field else data
+
+    def next_page(self, endpoint: str, params: Dict[str, Any], response: requests.Response) -> NextPage:
+        return None
+
+
+class OffsetPagination(Pagination):
+    """offset/limit pagination; stops at the first short page"""
+
+    def __init__(self, limit: int = 100, offset_param: str = "_start", limit_param: str = "_limit", **kwargs):
+        super().__init__(**kwargs)
+        self.limit = limit
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+
+    def first_params(self) -> Dict[str, Any]:
+        return {self.offset_param: 0, self.limit_param: self.limit}
+
+    def next_page(self, endpoint: str, params: Dict[str, Any], response: requests.Response) -> NextPage:
+        if len(response.items) < self.limit:
+            return None
+        return endpoint, {**params, self.offset_param: params[self.offset_param] + self.limit}
+
+
+class PagePagination(Pagination):
+    """page-number pagination; stops at the first short page"""
+
+    def __init__(self, page_size: int = 100, page_param: str = "_page", size_param: str = "_limit",
+                 first_page: int = 1, **kwargs):
+        super().__init__(**kwargs)
+        self.page_size = page_size
+        self.page_param = page_param
+        self.size_param = size_param
+        self.first_page = first_page
+
+    def first_params(self) -> Dict[str, Any]:
+        return {self.page_param: self.first_page, self.size_param: self.page_size}
+
+    def next_page(self, endpoint: str, params: Dict[str, Any], response: requests.Response) -> NextPage:
+        if len(response.items) < self.page_size:
+            return None
+        return endpoint, {**params, self.page_param: params[self.page_param] + 1}
+
+
+class CursorPagination(Pagination):
+    """Cursor pagination where the body carries the next cursor"""
+
+    def __init__(self, cursor_param: str = "cursor", cursor_field: str = "next_cursor",
+                 items_field: str = "data", **kwargs):
+        super().__init__(items_field=items_field, **kwargs)
+        self.cursor_param = cursor_param
+        self.cursor_field = cursor_field
+
+    def next_page(self, endpoint: str, params: Dict[str, Any], response: requests.Response) -> NextPage:
+        cursor = response.json().get(self.cursor_field)
+        if not cursor:
+            return None
+        return endpoint, {**params, self.cursor_param: cursor}
+
+
+class LinkHeaderPagination(Pagination):
+    """Follows the rel="next" URL of the Link response header"""
+
+    def __init__(self, first_page_params: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.first_page_params = first_page_params or {}
+
+    def first_params(self) -> Dict[str, Any]:
+        return dict(self.first_page_params)
+
+    def next_page(self, endpoint: str, params: Dict[str, Any], response: requests.Response) -> NextPage:
+        next_link = response.links.get("next", {}).get("url")
+        if not next_link:
+            return None
+        # The next URL already carries every query parameter
+        return next_link, {}
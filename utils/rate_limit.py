@@ -0,0 +1,28 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe pacer that spaces calls evenly at a target rate per second
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.interval = 1.0 / rate
+        self._next_slot = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until the caller's slot is due
+        """
+        with self._lock:
+            now = time.perf_counter()
+            # Do not bank unused slots after an idle period, that would allow a burst
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,167 @@
+"""
+Request logging for the API clients.
+
+Per-request lines are formatted lazily (%-style, behind a level check) and
+sampled at API_LOG_SAMPLE_RATE; failures are always logged. With
+API_LOG_QUEUE the client loggers enqueue records unformatted and a
+background QueueListener does the formatting and I/O. With API_TRACE_PATH
+every request, sampled or not, is appended to a JSONL trace by a writer
+thread for offline analysis.
+"""
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+
+from config.config import settings
+
+# Marks the end of the trace queue
+_TRACE_DONE = object()
+
+
+class _RootForwarder(logging.Handler):
+    """Hands records from the queue listener to the root logger's handlers"""
+
+    def emit(self, record: logging.LogRecord):
+        for handler in logging.getLogger().handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Enqueues records as they are; the stock prepare() formats them on the
+    calling thread, which is the work the queue is meant to move away
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_queue_listener: Optional[QueueListener] = None
+_queue_lock = threading.Lock()
+
+
+def install_queue_handler(logger: logging.Logger):
+    """
+    Route a logger through a queue so handlers run off the request thread
+    """
+    global _queue_listener
+    with _queue_lock:
+        if _queue_listener is None:
+            _queue_listener = QueueListener(queue.SimpleQueue(), _RootForwarder())
+            _queue_listener.start()
+            atexit.register(_queue_listener.stop)
+        if not any(isinstance(handler, QueueHandler) for handler in logger.handlers):
+            logger.addHandler(_DeferredQueueHandler(_queue_listener.queue))
+            logger.propagate = False
+
+
+class TraceWriter:
+    """
+    Appends one JSON line per request from a background thread.
+
+    write() only enqueues a tuple, so serialisation and file I/O never run on
+    the thread that made the request.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="request-trace", daemon=True)
+        self._thread.start()
+
+    def write(self, method: str, url: str, status: Optional[int], seconds: float,
+              from_cache: bool = False, error: Optional[str] = None):
+        self._queue.put((time.time(), method, url, status, seconds, from_cache, error))
+
+    def _run(self):
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                record = self._queue.get()
+                if record is _TRACE_DONE:
+                    return
+                self._write_record(f, record)
+
+    @staticmethod
+    def _write_record(f: TextIO, record: tuple):
+        timestamp, method, url, status, seconds, from_cache, error = record
+        line = {"ts": round(timestamp, 6), "method": method, "url": url, "status": status,
+                "ms": round(seconds * 1000, 3)}
+        if from_cache:
+            line["cache"] = True
+        if error:
+            line["error"] = error
+        f.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+    def close(self):
+        """
+        Flush pending records and stop the writer thread
+        """
+        if self._thread.is_alive():
+            self._queue.put(_TRACE_DONE)
+            self._thread.join()
+
+
+_trace_writer: Optional[TraceWriter] = None
+_trace_lock = threading.Lock()
+
+
+def get_trace_writer() -> Optional[TraceWriter]:
+    """
+    Return the process-wide trace writer, or None if tracing is disabled
+    """
+    global _trace_writer
+    if not settings.API_TRACE_PATH:
+        return None
+    with _trace_lock:
+        if _trace_writer is None:
+            path = settings.API_TRACE_PATH
+            worker = os.getenv("PYTEST_XDIST_WORKER")
+            if worker:
+                root, ext = os.path.splitext(path)
+                path = f"{root}-{worker}{ext}"
+            _trace_writer = TraceWriter(path)
+            atexit.register(_trace_writer.close)
+        return _trace_writer
+
+
+class RequestLog:
+    """
+    Logs and traces requests for one client logger
+    """
+
+    def __init__(self, logger: logging.Logger, sample_rate: Optional[float] = None):
+        self.logger = logger
+        self.sample_rate = settings.API_LOG_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.trace = get_trace_writer()
+        if settings.API_LOG_QUEUE:
+            install_queue_handler(logger)
+
+    def _sampled(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def started(self, method: str, url: str):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Making %s request to %s", method, url)
+
+    def completed(self, method: str, url: str, status: int, seconds: float, from_cache: bool = False):
+        if self.trace is not None:
+            self.trace.write(method, url, status, seconds, from_cache)
+        if self.logger.isEnabledFor(logging.INFO) and self._sampled():
+            self.logger.info("%s %s -> %s in %.3fs%s", method, url, status, seconds,
+                             " (cached)" if from_cache else "")
+
+    def failed(self, method: str, url: str, error: Exception, seconds: float = 0.0):
+        # Error statuses were already traced by completed(); only transport failures are new
+        # (requests' HTTPError carries .response, aiohttp's ClientResponseError .status)
+        responded = getattr(error, "response", None) is not None or getattr(error, "status", None) is not None
+        if self.trace is not None and not responded:
+            self.trace.write(method, url, None, seconds, error=type(error).__name__)
+        self.logger.error("%s %s failed: %s", method, url, error)
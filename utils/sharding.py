@@ -0,0 +1,64 @@
+"""
+Pytest plugin for duration-balanced parallel runs.
+
+``pytest --parallel N`` starts N xdist workers with ``--dist loadgroup`` and
+packs the collected tests into N shards using historical durations (longest
+processing time first). Every shard is pinned to one worker, so each worker
+runs a predictable share of the suite with its own browser pool. Durations
+come from the history kept by utils.durations.
+"""
+from typing import Dict, List
+import heapq
+
+import pytest
+
+from utils.durations import DurationStore
+
+GROUP_PREFIX = "shard-"
+
+
+def assign_shards(nodeids: List[str], durations: Dict[str, float], shard_count: int) -> Dict[str, int]:
+    """
+    Assign tests to shards so the expected shard runtimes are balanced.
+
+    Tests without history are assumed to take the median known duration.
+    """
+    known = sorted(durations[nodeid] for nodeid in nodeids if nodeid in durations)
+    default = known[len(known) // 2] if known else 1.0
+    ordered = sorted(nodeids, key=lambda nodeid: (-durations.get(nodeid, default), nodeid))
+
+    shards = [(0.0, index) for index in range(shard_count)]
+    assignment = {}
+    for nodeid in ordered:
+        load, index = heapq.heappop(shards)
+        assignment[nodeid] = index
+        heapq.heappush(shards, (load + durations.get(nodeid, default), index))
+    return assignment
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--parallel",
+        action="store",
+        type=int,
+        default=0,
+        help="Run tests in N worker processes, sharded by historical duration"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    workers = config.getoption("parallel")
+    if workers and not hasattr(config, "workerinput"):
+        config.option.numprocesses = workers
+        config.option.dist = "loadgroup"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    if not hasattr(config, "workerinput") or config.getoption("dist") != "loadgroup":
+        return
+    shard_count = config.workerinput["workercount"]
+    assignment = assign_shards([item.nodeid for item in items], DurationStore().mean_durations(), shard_count)
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(f"{GROUP_PREFIX}{assignment[item.nodeid]}"))
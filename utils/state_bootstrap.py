@@ -0,0 +1,148 @@
+"""
+Builds UI test state over HTTP instead of through the browser.
+
+StateBootstrap logs in and fills the cart of automationexercise.com with
+plain requests through APIClient, then copies the resulting session cookies
+into a WebDriver. A test can then open CartPage (or any other page) directly,
+already logged in and with the products in its cart:
+
+    StateBootstrap().login(email, password).add_to_cart(1, 2).inject(driver)
+    cart_page.open()
+
+Cookies are set through the CDP Network domain, which needs no page of the
+site to be loaded. Drivers without CDP load the base URL first, since
+WebDriver only accepts cookies for the current domain.
+"""
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+import logging
+import re
+
+from selenium.common.exceptions import WebDriverException
+
+from config.config import settings
+from utils.api_client import APIClient
+from utils.latency import LatencyRecorder
+
+CSRF_INPUT = re.compile(r'name=["\']csrfmiddlewaretoken["\']\s+value=["\']([^"\']+)["\']')
+LOGGED_IN_MARKER = "Logged in as"
+
+
+class BootstrapError(Exception):
+    """Raised when the state of a test cannot be set up over HTTP"""
+
+
+class StateBootstrap:
+    """
+    Logs in and seeds the cart through HTTP, then hands the session to a browser
+    """
+
+    def __init__(self, base_url: Optional[str] = None, api_client: Optional[APIClient] = None):
+        self.base_url = (base_url or settings.BASE_URL).rstrip("/")
+        # A client of its own: the cookie jar is the session being built, and
+        # set-up traffic stays out of the session latency report
+        self.api_client = api_client or APIClient(self.base_url, cassette_mode="off", latency=LatencyRecorder())
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def session(self):
+        return self.api_client.session
+
+    def login(self, email: str, password: str) -> "StateBootstrap":
+        """
+        Submit the login form the way the browser would, CSRF token included
+        """
+        login_url = f"{self.base_url}/login"
+        form = self.api_client.get("/login", use_cache=False)
+        match = CSRF_INPUT.search(form.text)
+        token = match.group(1) if match else self.session.cookies.get("csrftoken")
+        if not token:
+            raise BootstrapError("No CSRF token found on the login page")
+        response = self.api_client.post(
+            "/login",
+            data={"csrfmiddlewaretoken": token, "email": email, "password": password},
+            # Django checks the referer of HTTPS form posts
+            headers={"Referer": login_url}
+        )
+        if LOGGED_IN_MARKER not in response.text:
+            raise BootstrapError(f"Login of {email} was rejected")
+        self.logger.info(f"Logged in {email} over HTTP")
+        return self
+
+    def add_to_cart(self, *product_ids: int, quantity: int = 1) -> "StateBootstrap":
+        """
+        Add products to the cart of the current session by product id
+        """
+        for product_id in product_ids:
+            # The site adds one item per call, like the Add to cart button. These GETs
+            # change server state, so they must never be answered from a cache
+            for _ in range(quantity):
+                self.api_client.get(f"/add_to_cart/{product_id}", use_cache=False)
+        return self
+
+    def cookies(self) -> List[Dict[str, Any]]:
+        """
+        Return the session cookies in the CDP Network.setCookies format
+        """
+        host = urlsplit(self.base_url).hostname
+        cookies = []
+        for cookie in self.session.cookies:
+            entry = {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain or host,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+                "httpOnly": cookie.has_nonstandard_attr("HttpOnly")
+            }
+            if cookie.expires:
+                entry["expires"] = cookie.expires
+            cookies.append(entry)
+        return cookies
+
+    def load_cookies(self, cookies: List[Dict[str, Any]]) -> "StateBootstrap":
+        """
+        Continue a session captured elsewhere, e.g. from a browser
+        """
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False), expires=int(cookie["expires"]) if "expires" in cookie else None
+            )
+        return self
+
+    def is_logged_in(self) -> bool:
+        """
+        Check over HTTP whether the server still accepts the session
+        """
+        return LOGGED_IN_MARKER in self.api_client.get("/", use_cache=False).text
+
+    def inject(self, driver) -> "StateBootstrap":
+        """
+        Copy the session cookies into the browser
+        """
+        inject_cookies(driver, self.cookies(), self.base_url)
+        return self
+
+
+def inject_cookies(driver, cookies: List[Dict[str, Any]], base_url: str):
+    """
+    Set cookies given in the CDP Network.setCookies format in the browser
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            return
+        except WebDriverException as e:
+            logging.getLogger(__name__).debug(f"Could not set cookies through CDP: {str(e)}")
+    if urlsplit(driver.current_url).hostname != urlsplit(base_url).hostname:
+        driver.get(base_url)
+    for cookie in cookies:
+        driver.add_cookie({
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+            **({"expiry": int(cookie["expires"])} if "expires" in cookie else {})
+        })
@@ -0,0 +1,240 @@
+"""
+Per-phase request timing for the API clients.
+
+Every request made through TimedHTTPAdapter gets a PhaseTimings object on
+response.timings, measured with the monotonic perf_counter_ns clock:
+
+    dns      resolving the host name (new connections only)
+    connect  TCP handshake (new connections only)
+    tls      TLS handshake (new HTTPS connections only)
+    send     writing the request line, headers and body
+    wait     from the request being sent to the response headers (server time)
+    body     reading the response body (not covered for stream=True)
+
+dns/connect/tls are zero when a pooled keep-alive connection is reused.
+The connection hooks find the timings of the request being sent through a
+thread-local, since requests gives no per-request handle to urllib3's
+connection objects. For the aiohttp client the same phases are filled in
+from a TraceConfig; aiohttp reports connection setup as one span, so the
+TLS handshake is counted under connect there.
+"""
+from contextlib import contextmanager
+from typing import Dict, Optional
+import socket
+import threading
+import time
+
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+PHASES = ("dns", "connect", "tls", "send", "wait", "body")
+
+_active = threading.local()
+
+
+class PhaseTimings:
+    """
+    Nanosecond durations of the phases of one request
+    """
+
+    def __init__(self):
+        self.ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.total_ns = 0
+        self.new_connection = False
+        self.headers_at: Optional[int] = None
+
+    def add(self, phase: str, ns: int):
+        self.ns[phase] += max(ns, 0)
+
+    def measured_ns(self) -> int:
+        return sum(self.ns.values())
+
+    def finish(self, start_ns: int, end_ns: int):
+        """
+        Close the body phase and the total once the response has been read
+        """
+        if self.headers_at is not None:
+            self.ns["body"] = max(end_ns - self.headers_at, 0)
+        self.total_ns = end_ns - start_ns
+
+    def __getattr__(self, phase: str) -> float:
+        # timings.dns, timings.wait, ... in seconds
+        if phase in PHASES:
+            return self.ns[phase] / 1e9
+        raise AttributeError(phase)
+
+    @property
+    def total(self) -> float:
+        return self.total_ns / 1e9
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Return every phase in seconds
+        """
+        return {phase: ns / 1e9 for phase, ns in self.ns.items()}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{phase}={ns / 1e6:.2f}ms" for phase, ns in self.ns.items())
+        return f"PhaseTimings({phases}, total={self.total_ns / 1e6:.2f}ms)"
+
+
+def current_timings() -> Optional[PhaseTimings]:
+    return getattr(_active, "timings", None)
+
+
+@contextmanager
+def _phase(name: str):
+    """
+    Time a block as one phase, excluding phases measured inside it
+    """
+    timings = current_timings()
+    if timings is None:
+        yield
+        return
+    start, before = time.perf_counter_ns(), timings.measured_ns()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter_ns() - start - (timings.measured_ns() - before))
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        timings = current_timings()
+        if timings is None:
+            return super()._new_conn()
+        host = self._dns_host
+        start = time.perf_counter_ns()
+        try:
+            addresses = socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except OSError:
+            # Let urllib3 resolve again and raise its usual NameResolutionError
+            return super()._new_conn()
+        resolved = time.perf_counter_ns()
+        timings.add("dns", resolved - start)
+        timings.new_connection = True
+        # Connect to the resolved addresses in order, as create_connection would: an
+        # address that refuses or times out only fails the request once all have been tried
+        candidates = list(dict.fromkeys(info[4][0] for info in addresses))
+        error = None
+        try:
+            for address in candidates:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    error = e
+            raise error
+        finally:
+            self._dns_host = host
+            timings.add("connect", time.perf_counter_ns() - resolved)
+
+    def request(self, *args, **kwargs):
+        with _phase("send"):
+            return super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        with _phase("wait"):
+            response = super().getresponse(*args, **kwargs)
+        timings = current_timings()
+        if timings is not None:
+            timings.headers_at = time.perf_counter_ns()
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self):
+        # Everything connect() spends beyond DNS and TCP is the TLS handshake
+        with _phase("tls"):
+            super().connect()
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose responses carry per-phase timings as response.timings
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool
+        }
+
+    def send(self, request, **kwargs):
+        timings = PhaseTimings()
+        _active.timings = timings
+        try:
+            response = super().send(request, **kwargs)
+        finally:
+            _active.timings = None
+        response.timings = timings
+        return response
+
+
+def timing_trace_config() -> aiohttp.TraceConfig:
+    """
+    Return a TraceConfig filling the PhaseTimings passed as trace_request_ctx
+    """
+    trace_config = aiohttp.TraceConfig()
+
+    def timings_of(context) -> Optional[PhaseTimings]:
+        timings = context.trace_request_ctx
+        return timings if isinstance(timings, PhaseTimings) else None
+
+    def mark(name):
+        async def handler(session, context, params):
+            setattr(context, name, time.perf_counter_ns())
+        return handler
+
+    async def on_dns_end(session, context, params):
+        timings = timings_of(context)
+        if timings is not None:
+            timings.add("dns", time.perf_counter_ns() - context.dns_start)
+
+    async def on_connection_end(session, context, params):
+        timings = timings_of(context)
+        context.ready_at = time.perf_counter_ns()
+        if timings is not None:
+            timings.new_connection = True
+            timings.add("connect", context.ready_at - context.connect_start - timings.ns["dns"])
+
+    async def on_request_sent(session, context, params):
+        context.sent_at = time.perf_counter_ns()
+
+    async def on_request_end(session, context, params):
+        timings = timings_of(context)
+        if timings is None:
+            return
+        now = time.perf_counter_ns()
+        sent_at = getattr(context, "sent_at", now)
+        timings.add("send", sent_at - getattr(context, "ready_at", context.request_start))
+        timings.add("wait", now - sent_at)
+        timings.headers_at = now
+
+    trace_config.on_request_start.append(mark("request_start"))
+    trace_config.on_dns_resolvehost_start.append(mark("dns_start"))
+    trace_config.on_dns_resolvehost_end.append(on_dns_end)
+    trace_config.on_connection_create_start.append(mark("connect_start"))
+    trace_config.on_connection_create_end.append(on_connection_end)
+    trace_config.on_connection_reuseconn.append(mark("ready_at"))
+    trace_config.on_request_headers_sent.append(on_request_sent)
+    trace_config.on_request_chunk_sent.append(on_request_sent)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
@@ -0,0 +1,63 @@
+"""
+Compiled, cached response validators.
+
+Building a pydantic TypeAdapter or a jsonschema validator is far more
+expensive than running it, so both are built once per model/schema and kept
+in module-level registries. Models validate straight from the raw response
+bytes, which skips the intermediate dict entirely.
+"""
+from typing import Any, Dict, Optional, Tuple
+import json
+import threading
+
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+from pydantic import TypeAdapter
+
+_type_adapters: Dict[Any, TypeAdapter] = {}
+# Keyed by id(schema); the schema itself is kept to detect id reuse
+_schema_validators: Dict[int, Tuple[dict, Validator]] = {}
+_lock = threading.Lock()
+
+
+def get_type_adapter(model: Any) -> TypeAdapter:
+    """Return the cached TypeAdapter for a model or type such as List[Post]"""
+    adapter = _type_adapters.get(model)
+    if adapter is None:
+        with _lock:
+            adapter = _type_adapters.get(model)
+            if adapter is None:
+                adapter = _type_adapters[model] = TypeAdapter(model)
+    return adapter
+
+
+def get_schema_validator(schema: dict) -> Validator:
+    """Return the cached, pre-checked jsonschema validator for a schema"""
+    cached = _schema_validators.get(id(schema))
+    if cached is None or cached[0] is not schema:
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        cached = (schema, cls(schema, format_checker=cls.FORMAT_CHECKER))
+        with _lock:
+            _schema_validators[id(schema)] = cached
+    return cached[1]
+
+
+def validate_content(content: bytes, response_model: Any = None, json_schema: Optional[dict] = None) -> Any:
+    """
+    Validate a JSON body against a schema and/or model.
+
+    Returns the validated model instance when response_model is given,
+    otherwise the parsed JSON. Raises jsonschema.ValidationError or
+    pydantic.ValidationError on invalid content.
+    """
+    data = None
+    if json_schema is not None:
+        data = json.loads(content)
+        get_schema_validator(json_schema).validate(data)
+    if response_model is None:
+        return data
+    adapter = get_type_adapter(response_model)
+    if data is not None:
+        return adapter.validate_python(data)
+    return adapter.validate_json(content)